@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+10X Genomics Combined MCP Server
+
+Exposes the scraper, validator and metadata enricher as tools on a single
+FastMCP process that imports the skills and calls them in-process. Compared
+to the per-skill servers there is no subprocess boundary at all: each tool
+call is a function call on a worker thread, so the heavy imports (selenium,
+pandas, openpyxl) are paid once at server startup and per-call overhead
+drops to thread-dispatch cost.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+from typing import Optional
+from mcp.server.fastmcp import FastMCP
+
+# Base paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# The skill directories are plain folders rather than packages, so put
+# them on sys.path and import each skill's entry function directly.
+for _skill in ("scraper", "validator", "metadata_enricher"):
+    sys.path.insert(0, str(PROJECT_ROOT / "skills" / _skill))
+
+from scraper import run_scrape
+from validator import run_validation
+from metadata_enricher import run_enrichment
+
+# Initialize MCP server
+mcp = FastMCP("10x-genomics")
+
+DEFAULT_OUTPUT_DIR = str(PROJECT_ROOT / "output")
+
+# Cap on concurrently running browser-backed jobs, tunable per host
+# (see the pipeline server for rationale).
+_job_semaphore = asyncio.Semaphore(
+    int(os.environ.get("MCP_MAX_CONCURRENT_SCRAPES", "2"))
+)
+
+
+async def _run_job(func, *args, **kwargs):
+    """Run a skill entry function on a worker thread, bounded by the cap."""
+    async with _job_semaphore:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+
+@mcp.tool()
+async def scrape_datasets(
+    url: str,
+    name: str,
+    base_output_dir: Optional[str] = None
+) -> dict:
+    """
+    Scrape 10X Genomics datasets from a given URL.
+
+    Args:
+        url: Source URL to scrape (e.g., filtered datasets page from 10xgenomics.com)
+        name: Human-readable identifier for this scraping run (e.g., "10XGenomics-VisiumHD-Human")
+        base_output_dir: Base output directory (default: PROJECT_ROOT/output)
+
+    Returns:
+        dict with keys:
+            - status: "success" or "failed"
+            - datasets_count: Number of datasets scraped
+            - output_files: Paths to generated files
+            - message: Status message
+    """
+    if base_output_dir is None:
+        base_output_dir = DEFAULT_OUTPUT_DIR
+
+    try:
+        result = await _run_job(run_scrape, url, name, base_output_dir)
+    except Exception as e:
+        return {
+            "status": "failed",
+            "datasets_count": 0,
+            "output_files": {},
+            "message": f"Scraping failed: {e}"
+        }
+
+    return {
+        "status": "success",
+        "datasets_count": result["datasets_count"],
+        "output_files": {
+            "json": result["json_path"],
+            "excel": result["excel_path"]
+        },
+        "message": f"Successfully scraped {result['datasets_count']} datasets"
+    }
+
+
+@mcp.tool()
+async def validate_datasets(
+    name: str,
+    base_output_dir: Optional[str] = None,
+    skip_file_check: bool = False,
+    skip_url_check: bool = False
+) -> dict:
+    """
+    Validate scraped dataset files and URLs.
+
+    Args:
+        name: Run identifier for the scraping run to validate
+        base_output_dir: Base output directory (default: PROJECT_ROOT/output)
+        skip_file_check: Skip the JSON/Excel consistency check
+        skip_url_check: Skip the URL content validation
+
+    Returns:
+        dict with keys:
+            - status: "success", "warnings", or "failed"
+            - results: Full validation results including per-check details
+            - message: Status message
+    """
+    if base_output_dir is None:
+        base_output_dir = DEFAULT_OUTPUT_DIR
+
+    try:
+        results = await _run_job(
+            run_validation, name, base_output_dir,
+            skip_file_check=skip_file_check, skip_url_check=skip_url_check
+        )
+    except Exception as e:
+        return {
+            "status": "failed",
+            "results": {},
+            "message": f"Validation failed: {e}"
+        }
+
+    exit_code = results.get("exit_code", 0)
+    return {
+        "status": "success" if exit_code == 0 else "warnings" if exit_code == 1 else "failed",
+        "results": results,
+        "message": (
+            "Validation passed" if exit_code == 0
+            else "Validation completed with failures - see results"
+        )
+    }
+
+
+@mcp.tool()
+async def enrich_metadata(
+    name: str,
+    base_output_dir: Optional[str] = None
+) -> dict:
+    """
+    Enrich dataset metadata by extracting additional information from detail pages.
+
+    Args:
+        name: Run identifier for the scraping run to enrich
+        base_output_dir: Base output directory (default: PROJECT_ROOT/output)
+
+    Returns:
+        dict with keys:
+            - status: "success", "partial", or "failed"
+            - stats: Enrichment statistics (totals and field completion)
+            - message: Status message
+    """
+    if base_output_dir is None:
+        base_output_dir = DEFAULT_OUTPUT_DIR
+
+    try:
+        stats = await _run_job(run_enrichment, name, base_output_dir)
+    except Exception as e:
+        return {
+            "status": "failed",
+            "stats": {},
+            "message": f"Enrichment failed: {e}"
+        }
+
+    exit_code = stats.get("exit_code", 0)
+    return {
+        "status": "success" if exit_code == 0 else "partial" if exit_code == 1 else "failed",
+        "stats": stats,
+        "message": (
+            f"Successfully enriched {stats.get('total_datasets', 0)} datasets"
+            if exit_code == 0
+            else "Enrichment completed with failures - see stats"
+        )
+    }
+
+
+if __name__ == "__main__":
+    # Run the MCP server
+    mcp.run()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+10X Genomics Pipeline MCP Server
+
+Exposes a coordinated scrape -> validate + enrich pipeline as a single MCP
+tool. After scraping completes, validation and enrichment run concurrently:
+both stages only read the scraper's output, so overlapping them cuts the
+end-to-end wall time from T_scrape + T_validate + T_enrich to roughly
+T_scrape + max(T_validate, T_enrich).
+"""
+
+import asyncio
+import json
+import os
+import sys
+import subprocess
+import threading
+from pathlib import Path
+from typing import Optional
+from mcp.server.fastmcp import FastMCP
+
+# orjson parses JSON several times faster than the stdlib and accepts raw
+# bytes directly; fall back to stdlib json when it is not installed.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Initialize MCP server
+mcp = FastMCP("10x-genomics-pipeline")
+
+# Base paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+SKILL_SCRIPTS = {
+    "scraper": PROJECT_ROOT / "skills" / "scraper" / "scraper.py",
+    "validator": PROJECT_ROOT / "skills" / "validator" / "validator.py",
+    "enricher": PROJECT_ROOT / "skills" / "metadata_enricher" / "metadata_enricher.py",
+}
+DEFAULT_OUTPUT_DIR = str(PROJECT_ROOT / "output")
+
+# One persistent worker per skill (lazily started on first use), sharing the
+# --serve protocol the individual MCP servers use. Each worker keeps its
+# heavy imports alive across pipeline runs.
+_workers = {}
+_worker_locks = {skill: threading.Lock() for skill in SKILL_SCRIPTS}
+
+# Cap on concurrently running pipeline stages. Each stage drives its own
+# headless browser; running too many at once trades latency for memory,
+# and an eager client issuing several runs back-to-back could otherwise
+# OOM the host. Small values (2-4) capture most of the throughput
+# benefit; operators can tune per host via the environment.
+_stage_semaphore = asyncio.Semaphore(
+    int(os.environ.get("MCP_MAX_CONCURRENT_SCRAPES", "2"))
+)
+
+
+def _start_worker(skill):
+    """Start (or restart) the persistent worker process for a skill."""
+    script = SKILL_SCRIPTS[skill]
+    worker = subprocess.Popen(
+        [sys.executable, str(script), "--serve"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+        cwd=str(script.parent)
+    )
+    _workers[skill] = worker
+    return worker
+
+
+def _call_worker(skill: str, cmd: str, args: dict) -> dict:
+    """
+    Dispatch a job to a skill's persistent worker and return its response.
+
+    Respawns the worker once if the pipe is broken (e.g. the worker crashed
+    during a previous job).
+    """
+    with _worker_locks[skill]:
+        for attempt in range(2):
+            worker = _workers.get(skill)
+            if worker is None or worker.poll() is not None:
+                worker = _start_worker(skill)
+
+            try:
+                worker.stdin.write(json.dumps({"cmd": cmd, "args": args}) + "\n")
+                worker.stdin.flush()
+                line = worker.stdout.readline()
+                if not line:
+                    raise BrokenPipeError("Worker closed its stdout")
+                return _json_loads(line)
+            except (BrokenPipeError, OSError, ValueError) as e:
+                # Worker died mid-job - drop it and retry once with a fresh process
+                if worker.poll() is None:
+                    worker.kill()
+                _workers[skill] = None
+                if attempt == 1:
+                    return {"status": "error", "message": f"Worker failed: {e}"}
+
+
+async def _run_stage(skill: str, cmd: str, args: dict) -> dict:
+    """Run one pipeline stage in a thread, bounded by the stage semaphore."""
+    async with _stage_semaphore:
+        return await asyncio.to_thread(_call_worker, skill, cmd, args)
+
+
+@mcp.tool()
+async def run_pipeline(
+    url: str,
+    name: str,
+    base_output_dir: Optional[str] = None,
+    skip_validation: bool = False,
+    skip_enrichment: bool = False
+) -> dict:
+    """
+    Run the full scrape -> validate + enrich pipeline for a dataset run.
+
+    The scraper runs first (both downstream stages read its output), then
+    validation and enrichment run concurrently since they are independent
+    of each other.
+
+    Args:
+        url: Source URL to scrape
+        name: Human-readable identifier for this run (e.g., "10XGenomics-VisiumHD-Human")
+        base_output_dir: Base output directory (default: PROJECT_ROOT/output)
+        skip_validation: Skip the validation stage
+        skip_enrichment: Skip the enrichment stage
+
+    Returns:
+        dict with keys:
+            - status: "success", "partial", or "failed"
+            - stages: Per-stage status and results
+            - message: Status message
+
+    Example:
+        result = run_pipeline(
+            url="https://www.10xgenomics.com/datasets?query=Visium%20HD",
+            name="10XGenomics-VisiumHD-Human"
+        )
+    """
+    if base_output_dir is None:
+        base_output_dir = DEFAULT_OUTPUT_DIR
+
+    stages = {}
+
+    # Stage 1: scrape (downstream stages depend on its output files)
+    scrape_response = await _run_stage("scraper", "scrape", {
+        "url": url,
+        "name": name,
+        "base_output_dir": base_output_dir
+    })
+    scrape_ok = scrape_response.get("status") == "ok"
+    stages["scraper"] = {
+        "status": "success" if scrape_ok else "failed",
+        "result": scrape_response.get("result"),
+        "message": scrape_response.get("message", "")
+    }
+
+    if not scrape_ok:
+        return {
+            "status": "failed",
+            "stages": stages,
+            "message": f"Scraping failed: {scrape_response.get('message', 'unknown error')}"
+        }
+
+    # Stage 2: validate and enrich concurrently - both read only the
+    # scraper output, so neither blocks the other
+    tasks = {}
+    async with asyncio.TaskGroup() as tg:
+        if not skip_validation:
+            tasks["validator"] = tg.create_task(_run_stage("validator", "validate", {
+                "name": name,
+                "base_output_dir": base_output_dir
+            }))
+        if not skip_enrichment:
+            tasks["enricher"] = tg.create_task(_run_stage("enricher", "enrich", {
+                "name": name,
+                "base_output_dir": base_output_dir
+            }))
+
+    overall_ok = True
+    for stage_name, task in tasks.items():
+        stage_response = task.result()
+        stage_ok = stage_response.get("status") == "ok"
+        exit_code = stage_response.get("result", {}).get("exit_code", 0) if stage_ok else 2
+        if exit_code != 0:
+            overall_ok = False
+        stages[stage_name] = {
+            "status": "success" if exit_code == 0 else "warnings" if exit_code == 1 else "failed",
+            "result": stage_response.get("result"),
+            "message": stage_response.get("message", "")
+        }
+
+    return {
+        "status": "success" if overall_ok else "partial",
+        "stages": stages,
+        "message": (
+            "Pipeline completed successfully" if overall_ok
+            else "Pipeline completed with stage failures - see per-stage results"
+        )
+    }
+
+
+if __name__ == "__main__":
+    # Run the MCP server
+    mcp.run()
@@ -6,18 +6,156 @@ Exposes the 10X Genomics dataset scraper as MCP tools for Claude Code.
 """
 
 import json
+import mmap
+import os
 import sys
 import subprocess
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from mcp.server.fastmcp import FastMCP
 
+# orjson parses JSON several times faster than the stdlib and accepts raw
+# bytes directly; fall back to stdlib json when it is not installed.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Initialize MCP server
 mcp = FastMCP("10x-genomics-scraper")
 
 # Base paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 SCRAPER_SCRIPT = PROJECT_ROOT / "skills" / "scraper" / "scraper.py"
+DEFAULT_OUTPUT_DIR = str(PROJECT_ROOT / "output")
+
+
+@lru_cache(maxsize=64)
+def _run_dirs(base_output_dir, name):
+    """
+    Cache the per-run output/input directory Paths.
+
+    Path construction walks the flavour logic per component in CPython,
+    and every tool call rebuilds the same directories for the same run.
+    """
+    run_dir = Path(base_output_dir) / name
+    return run_dir / "output", run_dir / "input"
+
+
+# Files smaller than this are read in one os.read; above it we mmap so the
+# page cache backs the read and json parses the raw bytes directly, skipping
+# the full str decode + copy that read_text() would pay.
+_MMAP_THRESHOLD = 16 * 1024
+
+
+def _load_json_mmap(path):
+    """Parse a JSON file from bytes without an intermediate str copy."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size <= _MMAP_THRESHOLD:
+            return _json_loads(os.read(fd, size))
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        try:
+            return _json_loads(mm[:])
+        finally:
+            mm.close()
+    finally:
+        os.close(fd)
+
+
+
+def _safe_stat(path):
+    """Return the os.stat_result for path, or None if it does not exist."""
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+# Parsed-JSON cache keyed by (path, mtime_ns, size). Tool calls frequently
+# re-read the same run back-to-back; caching the deserialized object
+# amortizes the parse cost across those reads. Entries go stale naturally
+# because the key embeds the file's mtime and size.
+_JSON_CACHE = OrderedDict()
+_JSON_CACHE_MAX = 8
+
+
+def _cached_json(path, st=None):
+    """
+    Return parsed JSON for path, reusing a cached parse while fresh.
+
+    Callers that already hold an os.stat_result for the file can pass it
+    as st to avoid a second stat syscall.
+    """
+    if st is None:
+        st = os.stat(path)
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    if key in _JSON_CACHE:
+        _JSON_CACHE.move_to_end(key)
+        return _JSON_CACHE[key]
+    # Drop any stale entry for the same file before re-parsing
+    for stale in [k for k in _JSON_CACHE if k[0] == key[0]]:
+        del _JSON_CACHE[stale]
+    data = _load_json_mmap(path)
+    _JSON_CACHE[key] = data
+    while len(_JSON_CACHE) > _JSON_CACHE_MAX:
+        _JSON_CACHE.popitem(last=False)
+    return data
+
+
+# Persistent worker process (lazily started on first tool call).
+# Keeping one scraper process alive avoids paying interpreter startup and
+# heavy imports (selenium, pandas, openpyxl) on every MCP tool call.
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def _start_worker():
+    """Start (or restart) the persistent scraper worker process."""
+    global _worker
+    _worker = subprocess.Popen(
+        [sys.executable, str(SCRAPER_SCRIPT), "--serve"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+        cwd=str(SCRAPER_SCRIPT.parent)
+    )
+    return _worker
+
+
+def _call_worker(cmd: str, args: dict) -> dict:
+    """
+    Dispatch a job to the persistent worker and return its response.
+
+    Respawns the worker once if the pipe is broken (e.g. the worker crashed
+    during a previous job).
+    """
+    global _worker
+    with _worker_lock:
+        for attempt in range(2):
+            worker = _worker
+            if worker is None or worker.poll() is not None:
+                worker = _start_worker()
+
+            try:
+                worker.stdin.write(json.dumps({"cmd": cmd, "args": args}) + "\n")
+                worker.stdin.flush()
+                line = worker.stdout.readline()
+                if not line:
+                    raise BrokenPipeError("Worker closed its stdout")
+                return _json_loads(line)
+            except (BrokenPipeError, OSError, ValueError) as e:
+                # Worker died mid-job - drop it and retry once with a fresh process
+                if worker.poll() is None:
+                    worker.kill()
+                _worker = None
+                if attempt == 1:
+                    return {"status": "error", "message": f"Worker failed: {e}"}
 
 
 @mcp.tool()
@@ -54,43 +192,35 @@ def scrape_datasets(
         )
     """
     if base_output_dir is None:
-        base_output_dir = str(PROJECT_ROOT / "output")
-
-    # Prepare command
-    cmd = [
-        sys.executable,
-        str(SCRAPER_SCRIPT),
-        "--url", url,
-        "--name", name,
-        "--base-output-dir", base_output_dir
-    ]
-
-    # Execute scraper
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        cwd=str(SCRAPER_SCRIPT.parent)
-    )
+        base_output_dir = DEFAULT_OUTPUT_DIR
+
+    # Dispatch to the persistent worker process
+    worker_response = _call_worker("scrape", {
+        "url": url,
+        "name": name,
+        "base_output_dir": base_output_dir
+    })
+
+    succeeded = worker_response.get("status") == "ok"
 
     # Parse results
-    output_dir = Path(base_output_dir) / name / "output"
+    output_dir, _ = _run_dirs(base_output_dir, name)
     json_file = output_dir / f"Data-{name}.json"
     excel_file = output_dir / f"Data-{name}.xlsx"
 
     response = {
-        "status": "success" if result.returncode == 0 else "failed",
-        "exit_code": result.returncode,
+        "status": "success" if succeeded else "failed",
+        "exit_code": 0 if succeeded else 1,
         "datasets_count": 0,
         "output_files": {},
         "message": "",
-        "stderr": result.stderr
+        "stderr": worker_response.get("message", "")
     }
 
     # Load scraped data if successful
-    if result.returncode == 0 and json_file.exists():
+    if succeeded and json_file.exists():
         try:
-            data = json.loads(json_file.read_text())
+            data = _cached_json(json_file)
             response["datasets_count"] = len(data)
             response["output_files"] = {
                 "json": str(json_file),
@@ -101,7 +231,7 @@ def scrape_datasets(
             response["status"] = "failed"
             response["message"] = f"Failed to read output: {str(e)}"
     else:
-        response["message"] = f"Scraping failed with exit code {result.returncode}"
+        response["message"] = f"Scraping failed: {worker_response.get('message', 'unknown error')}"
 
     return response
 
@@ -130,9 +260,9 @@ def get_scraper_output(
         result = get_scraper_output(name="10XGenomics-VisiumHD-Human")
     """
     if base_output_dir is None:
-        base_output_dir = str(PROJECT_ROOT / "output")
+        base_output_dir = DEFAULT_OUTPUT_DIR
 
-    output_dir = Path(base_output_dir) / name / "output"
+    output_dir, _ = _run_dirs(base_output_dir, name)
     json_file = output_dir / f"Data-{name}.json"
     excel_file = output_dir / f"Data-{name}.xlsx"
 
@@ -144,7 +274,7 @@ def get_scraper_output(
         }
 
     try:
-        data = json.loads(json_file.read_text())
+        data = _cached_json(json_file)
 
         response = {
             "status": "success",
@@ -157,10 +287,13 @@ def get_scraper_output(
         if format == "json":
             response["data"] = data
         elif format == "summary":
-            # Create summary statistics
-            species = set(d.get("species", "Unknown") for d in data)
-            products = set(d.get("product", "Unknown") for d in data)
-            sample_types = set(d.get("sample_type", "Unknown") for d in data)
+            # Create summary statistics in one sweep over the data
+            # instead of one full traversal per field
+            species, products, sample_types = set(), set(), set()
+            for d in data:
+                species.add(d.get("species", "Unknown"))
+                products.add(d.get("product", "Unknown"))
+                sample_types.add(d.get("sample_type", "Unknown"))
 
             response["data"] = {
                 "total_datasets": len(data),
@@ -200,24 +333,38 @@ def check_scraper_status(
         status = check_scraper_status(name="10XGenomics-VisiumHD-Human")
     """
     if base_output_dir is None:
-        base_output_dir = str(PROJECT_ROOT / "output")
+        base_output_dir = DEFAULT_OUTPUT_DIR
 
-    output_dir = Path(base_output_dir) / name / "output"
-    input_dir = Path(base_output_dir) / name / "input"
+    output_dir, input_dir = _run_dirs(base_output_dir, name)
 
     json_file = output_dir / f"Data-{name}.json"
     excel_file = output_dir / f"Data-{name}.xlsx"
     url_file = input_dir / f"URL-{name}.txt"
-    html_file = input_dir / f"RawData-{name}.html"
+    # The scraper writes the dump gzip-compressed; accept the legacy plain
+    # .html from older runs too
+    html_file = input_dir / f"RawData-{name}.html.gz"
+    legacy_html_file = input_dir / f"RawData-{name}.html"
+
+    # One directory listing per dir replaces a stat() call per file
+    def _dir_names(directory):
+        try:
+            return {entry.name for entry in os.scandir(directory)}
+        except FileNotFoundError:
+            return set()
+
+    output_names = _dir_names(output_dir)
+    input_names = _dir_names(input_dir)
 
     output_files = {
-        "json": {"path": str(json_file), "exists": json_file.exists()},
-        "excel": {"path": str(excel_file), "exists": excel_file.exists()},
-        "url": {"path": str(url_file), "exists": url_file.exists()},
-        "html": {"path": str(html_file), "exists": html_file.exists()}
+        "json": {"path": str(json_file), "exists": json_file.name in output_names},
+        "excel": {"path": str(excel_file), "exists": excel_file.name in output_names},
+        "url": {"path": str(url_file), "exists": url_file.name in input_names},
+        "html": {"path": str(html_file),
+                 "exists": (html_file.name in input_names
+                            or legacy_html_file.name in input_names)}
     }
 
-    completed = json_file.exists() and excel_file.exists()
+    completed = json_file.name in output_names and excel_file.name in output_names
 
     response = {
         "completed": completed,
@@ -226,8 +373,13 @@ def check_scraper_status(
 
     if completed:
         try:
-            data = json.loads(json_file.read_text())
-            response["datasets_count"] = len(data)
+            # The scraper writes a count sidecar at save time; prefer it
+            # over parsing the full dataset JSON
+            meta_file = output_dir / f"Data-{name}.meta.json"
+            if meta_file.name in output_names:
+                response["datasets_count"] = _cached_json(meta_file).get("count")
+            else:
+                response["datasets_count"] = len(_cached_json(json_file))
         except Exception:
             response["datasets_count"] = None
 
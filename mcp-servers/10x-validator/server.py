@@ -6,18 +6,190 @@ Exposes the data validator as MCP tools for Claude Code.
 """
 
 import json
+import mmap
+import os
 import sys
 import subprocess
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from mcp.server.fastmcp import FastMCP
 
+# orjson parses JSON several times faster than the stdlib and accepts raw
+# bytes directly; fall back to stdlib json when it is not installed.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Initialize MCP server
 mcp = FastMCP("10x-genomics-validator")
 
 # Base paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 VALIDATOR_SCRIPT = PROJECT_ROOT / "skills" / "validator" / "validator.py"
+DEFAULT_OUTPUT_DIR = str(PROJECT_ROOT / "output")
+
+
+@lru_cache(maxsize=64)
+def _run_reports_dir(base_output_dir, name):
+    """Cache the per-run reports directory Path across tool calls."""
+    return Path(base_output_dir) / name / "reports"
+
+
+# Files smaller than this are read in one os.read; above it we mmap so the
+# page cache backs the read and json parses the raw bytes directly, skipping
+# the full str decode + copy that read_text() would pay.
+_MMAP_THRESHOLD = 16 * 1024
+
+
+def _load_json_mmap(path):
+    """Parse a JSON file from bytes without an intermediate str copy."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size <= _MMAP_THRESHOLD:
+            return _json_loads(os.read(fd, size))
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        try:
+            return _json_loads(mm[:])
+        finally:
+            mm.close()
+    finally:
+        os.close(fd)
+
+
+
+def _safe_stat(path):
+    """Return the os.stat_result for path, or None if it does not exist."""
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+# Parsed-JSON cache keyed by (path, mtime_ns, size). Tool calls frequently
+# re-read the same run back-to-back; caching the deserialized object
+# amortizes the parse cost across those reads. Entries go stale naturally
+# because the key embeds the file's mtime and size.
+_JSON_CACHE = OrderedDict()
+_JSON_CACHE_MAX = 8
+
+
+def _cached_json(path, st=None):
+    """
+    Return parsed JSON for path, reusing a cached parse while fresh.
+
+    Callers that already hold an os.stat_result for the file can pass it
+    as st to avoid a second stat syscall.
+    """
+    if st is None:
+        st = os.stat(path)
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    if key in _JSON_CACHE:
+        _JSON_CACHE.move_to_end(key)
+        return _JSON_CACHE[key]
+    # Drop any stale entry for the same file before re-parsing
+    for stale in [k for k in _JSON_CACHE if k[0] == key[0]]:
+        del _JSON_CACHE[stale]
+    data = _load_json_mmap(path)
+    _JSON_CACHE[key] = data
+    while len(_JSON_CACHE) > _JSON_CACHE_MAX:
+        _JSON_CACHE.popitem(last=False)
+    return data
+
+
+# Persistent worker process (lazily started on first tool call).
+# Keeping one validator process alive avoids paying interpreter startup and
+# heavy imports (selenium, pandas, deepdiff) on every MCP tool call.
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def _start_worker():
+    """Start (or restart) the persistent validator worker process."""
+    global _worker
+    _worker = subprocess.Popen(
+        [sys.executable, str(VALIDATOR_SCRIPT), "--serve"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+        cwd=str(VALIDATOR_SCRIPT.parent)
+    )
+    return _worker
+
+
+def _call_worker(cmd: str, args: dict) -> dict:
+    """
+    Dispatch a job to the persistent worker and return its response.
+
+    Respawns the worker once if the pipe is broken (e.g. the worker crashed
+    during a previous job).
+    """
+    global _worker
+    with _worker_lock:
+        for attempt in range(2):
+            worker = _worker
+            if worker is None or worker.poll() is not None:
+                worker = _start_worker()
+
+            try:
+                worker.stdin.write(json.dumps({"cmd": cmd, "args": args}) + "\n")
+                worker.stdin.flush()
+                line = worker.stdout.readline()
+                if not line:
+                    raise BrokenPipeError("Worker closed its stdout")
+                return _json_loads(line)
+            except (BrokenPipeError, OSError, ValueError) as e:
+                # Worker died mid-job - drop it and retry once with a fresh process
+                if worker.poll() is None:
+                    worker.kill()
+                _worker = None
+                if attempt == 1:
+                    return {"status": "error", "message": f"Worker failed: {e}"}
+
+
+
+def _latest_report(reports_dir, suffix):
+    """
+    Return the newest validation report with the given suffix, or None.
+
+    The validator writes a tiny index.json after each run naming the
+    latest reports; reading it answers the lookup in one small read.
+    When the index is missing or older than the directory (reports added
+    behind its back), fall back to a scandir pass - report filenames
+    embed a sortable timestamp, so one max() pass over the directory
+    replaces sorting the full listing just to take [0].
+    """
+    dir_st = _safe_stat(reports_dir)
+    if dir_st is None:
+        return None
+
+    index_file = reports_dir / "index.json"
+    index_st = _safe_stat(index_file)
+    if index_st is not None and index_st.st_mtime_ns >= dir_st.st_mtime_ns:
+        try:
+            index = _cached_json(index_file, index_st)
+            latest = index.get("latest_json" if suffix == ".json" else "latest_html")
+            if latest:
+                return reports_dir / latest
+        except (OSError, ValueError):
+            pass  # Unreadable index - fall through to the scan
+
+    latest = None
+    try:
+        with os.scandir(reports_dir) as entries:
+            for entry in entries:
+                if (entry.name.startswith("validation_report_")
+                        and entry.name.endswith(suffix)
+                        and (latest is None or entry.name > latest)):
+                    latest = entry.name
+    except FileNotFoundError:
+        return None
+    return reports_dir / latest if latest else None
 
 
 @mcp.tool()
@@ -51,47 +223,41 @@ def validate_datasets(
         result = validate_datasets(name="10XGenomics-VisiumHD-Human")
     """
     if base_output_dir is None:
-        base_output_dir = str(PROJECT_ROOT / "output")
-
-    # Prepare command
-    cmd = [
-        sys.executable,
-        str(VALIDATOR_SCRIPT),
-        "--name", name,
-        "--base-output-dir", base_output_dir
-    ]
-
-    # Execute validator
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        cwd=str(VALIDATOR_SCRIPT.parent)
-    )
+        base_output_dir = DEFAULT_OUTPUT_DIR
+
+    # Dispatch to the persistent worker process
+    worker_response = _call_worker("validate", {
+        "name": name,
+        "base_output_dir": base_output_dir
+    })
+
+    if worker_response.get("status") == "ok":
+        exit_code = worker_response.get("result", {}).get("exit_code", 0)
+    else:
+        exit_code = 2
 
     # Parse results
-    reports_dir = Path(base_output_dir) / name / "reports"
+    reports_dir = _run_reports_dir(base_output_dir, name)
 
     response = {
-        "status": "success" if result.returncode == 0 else "warnings" if result.returncode == 1 else "failed",
-        "exit_code": result.returncode,
+        "status": "success" if exit_code == 0 else "warnings" if exit_code == 1 else "failed",
+        "exit_code": exit_code,
         "validation_summary": {},
         "report_files": {},
         "message": "",
-        "stderr": result.stderr
+        "stderr": worker_response.get("message", "")
     }
 
     # Find the latest validation report
     if reports_dir.exists():
-        json_reports = sorted(reports_dir.glob("validation_report_*.json"), reverse=True)
-        html_reports = sorted(reports_dir.glob("validation_report_*.html"), reverse=True)
+        report_file = _latest_report(reports_dir, ".json")
+        html_report = _latest_report(reports_dir, ".html")
 
-        if json_reports:
-            report_file = json_reports[0]
+        if report_file:
             response["report_files"]["json"] = str(report_file)
 
             try:
-                report_data = json.loads(report_file.read_text())
+                report_data = _cached_json(report_file)
                 response["validation_summary"] = {
                     "total_datasets": report_data.get("total_datasets", 0),
                     "file_consistency": report_data.get("file_consistency", {}),
@@ -104,9 +270,9 @@ def validate_datasets(
                 }
 
                 # Set appropriate message
-                if result.returncode == 0:
+                if exit_code == 0:
                     response["message"] = f"All {report_data.get('total_datasets', 0)} datasets validated successfully"
-                elif result.returncode == 1:
+                elif exit_code == 1:
                     warnings = report_data.get("url_validation", {}).get("warnings", 0)
                     mismatched = report_data.get("url_validation", {}).get("mismatched", 0)
                     response["message"] = f"Validation completed with {warnings} warnings and {mismatched} mismatches"
@@ -116,8 +282,8 @@ def validate_datasets(
             except Exception as e:
                 response["message"] = f"Failed to read validation report: {str(e)}"
 
-        if html_reports:
-            response["report_files"]["html"] = str(html_reports[0])
+        if html_report:
+            response["report_files"]["html"] = str(html_report)
     else:
         response["message"] = f"No validation reports found for run '{name}'"
 
@@ -148,9 +314,9 @@ def get_validation_report(
         result = get_validation_report(name="10XGenomics-VisiumHD-Human", format="issues_only")
     """
     if base_output_dir is None:
-        base_output_dir = str(PROJECT_ROOT / "output")
+        base_output_dir = DEFAULT_OUTPUT_DIR
 
-    reports_dir = Path(base_output_dir) / name / "reports"
+    reports_dir = _run_reports_dir(base_output_dir, name)
 
     if not reports_dir.exists():
         return {
@@ -160,25 +326,23 @@ def get_validation_report(
         }
 
     # Find latest report
-    json_reports = sorted(reports_dir.glob("validation_report_*.json"), reverse=True)
-    html_reports = sorted(reports_dir.glob("validation_report_*.html"), reverse=True)
+    report_file = _latest_report(reports_dir, ".json")
+    html_report = _latest_report(reports_dir, ".html")
 
-    if not json_reports:
+    if not report_file:
         return {
             "status": "not_found",
             "message": f"No JSON validation reports found in {reports_dir}"
         }
 
-    report_file = json_reports[0]
-
     try:
-        report_data = json.loads(report_file.read_text())
+        report_data = _cached_json(report_file)
 
         response = {
             "status": "success",
             "report_files": {
                 "json": str(report_file),
-                "html": str(html_reports[0]) if html_reports else None
+                "html": str(html_report) if html_report else None
             }
         }
 
@@ -221,7 +385,8 @@ def get_validation_report(
 @mcp.tool()
 def check_validation_status(
     name: str,
-    base_output_dir: Optional[str] = None
+    base_output_dir: Optional[str] = None,
+    include_all: bool = False
 ) -> dict:
     """
     Check if validation has been completed for a given run.
@@ -229,6 +394,8 @@ def check_validation_status(
     Args:
         name: Run identifier to check
         base_output_dir: Base output directory (default: PROJECT_ROOT/output)
+        include_all: Include every report file in report_files instead of
+            just the latest one (default: False)
 
     Returns:
         dict with keys:
@@ -240,27 +407,41 @@ def check_validation_status(
         status = check_validation_status(name="10XGenomics-VisiumHD-Human")
     """
     if base_output_dir is None:
-        base_output_dir = str(PROJECT_ROOT / "output")
+        base_output_dir = DEFAULT_OUTPUT_DIR
 
-    reports_dir = Path(base_output_dir) / name / "reports"
+    reports_dir = _run_reports_dir(base_output_dir, name)
 
-    if not reports_dir.exists():
+    if _safe_stat(reports_dir) is None:
         return {
             "completed": False,
             "report_files": [],
             "message": "Validation not started"
         }
 
-    json_reports = sorted(reports_dir.glob("validation_report_*.json"), reverse=True)
-    html_reports = sorted(reports_dir.glob("validation_report_*.html"), reverse=True)
+    if include_all:
+        json_reports = sorted(reports_dir.glob("validation_report_*.json"), reverse=True)
+        html_reports = sorted(reports_dir.glob("validation_report_*.html"), reverse=True)
+
+        return {
+            "completed": len(json_reports) > 0,
+            "report_files": {
+                "json": [str(f) for f in json_reports],
+                "html": [str(f) for f in html_reports]
+            },
+            "latest_report": str(json_reports[0]) if json_reports else None
+        }
+
+    # Default path: only the latest report of each kind is needed
+    latest_json = _latest_report(reports_dir, ".json")
+    latest_html = _latest_report(reports_dir, ".html")
 
     return {
-        "completed": len(json_reports) > 0,
+        "completed": latest_json is not None,
         "report_files": {
-            "json": [str(f) for f in json_reports],
-            "html": [str(f) for f in html_reports]
+            "json": [str(latest_json)] if latest_json else [],
+            "html": [str(latest_html)] if latest_html else []
         },
-        "latest_report": str(json_reports[0]) if json_reports else None
+        "latest_report": str(latest_json) if latest_json else None
     }
 
 
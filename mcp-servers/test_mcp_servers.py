@@ -10,12 +10,49 @@ Usage:
     python test_mcp_servers.py
 """
 
+import functools
+import importlib.util
+import json
 import sys
 from pathlib import Path
 
-# Add mcp-servers to path
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT / "mcp-servers"))
+# orjson parses JSON several times faster than the stdlib and accepts raw
+# bytes directly; fall back to stdlib json when it is not installed.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+MCP_DIR = PROJECT_ROOT / "mcp-servers"
+SKILLS_DIR = PROJECT_ROOT / "skills"
+
+
+def _load(name, path):
+    """
+    Load a server script as a module under an explicit name.
+
+    The server files all share the filename server.py, so importing them
+    with sys.path.insert + "import server" collides in sys.modules and
+    only works by accident. Loading from the file location gives each
+    module its own name and skips the path search entirely.
+    """
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# (directory, display name, expected tools) for each MCP server under test
+SERVERS = [
+    ("10x-scraper", "Scraper",
+     ['scrape_datasets', 'get_scraper_output', 'check_scraper_status']),
+    ("10x-validator", "Validator",
+     ['validate_datasets', 'get_validation_report', 'check_validation_status']),
+    ("10x-enricher", "Enricher",
+     ['enrich_metadata', 'get_enriched_data', 'check_enrichment_status', 'get_field_statistics']),
+]
+
 
 def test_imports():
     """Test that all server modules can be imported."""
@@ -23,78 +60,62 @@ def test_imports():
 
     errors = []
 
-    # Test scraper server
-    try:
-        sys.path.insert(0, str(PROJECT_ROOT / "mcp-servers" / "10x-scraper"))
-        import server as scraper_server
-        print("✅ Scraper server imports successfully")
+    for dir_name, display_name, expected_tools in SERVERS:
+        try:
+            module = _load(
+                dir_name.replace("-", "_") + "_server",
+                MCP_DIR / dir_name / "server.py"
+            )
+            print(f"✅ {display_name} server imports successfully")
+        except ImportError as e:
+            errors.append(f"Failed to import {display_name.lower()} server: {e}")
+            print(f"❌ Failed to import {display_name.lower()} server: {e}")
+            continue
 
         # Check for expected tools
-        expected_tools = ['scrape_datasets', 'get_scraper_output', 'check_scraper_status']
         for tool in expected_tools:
-            if hasattr(scraper_server, tool):
+            if hasattr(module, tool):
                 print(f"   ✅ Tool found: {tool}")
             else:
-                errors.append(f"Scraper tool not found: {tool}")
+                errors.append(f"{display_name} tool not found: {tool}")
                 print(f"   ❌ Tool not found: {tool}")
 
-    except ImportError as e:
-        errors.append(f"Failed to import scraper server: {e}")
-        print(f"❌ Failed to import scraper server: {e}")
+    return errors
 
-    # Test validator server
-    try:
-        sys.path.insert(0, str(PROJECT_ROOT / "mcp-servers" / "10x-validator"))
-        import server as validator_server
-        print("✅ Validator server imports successfully")
 
-        expected_tools = ['validate_datasets', 'get_validation_report', 'check_validation_status']
-        for tool in expected_tools:
-            if hasattr(validator_server, tool):
-                print(f"   ✅ Tool found: {tool}")
-            else:
-                errors.append(f"Validator tool not found: {tool}")
-                print(f"   ❌ Tool not found: {tool}")
+@functools.lru_cache(maxsize=1)
+def _fastmcp_ok():
+    """
+    Probe the MCP stack on demand and memoize the result.
 
-    except ImportError as e:
-        errors.append(f"Failed to import validator server: {e}")
-        print(f"❌ Failed to import validator server: {e}")
+    Importing mcp.server.fastmcp pulls in the whole MCP dependency tree,
+    so the probe only runs when a caller actually asks and at most once
+    per process.
 
-    # Test enricher server
+    Returns:
+        Tuple of (available, error message)
+    """
     try:
-        sys.path.insert(0, str(PROJECT_ROOT / "mcp-servers" / "10x-enricher"))
-        import server as enricher_server
-        print("✅ Enricher server imports successfully")
-
-        expected_tools = ['enrich_metadata', 'get_enriched_data', 'check_enrichment_status', 'get_field_statistics']
-        for tool in expected_tools:
-            if hasattr(enricher_server, tool):
-                print(f"   ✅ Tool found: {tool}")
-            else:
-                errors.append(f"Enricher tool not found: {tool}")
-                print(f"   ❌ Tool not found: {tool}")
-
+        import mcp.server.fastmcp  # noqa: F401
+        return True, ""
     except ImportError as e:
-        errors.append(f"Failed to import enricher server: {e}")
-        print(f"❌ Failed to import enricher server: {e}")
-
-    return errors
+        return False, str(e)
 
 
 def test_fastmcp_available():
     """Test that FastMCP is installed."""
     print("\nTesting FastMCP availability...")
 
-    try:
-        from mcp.server.fastmcp import FastMCP
+    ok, err = _fastmcp_ok()
+    if ok:
         print("✅ FastMCP is installed")
         return []
-    except ImportError as e:
-        error = f"FastMCP not installed: {e}"
-        print(f"❌ {error}")
-        print("\nTo install FastMCP, run:")
-        print("    pip install fastmcp")
-        return [error]
+
+    error = f"FastMCP not installed: {err}"
+    print(f"❌ {error}")
+    print("\nTo install FastMCP, run:")
+    print("    pip install fastmcp")
+    return [error]
 
 
 def test_skill_scripts_exist():
@@ -104,9 +125,9 @@ def test_skill_scripts_exist():
     errors = []
 
     scripts = [
-        ("Scraper", PROJECT_ROOT / "skills" / "scraper" / "scraper.py"),
-        ("Validator", PROJECT_ROOT / "skills" / "validator" / "validator.py"),
-        ("Enricher", PROJECT_ROOT / "skills" / "metadata_enricher" / "metadata_enricher.py")
+        ("Scraper", SKILLS_DIR / "scraper" / "scraper.py"),
+        ("Validator", SKILLS_DIR / "validator" / "validator.py"),
+        ("Enricher", SKILLS_DIR / "metadata_enricher" / "metadata_enricher.py")
     ]
 
     for name, path in scripts:
@@ -124,7 +145,7 @@ def test_config_file():
     """Test that MCP config file exists and is valid JSON."""
     print("\nTesting MCP configuration file...")
 
-    config_file = PROJECT_ROOT / "mcp-servers" / "mcp-config.json"
+    config_file = MCP_DIR / "mcp-config.json"
 
     if not config_file.exists():
         error = f"MCP config file not found: {config_file}"
@@ -132,8 +153,8 @@ def test_config_file():
         return [error]
 
     try:
-        import json
-        config = json.loads(config_file.read_text())
+        # Parse the raw bytes in one pass - no intermediate str decode
+        config = _json_loads(config_file.read_bytes())
         print(f"✅ MCP config file exists and is valid JSON")
 
         # Check for expected servers
@@ -158,6 +179,10 @@ def test_config_file():
 
 def main():
     """Run all tests."""
+    # --quick: only the cheap file-existence and config checks, skipping
+    # everything that would import the MCP stack or the server modules
+    quick = "--quick" in sys.argv[1:]
+
     print("="*60)
     print("10X Genomics MCP Servers - Test Suite")
     print("="*60)
@@ -166,10 +191,12 @@ def main():
     all_errors = []
 
     # Run tests
-    all_errors.extend(test_fastmcp_available())
+    if not quick:
+        all_errors.extend(test_fastmcp_available())
     all_errors.extend(test_skill_scripts_exist())
     all_errors.extend(test_config_file())
-    all_errors.extend(test_imports())
+    if not quick:
+        all_errors.extend(test_imports())
 
     # Summary
     print("\n" + "="*60)
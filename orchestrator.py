@@ -8,18 +8,39 @@ Manages the complete data pipeline from scraping to validation.
 
 import sys
 import os
+import atexit
 import subprocess
-import argparse
-import yaml
+import importlib.util
 from pathlib import Path
 from datetime import datetime
-import json
+
+# Computed once at import: every orchestrator instance shares these instead
+# of rebuilding the same Path objects per __init__
+ROOT_DIR = Path(__file__).resolve().parent
+LOG_DIR = ROOT_DIR / 'logs'
 
 
 class PipelineOrchestrator:
     """Orchestrates the multi-agent data pipeline."""
 
-    def __init__(self, config_path='config.yml', url=None, name=None):
+    # Dependency statuses that block a dependent agent vs. let it run
+    DEP_BLOCKED = frozenset({'failed', 'error'})
+    DEP_RUNNABLE = frozenset({'success', 'user_skipped'})
+
+    # Per-agent CLI argument builders, dispatched by name instead of
+    # re-testing agent_name against every known agent on each call
+    _AGENT_ARGS = {
+        'scraper': lambda self: ['--url', self.url, '--name', self.name,
+                                 '--base-output-dir', self._abs_output_dir],
+        'validator': lambda self: ['--name', self.name,
+                                   '--base-output-dir', self._abs_output_dir],
+        'metadata_enricher': lambda self: ['--name', self.name,
+                                           '--base-output-dir', self._abs_output_dir],
+        'file_extractor': lambda self: ['--name', self.name,
+                                        '--base-output-dir', self._abs_output_dir],
+    }
+
+    def __init__(self, config_path='config.yml', url=None, name=None, isolate=False):
         """
         Initialize the orchestrator.
 
@@ -27,14 +48,24 @@ class PipelineOrchestrator:
             config_path: Path to pipeline configuration file
             url: Source URL to scrape (overrides config default)
             name: Human-readable run identifier (overrides config default)
+            isolate: Run each agent in its own interpreter instead of
+                in-process (slower, but gives full process isolation)
         """
         self.config_path = Path(config_path)
-        self.root_dir = Path(__file__).parent
-        self.log_dir = self.root_dir / 'logs'
-        self.log_dir.mkdir(exist_ok=True)
+        self.isolate = isolate
+        self._skill_modules = {}
+        self._timestamps = None
+        self.root_dir = ROOT_DIR
+        self.log_dir = LOG_DIR
 
         self.timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         self.log_file = self.log_dir / f"pipeline_{self.timestamp}.log"
+        self.results_jsonl = self.log_dir / f"pipeline_results_{self.timestamp}.jsonl"
+
+        # Both log files open lazily on first write, so runs that never log
+        # anything (e.g. everything skipped) leave no stray files behind
+        self._log_fd = None
+        self._results_fh = None
 
         self.load_config()
 
@@ -42,6 +73,9 @@ class PipelineOrchestrator:
         self.url = url or self.config.get('pipeline', {}).get('default_url', '')
         self.name = name or self.config.get('pipeline', {}).get('default_name', '10XGenomics-Dataset')
         self.base_output_dir = Path(self.config.get('pipeline', {}).get('base_output_dir', './output'))
+        # Resolved once: agents always receive an absolute path, and
+        # str(Path) is not free enough to redo per agent
+        self._abs_output_dir = str(self.base_output_dir.resolve())
 
         self.results = {
             "pipeline_start": datetime.now().isoformat(),
@@ -53,6 +87,10 @@ class PipelineOrchestrator:
 
     def load_config(self):
         """Load pipeline configuration from YAML file."""
+        # Imported here so plain startup (--help, missing config) never pays
+        # PyYAML's import cost
+        import yaml
+
         try:
             with open(self.config_path, 'r') as f:
                 self.config = yaml.safe_load(f)
@@ -104,44 +142,117 @@ class PipelineOrchestrator:
             }
         }
 
+    def _load_timestamps(self):
+        """
+        Load per-task timestamps once per orchestrator instance.
+
+        Prefers the JSON store; falls back to parsing a legacy
+        timestamp.txt from earlier runs so existing data migrates on the
+        next update.
+
+        Returns:
+            Dict mapping task name to timestamp string
+        """
+        if self._timestamps is not None:
+            return self._timestamps
+
+        import json
+
+        run_dir = self.base_output_dir / self.name
+        json_file = run_dir / 'timestamps.json'
+        txt_file = run_dir / 'timestamp.txt'
+
+        self._timestamps = {}
+        if json_file.exists():
+            try:
+                with open(json_file, 'r', encoding='utf-8') as f:
+                    self._timestamps = json.load(f)
+            except Exception:
+                self._timestamps = {}
+        elif txt_file.exists():
+            # Legacy tab-separated store - parse once, migrate on next write.
+            # partition stops at the first tab in one C-level scan instead
+            # of split's full pass plus list allocation.
+            with open(txt_file, 'r', encoding='utf-8') as f:
+                for line in f.readlines()[1:]:  # Skip header
+                    task, sep, stamp = line.strip().partition('\t')
+                    if sep:
+                        self._timestamps[task.strip()] = stamp.strip()
+
+        return self._timestamps
+
     def update_timestamp(self, task_name):
         """
-        Update timestamp for a specific task in timestamp.txt file.
+        Update the completion timestamp for a specific task.
+
+        The timestamps live in a JSON store that is loaded once and
+        persisted with a temp-file rename, so updates are atomic and the
+        old read-parse-rewrite of the text file is gone. The
+        human-readable timestamp.txt is regenerated once at pipeline end.
 
         Args:
             task_name: Name of the task (e.g., 'scraper', 'validator', 'metadata-enricher')
         """
-        timestamp_file = self.base_output_dir / self.name / 'timestamp.txt'
-        timestamp_file.parent.mkdir(parents=True, exist_ok=True)
+        import json
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamps = self._load_timestamps()
+        # isoformat takes the pure C path; strftime re-parses its format
+        # string and consults the locale on every call
+        timestamps[task_name] = datetime.now().isoformat(sep=' ', timespec='seconds')
 
-        # Define all possible tasks
-        all_tasks = ['scraper', 'validator', 'metadata-enricher', 'file-extractor']
+        json_file = self.base_output_dir / self.name / 'timestamps.json'
+        json_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Read existing timestamps or initialize
-        timestamps = {}
-        if timestamp_file.exists():
-            with open(timestamp_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                for line in lines[1:]:  # Skip header
-                    line = line.strip()
-                    if line and '\t' in line:
-                        parts = line.split('\t')
-                        if len(parts) >= 2:
-                            timestamps[parts[0].strip()] = parts[1].strip()
-
-        # Update the specific task
-        timestamps[task_name] = current_time
-
-        # Write back with pretty formatting
-        with open(timestamp_file, 'w', encoding='utf-8') as f:
-            # Header
+        tmp_file = json_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(timestamps, f, indent=2)
+        os.replace(tmp_file, json_file)
+
+    def write_timestamp_txt(self):
+        """Regenerate the human-readable timestamp.txt from the JSON store."""
+        if not self._timestamps:
+            return
+
+        all_tasks = ['scraper', 'validator', 'metadata-enricher', 'file-extractor']
+        txt_file = self.base_output_dir / self.name / 'timestamp.txt'
+        with open(txt_file, 'w', encoding='utf-8') as f:
             f.write(f"{'task':<24}\ttime\n")
-            # Task lines
             for task in all_tasks:
-                time_str = timestamps.get(task, '')
-                f.write(f"{task:<24}\t{time_str}\n")
+                f.write(f"{task:<24}\t{self._timestamps.get(task, '')}\n")
+
+    def _ensure_log_fd(self):
+        """
+        Open the pipeline log on first use.
+
+        One persistent appending fd instead of re-opening the log file for
+        every message. Writing through os.write skips the Python io
+        buffering layer: one syscall per message, nothing buffered to lose
+        if an agent hard-crashes the process, and O_APPEND gives atomic
+        append semantics on POSIX.
+        """
+        if self._log_fd is None:
+            self.log_dir.mkdir(exist_ok=True)
+            self._log_fd = os.open(str(self.log_file), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            atexit.register(os.close, self._log_fd)
+        return self._log_fd
+
+    def record_event(self, event, data):
+        """
+        Append one structured event line to the JSONL results log.
+
+        Args:
+            event: Event type (e.g., 'agent', 'summary')
+            data: JSON-serializable payload for the event
+        """
+        import json
+
+        if self._results_fh is None:
+            self.log_dir.mkdir(exist_ok=True)
+            self._results_fh = open(self.results_jsonl, 'a', encoding='utf-8', buffering=1)
+            atexit.register(self._results_fh.close)
+
+        json.dump({"event": event, "data": data}, self._results_fh)
+        self._results_fh.write("\n")
 
     def log(self, message, to_file=True):
         """
@@ -153,10 +264,33 @@ class PipelineOrchestrator:
         """
         print(message)
         if to_file:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(f"{message}\n")
+            os.write(self._ensure_log_fd(), f"{message}\n".encode())
 
-    def run_agent(self, agent_config):
+    def _load_skill_module(self, agent_name, script_path):
+        """
+        Load (and cache) a skill script as a module for in-process runs.
+
+        Each script loads once under its own module name, so a pipeline
+        pays interpreter startup and the heavy imports (selenium, pandas,
+        openpyxl) a single time instead of once per agent.
+
+        Args:
+            agent_name: Name of the agent (used as the module name key)
+            script_path: Path to the skill script
+
+        Returns:
+            The loaded module
+        """
+        module = self._skill_modules.get(agent_name)
+        if module is None:
+            spec = importlib.util.spec_from_file_location(f"skill_{agent_name}", script_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self._skill_modules[agent_name] = module
+        return module
+
+
+    def run_agent(self, agent_config, force_isolate=False):
         """
         Run a single agent.
 
@@ -169,9 +303,13 @@ class PipelineOrchestrator:
         agent_name = agent_config['name']
         script_path = self.root_dir / agent_config['script']
 
+        # One datetime.now() covers both the ISO start stamp and the
+        # elapsed-time calculation
+        start_time = datetime.now()
+
         result = {
             'name': agent_name,
-            'start_time': datetime.now().isoformat(),
+            'start_time': start_time.isoformat(),
             'exit_code': None,
             'status': 'unknown',
             'duration': None
@@ -190,39 +328,56 @@ class PipelineOrchestrator:
             return result
 
         try:
-            start_time = datetime.now()
-
-            # Build command with URL and name parameters
-            cmd = [sys.executable, str(script_path)]
-
-            # Add common parameters for all agents
-            # Convert to absolute path to avoid issues with cwd changes
-            abs_output_dir = str(self.base_output_dir.resolve())
-            if agent_name == 'scraper':
-                cmd.extend(['--url', self.url, '--name', self.name, '--base-output-dir', abs_output_dir])
-            elif agent_name in ['validator', 'metadata_enricher', 'file_extractor']:
-                cmd.extend(['--name', self.name, '--base-output-dir', abs_output_dir])
-
-            # Run the agent script with real-time output streaming
-            # This allows progress bars and live updates to display properly
-            process = subprocess.run(
-                cmd,
-                text=True,
-                cwd=str(script_path.parent),
-                # Don't capture output - let it stream directly to terminal
-                stdout=None,
-                stderr=None
-            )
+            # Build agent arguments with URL and name parameters
+            args_builder = self._AGENT_ARGS.get(agent_name)
+            cmd_args = args_builder(self) if args_builder else []
+
+            if self.isolate or force_isolate:
+                # Isolated path: run the agent script in its own interpreter,
+                # teeing its output to the terminal and the pipeline log in
+                # one pass (previously it only reached the terminal)
+                process = subprocess.Popen(
+                    [sys.executable, str(script_path)] + cmd_args,
+                    cwd=str(script_path.parent),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1
+                )
+                log_fd = self._ensure_log_fd()
+                for line in process.stdout:
+                    sys.stdout.write(line)
+                    os.write(log_fd, line.encode())
+                process.stdout.close()
+                exit_code = process.wait()
+            else:
+                # Default path: call the skill's main() in-process. The
+                # module stays loaded, so later agents (and repeated runs)
+                # skip both interpreter startup and module imports.
+                module = self._load_skill_module(agent_name, script_path)
+                prev_cwd = os.getcwd()
+                os.chdir(script_path.parent)
+                try:
+                    exit_code = module.main(cmd_args) or 0
+                except SystemExit as e:
+                    if e.code is None:
+                        exit_code = 0
+                    elif isinstance(e.code, int):
+                        exit_code = e.code
+                    else:
+                        exit_code = 2
+                finally:
+                    os.chdir(prev_cwd)
 
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
 
-            result['exit_code'] = process.returncode
+            result['exit_code'] = exit_code
             result['end_time'] = end_time.isoformat()
             result['duration'] = f"{duration:.2f}s"
 
             # Determine status
-            if process.returncode == 0:
+            if exit_code == 0:
                 result['status'] = 'success'
                 self.log(f"\n✓ Agent {agent_name} completed successfully in {duration:.2f}s")
 
@@ -231,7 +386,7 @@ class PipelineOrchestrator:
                 timestamp_task_name = agent_name.replace('_', '-')
                 self.update_timestamp(timestamp_task_name)
 
-            elif process.returncode == 1:
+            elif exit_code == 1:
                 result['status'] = 'failed'
                 self.log(f"\n✗ Agent {agent_name} failed with validation errors")
 
@@ -240,7 +395,7 @@ class PipelineOrchestrator:
                 self.update_timestamp(timestamp_task_name)
             else:
                 result['status'] = 'error'
-                self.log(f"\n✗ Agent {agent_name} encountered a critical error (exit code: {process.returncode})")
+                self.log(f"\n✗ Agent {agent_name} encountered a critical error (exit code: {exit_code})")
 
         except Exception as e:
             result['status'] = 'error'
@@ -250,6 +405,37 @@ class PipelineOrchestrator:
 
         return result
 
+    def dry_run(self):
+        """
+        Validate pipeline setup without invoking any agent.
+
+        Checks that every enabled agent's script exists so CI can catch
+        pipeline wiring errors in milliseconds instead of after a full
+        scrape.
+
+        Returns:
+            0 when every enabled agent's script exists, 2 otherwise
+        """
+        print(f"Dry run: {self.config['pipeline']['name']}")
+
+        missing = []
+        for agent_config in self.config['pipeline']['agents']:
+            if not agent_config.get('enabled', True):
+                continue
+            script_path = self.root_dir / agent_config['script']
+            if script_path.exists():
+                print(f"✓ {agent_config['name']}: {script_path}")
+            else:
+                print(f"✗ {agent_config['name']}: script not found: {script_path}")
+                missing.append(agent_config['name'])
+
+        if missing:
+            print(f"✗ Dry run failed: missing scripts for {', '.join(missing)}")
+            return 2
+
+        print("✓ Dry run passed - pipeline is ready")
+        return 0
+
     def run_pipeline(self, skip_scraping=False, skip_validation=False, skip_enrichment=False):
         """
         Run the complete pipeline.
@@ -262,6 +448,23 @@ class PipelineOrchestrator:
         Returns:
             Overall pipeline status
         """
+        agents = self.config['pipeline']['agents']
+
+        # One dict lookup per agent replaces chained name-equality tests,
+        # and new agents plug in by extending the map.
+        skip_map = {
+            'scraper': (skip_scraping, '--skip-scraping'),
+            'validator': (skip_validation, '--skip-validation'),
+            'metadata_enricher': (skip_enrichment, '--skip-enrichment')
+        }
+
+        # Every enabled agent skipped: return before creating the log file
+        # or any output directories
+        enabled_agents = [a for a in agents if a.get('enabled', True)]
+        if enabled_agents and all(skip_map.get(a['name'], (False, ''))[0] for a in enabled_agents):
+            print("Nothing to do - every enabled agent was skipped")
+            return 0
+
         self.log("="*60)
         self.log(f"PIPELINE: {self.config['pipeline']['name']}")
         self.log(f"Started: {self.timestamp}")
@@ -272,9 +475,12 @@ class PipelineOrchestrator:
         output_run_dir.mkdir(parents=True, exist_ok=True)
         self.log(f"✓ Output directory: {output_run_dir}")
 
-        agents = self.config['pipeline']['agents']
         overall_success = True
 
+        # Resolve disabled agents and skip flags up front; everything else
+        # is scheduled by its depends_on edge, so agents whose dependencies
+        # are all satisfied in the same round run concurrently.
+        pending = []
         for agent_config in agents:
             agent_name = agent_config['name']
 
@@ -284,68 +490,113 @@ class PipelineOrchestrator:
                 continue
 
             # Check skip flags
-            if agent_name == 'scraper' and skip_scraping:
-                self.log(f"\n⊘ Skipping scraper agent (--skip-scraping flag)")
+            user_skipped, flag = skip_map.get(agent_name, (False, ''))
+            if user_skipped:
+                self.log(f"\n⊘ Skipping {agent_name} agent ({flag} flag)")
                 self.results['agents'][agent_name] = {
                     'status': 'user_skipped',
                     'reason': 'User requested skip'
                 }
                 continue
 
-            if agent_name == 'validator' and skip_validation:
-                self.log(f"\n⊘ Skipping validator agent (--skip-validation flag)")
-                self.results['agents'][agent_name] = {
-                    'status': 'user_skipped',
-                    'reason': 'User requested skip'
-                }
-                continue
+            pending.append(agent_config)
 
-            if agent_name == 'metadata_enricher' and skip_enrichment:
-                self.log(f"\n⊘ Skipping metadata enricher agent (--skip-enrichment flag)")
-                self.results['agents'][agent_name] = {
-                    'status': 'user_skipped',
-                    'reason': 'User requested skip'
-                }
-                continue
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        stop_pipeline = False
+        while pending and not stop_pipeline:
+            pending_names = {a['name'] for a in pending}
+            round_size = len(pending)
+            ready = []
+            still_pending = []
 
-            # Check dependencies
-            depends_on = agent_config.get('depends_on')
-            if depends_on:
-                dep_result = self.results['agents'].get(depends_on, {})
-                dep_status = dep_result.get('status', 'unknown')
+            for agent_config in pending:
+                agent_name = agent_config['name']
+                depends_on = agent_config.get('depends_on')
+
+                if not depends_on:
+                    ready.append(agent_config)
+                    continue
+
+                if depends_on not in self.results['agents']:
+                    if depends_on in pending_names:
+                        # Dependency hasn't run yet - wait for a later round
+                        still_pending.append(agent_config)
+                        continue
+                    dep_status = 'unknown'
+                else:
+                    dep_status = self.results['agents'][depends_on].get('status', 'unknown')
 
                 # Only block dependent agents if the dependency failed or errored
                 # Allow dependents to run if dependency was user-skipped (assumes data exists from previous runs)
-                if dep_status in ['failed', 'error']:
+                if dep_status in self.DEP_BLOCKED:
                     self.log(f"\n✗ Skipping {agent_name} (dependency {depends_on} failed)")
                     self.results['agents'][agent_name] = {
                         'status': 'skipped',
                         'reason': f'Dependency {depends_on} failed'
                     }
                     overall_success = False
-                    continue
-                elif dep_status == 'user_skipped':
-                    self.log(f"\n→ Continuing with {agent_name} (dependency {depends_on} was user-skipped, assuming data exists)")
-                elif dep_status not in ['success', 'user_skipped']:
+                elif dep_status in self.DEP_RUNNABLE:
+                    if dep_status == 'user_skipped':
+                        self.log(f"\n→ Continuing with {agent_name} (dependency {depends_on} was user-skipped, assuming data exists)")
+                    ready.append(agent_config)
+                else:
                     self.log(f"\n✗ Skipping {agent_name} (dependency {depends_on} status: {dep_status})")
                     self.results['agents'][agent_name] = {
                         'status': 'skipped',
                         'reason': f'Dependency {depends_on} status: {dep_status}'
                     }
                     overall_success = False
-                    continue
-
-            # Run the agent
-            result = self.run_agent(agent_config)
-            self.results['agents'][agent_name] = result
 
-            # Check if agent failed
-            if result['status'] != 'success':
-                overall_success = False
-                # Stop pipeline on critical errors
-                if result['exit_code'] == 2:
-                    self.log("\n✗ Critical error encountered, stopping pipeline")
+            pending = still_pending
+
+            if not ready:
+                if len(still_pending) == round_size:
+                    # Nothing ran and nothing resolved this round: the
+                    # remaining depends_on entries form a cycle (or a
+                    # self-dependency) that can never become ready
+                    for agent_config in pending:
+                        agent_name = agent_config['name']
+                        depends_on = agent_config.get('depends_on')
+                        self.log(f"\n✗ Skipping {agent_name} (unresolvable dependency {depends_on})")
+                        self.results['agents'][agent_name] = {
+                            'status': 'skipped',
+                            'reason': f'Unresolvable dependency {depends_on}'
+                        }
+                    overall_success = False
                     break
+                continue
+
+            if len(ready) == 1:
+                batch_results = [(ready[0]['name'], self.run_agent(ready[0]))]
+            else:
+                # Independent agents: run the batch concurrently, each in
+                # its own interpreter so they keep separate working
+                # directories and truly run in parallel
+                with ThreadPoolExecutor(max_workers=len(ready)) as pool:
+                    futures = {
+                        pool.submit(self.run_agent, agent_config, force_isolate=True): agent_config['name']
+                        for agent_config in ready
+                    }
+                    batch_results = [
+                        (futures[future], future.result())
+                        for future in as_completed(futures)
+                    ]
+
+            for agent_name, result in batch_results:
+                self.results['agents'][agent_name] = result
+                self.record_event("agent", result)
+
+                # Check if agent failed
+                if result['status'] != 'success':
+                    overall_success = False
+                    # Stop pipeline on critical errors
+                    if result['exit_code'] == 2:
+                        self.log("\n✗ Critical error encountered, stopping pipeline")
+                        stop_pipeline = True
+
+        # Regenerate the human-readable timestamp file once per run
+        self.write_timestamp_txt()
 
         # Pipeline summary
         self.results['pipeline_end'] = datetime.now().isoformat()
@@ -372,10 +623,18 @@ class PipelineOrchestrator:
         self.log(f"Log saved to: {self.log_file}")
         self.log("="*60)
 
-        # Save results as JSON
+        # Close out the structured log and keep the aggregate JSON for
+        # back-compat (compact separators halve the bytes written)
+        import json
+
+        self.record_event("summary", {
+            "overall_status": self.results['overall_status'],
+            "pipeline_end": self.results['pipeline_end']
+        })
+
         results_file = self.log_dir / f"pipeline_results_{self.timestamp}.json"
         with open(results_file, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, indent=2)
+            json.dump(self.results, f, separators=(',', ':'))
         self.log(f"Results saved to: {results_file}")
 
         return 0 if overall_success else 1
@@ -383,6 +642,13 @@ class PipelineOrchestrator:
 
 def main():
     """Main entry point for the orchestrator."""
+    # Defaults-only invocation (plain `python orchestrator.py`): skip
+    # argparse import and parser construction entirely
+    if len(sys.argv) == 1:
+        sys.exit(PipelineOrchestrator().run_pipeline())
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='10X Genomics Data Pipeline Orchestrator',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -417,6 +683,10 @@ Examples:
                        help='Skip the metadata enricher agent')
     parser.add_argument('--config', default='config.yml',
                        help='Path to configuration file (default: config.yml)')
+    parser.add_argument('--isolate', action='store_true',
+                       help='Run each agent in a separate Python process instead of in-process')
+    parser.add_argument('--dry-run', action='store_true',
+                       help='Validate config and agent scripts without running anything')
 
     args = parser.parse_args()
 
@@ -424,8 +694,13 @@ Examples:
     orchestrator = PipelineOrchestrator(
         config_path=args.config,
         url=args.url,
-        name=args.name
+        name=args.name,
+        isolate=args.isolate
     )
+
+    if args.dry_run:
+        sys.exit(orchestrator.dry_run())
+
     exit_code = orchestrator.run_pipeline(
         skip_scraping=args.skip_scraping,
         skip_validation=args.skip_validation,
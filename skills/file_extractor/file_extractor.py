@@ -11,24 +11,96 @@ import sys
 import os
 import argparse
 import re
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
+from typing import NamedTuple
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 import time
 from tqdm import tqdm
 
+# The __NEXT_DATA__ script tag is emitted verbatim by Next.js, so plain
+# substring search is enough (and much faster than a DOTALL regex over
+# the whole page)
+_NEXT_DATA_START = '<script id="__NEXT_DATA__" type="application/json">'
+
+# Precompiled patterns for the per-file hot paths
+_SIZE_RE = re.compile(r'([\d.]+)\s*([KMGT]?B)', re.IGNORECASE)
+_UM_RE = re.compile(r'(\d+)um')
+
+class FileInfo(NamedTuple):
+    """One downloadable file, matching the website's file table columns.
+
+    A NamedTuple is a fraction of the size of an equivalent dict and has
+    fixed attribute offsets, which matters with thousands of in-flight
+    file entries; entries become dicts only at the final JSON dump.
+    """
+    file_title: str     # e.g., "Microscope image"
+    file_type: str      # e.g., "TIF", "BTF", "GZ"
+    filename: str
+    size: str
+    size_bytes: int
+    md5sum: str
+    url: str
+
+
+# Decimal units, matching how the website displays file sizes
+_DECIMAL_UNITS = ((1000**3, 'GB'), (1000**2, 'MB'), (1000, 'KB'))
+
+
+def _fmt_decimal(n):
+    """Format a byte count using decimal units (website convention)."""
+    for factor, unit in _DECIMAL_UNITS:
+        if n >= factor:
+            return f"{n / factor:.2f} {unit}"
+    return f"{n} B"
+
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json works everywhere
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON with orjson when available (much faster on large blobs)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json(path, obj):
+    """Write obj to path as indented UTF-8 JSON, via orjson when available."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+
 
 class FileExtractor:
     """Extracts file download information from dataset detail pages."""
 
-    def __init__(self, json_path, excel_path, max_retries=3, timeout=30):
+    # Resolved ChromeDriver path, shared across instances so the
+    # webdriver-manager version check runs at most once per process
+    _driver_path = None
+
+    # self.stats key for each file_extraction_status value
+    _STATUS_KEYS = {'success': 'successful', 'partial': 'partial', 'failed': 'failed'}
+
+    def __init__(self, json_path, excel_path, max_retries=3, timeout=30, workers=4,
+                 use_cache=True, refresh_cache=False, cache_max_age=7 * 86400,
+                 resume=False):
         """
         Initialize the file extractor.
 
@@ -37,11 +109,36 @@ class FileExtractor:
             excel_path: Path to enriched Excel file
             max_retries: Maximum retries for failed page loads
             timeout: Timeout for page loads in seconds
+            workers: Number of concurrent extraction threads
+            use_cache: Reuse previously extracted file listings from the
+                sqlite cache next to the JSON file
+            refresh_cache: Ignore cached entries but still record fresh ones
+            cache_max_age: Maximum age of a cached entry in seconds
+            resume: Reuse results journaled by an interrupted run
         """
         self.json_path = Path(json_path)
         self.excel_path = Path(excel_path)
         self.max_retries = max_retries
         self.timeout = timeout
+        self.workers = workers
+        self.refresh_cache = refresh_cache
+        self.cache_max_age = cache_max_age
+        self.cache = self._open_cache() if use_cache else None
+        self._cache_lock = threading.Lock()
+
+        # Every finished dataset is journaled to this JSONL file so an
+        # interrupted run can pick up where it left off with --resume
+        self.journal_path = self.json_path.with_suffix('.jsonl')
+        self._resume_records = self._load_journal() if resume else {}
+
+        # Plain HTTP session (primary) and Selenium driver (lazy fallback)
+        self.session = self.setup_session()
+        self.driver = None
+
+        # Extraction runs on multiple threads: guard shared stats, and
+        # serialize access to the single fallback browser instance
+        self._stats_lock = threading.Lock()
+        self._driver_lock = threading.Lock()
 
         # Statistics
         self.stats = {
@@ -55,7 +152,7 @@ class FileExtractor:
         }
 
     def load_input_data(self):
-        """Load enriched JSON and Excel data."""
+        """Load enriched JSON data (the Excel file is only ever rewritten)."""
         print("Loading enriched data files...", file=sys.stderr, flush=True)
 
         try:
@@ -64,10 +161,6 @@ class FileExtractor:
                 self.json_data = json.load(f)
             print(f"✓ Loaded JSON: {len(self.json_data)} entries", file=sys.stderr, flush=True)
 
-            # Load Excel
-            self.excel_data = pd.read_excel(self.excel_path, keep_default_na=False)
-            print(f"✓ Loaded Excel: {len(self.excel_data)} rows", file=sys.stderr, flush=True)
-
             self.stats["total_datasets"] = len(self.json_data)
 
             return True
@@ -76,6 +169,107 @@ class FileExtractor:
             print(f"✗ Error loading data files: {e}", file=sys.stderr)
             return False
 
+    def _open_cache(self):
+        """Open (creating if needed) the per-URL file listing cache."""
+        cache_path = self.json_path.with_suffix('.cache.sqlite')
+        # The connection is shared across worker threads behind _cache_lock
+        conn = sqlite3.connect(cache_path, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS file_cache ("
+            "url TEXT PRIMARY KEY, fetched_at INTEGER, files_json TEXT)"
+        )
+        conn.commit()
+        return conn
+
+    def _cache_get(self, url):
+        """Return the cached file list for a URL, or None on a miss."""
+        if self.cache is None or self.refresh_cache or not url:
+            return None
+
+        with self._cache_lock:
+            row = self.cache.execute(
+                "SELECT fetched_at, files_json FROM file_cache WHERE url = ?",
+                (url,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        fetched_at, files_json = row
+        if time.time() - fetched_at > self.cache_max_age:
+            return None
+
+        try:
+            # A TypeError means the cached schema predates FileInfo;
+            # treat it as a miss and re-extract
+            return [FileInfo(**entry) for entry in json.loads(files_json)]
+        except (ValueError, TypeError):
+            return None
+
+    def _cache_put(self, url, files):
+        """Store a freshly extracted file list for a URL."""
+        if self.cache is None or not url:
+            return
+
+        with self._cache_lock:
+            self.cache.execute(
+                "INSERT OR REPLACE INTO file_cache (url, fetched_at, files_json) "
+                "VALUES (?, ?, ?)",
+                (url, int(time.time()), json.dumps([f._asdict() for f in files]))
+            )
+            self.cache.commit()
+
+    def _load_journal(self):
+        """Load prior results from the JSONL journal, keyed by dataset URL."""
+        records = {}
+
+        if not self.journal_path.exists():
+            return records
+
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Truncated trailing line from a crashed run
+                    continue
+                url = record.get('dataset_url')
+                if url:
+                    records[url] = record  # last write wins
+
+        return records
+
+    def setup_session(self):
+        """Setup an HTTP session that presents itself as a regular browser."""
+        session = requests.Session()
+        session.headers.update({
+            'User-Agent': ('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
+                           'AppleWebKit/537.36 (KHTML, like Gecko) '
+                           'Chrome/120.0.0.0 Safari/537.36')
+        })
+
+        # Retries with backoff run inside urllib3 and reuse the same
+        # keep-alive connection instead of rebuilding anything per attempt
+        adapter = HTTPAdapter(max_retries=Retry(
+            total=self.max_retries,
+            backoff_factor=1.0,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods={'GET'}
+        ))
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        return session
+
+    def _get_driver(self):
+        """Lazily create the shared Chrome driver (Selenium fallback)."""
+        if self.driver is None:
+            self.driver = self.setup_driver()
+        return self.driver
+
     def setup_driver(self):
         """Setup Chrome driver for web scraping."""
         chrome_options = Options()
@@ -85,37 +279,57 @@ class FileExtractor:
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--window-size=1920,1080')
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--disable-background-networking')
+        chrome_options.add_argument('--disable-features=Translate,MediaRouter')
+        chrome_options.add_argument('--disable-sync')
+        # Block subresources we never read - only the HTML document matters
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.plugins": 2,
+            "profile.managed_default_content_settings.popups": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
+        # __NEXT_DATA__ is in the initial HTML, so don't block in driver.get()
+        # at all - fetch_next_data polls for the script tag itself
+        chrome_options.page_load_strategy = 'none'
 
         try:
-            service = Service(ChromeDriverManager().install())
+            if FileExtractor._driver_path is None:
+                # CHROMEDRIVER_PATH pins a specific binary (useful in CI)
+                FileExtractor._driver_path = (os.environ.get('CHROMEDRIVER_PATH')
+                                              or ChromeDriverManager().install())
+            service = Service(FileExtractor._driver_path)
             driver = webdriver.Chrome(service=service, options=chrome_options)
             return driver
         except Exception as e:
             tqdm.write(f"✗ Failed to setup Chrome driver: {e}", file=sys.stderr)
             return None
 
-    def extract_next_data_json(self, driver):
+    def extract_next_data_json(self, page_source):
         """
         Extract __NEXT_DATA__ JSON from the page source.
 
         Args:
-            driver: Selenium WebDriver instance
+            page_source: Page HTML as a string
 
         Returns:
             Dictionary with parsed JSON data, or None if not found
         """
         try:
-            page_source = driver.page_source
-            pattern = r'<script id="__NEXT_DATA__" type="application/json">(.+?)</script>'
-            match = re.search(pattern, page_source, re.DOTALL)
+            start = page_source.find(_NEXT_DATA_START)
+            if start == -1:
+                return None
+            start += len(_NEXT_DATA_START)
 
-            if match:
-                json_str = match.group(1)
-                data = json.loads(json_str)
-                return data
-            else:
+            end = page_source.find('</script>', start)
+            if end == -1:
                 return None
 
+            return _json_loads(page_source[start:end])
+
         except Exception as e:
             return None
 
@@ -135,7 +349,7 @@ class FileExtractor:
         try:
             # Handle various formats: "2.3 GB", "1,500 MB", "2.3GB"
             size_str = size_str.strip().replace(',', '')
-            match = re.match(r'([\d.]+)\s*([KMGT]?B)', size_str, re.IGNORECASE)
+            match = _SIZE_RE.match(size_str)
 
             if match:
                 value = float(match.group(1))
@@ -168,27 +382,68 @@ class FileExtractor:
 
         return (size_str, 0)
 
-    def extract_file_info(self, driver):
+    def _collect_files(self, file_list):
         """
-        Extract file information from __NEXT_DATA__ JSON in page source.
+        Build file entries for one inputs/outputs list.
 
         Args:
-            driver: Selenium WebDriver instance
+            file_list: List of raw file dictionaries from filesetMap
 
         Returns:
-            List of file dictionaries
+            Tuple of (files, microscope_count, binned_count)
         """
         files = []
+        # Local ints instead of dict writes in the per-file loop
+        microscope_count = 0
+        binned_count = 0
+
+        for file_data in file_list:
+            file_title = file_data.get('title', '')
+            file_url = file_data.get('url', '')
+            file_bytes = file_data.get('bytes', 0)
+            file_md5 = file_data.get('md5sum', '')
+
+            if not file_url:
+                continue
+
+            # Get filename from URL
+            file_name = file_url.split('/')[-1].split('?')[0]
+
+            # Extract file type from filename extension
+            file_ext = file_name.split('.')[-1].upper()
+
+            # Create file entry matching website table structure
+            files.append(FileInfo(
+                file_title=file_title,
+                file_type=file_ext,
+                filename=file_name,
+                size=_fmt_decimal(file_bytes),  # decimal, matching website
+                size_bytes=file_bytes,
+                md5sum=file_md5,
+                url=file_url
+            ))
+
+            title_lower = file_title.lower()
+            if "microscope" in title_lower:
+                microscope_count += 1
+            if "binned" in title_lower:
+                binned_count += 1
+
+        return files, microscope_count, binned_count
+
+    def extract_file_info(self, next_data):
+        """
+        Extract file information from parsed __NEXT_DATA__ JSON.
 
-        try:
-            # Wait for page content to load
-            wait = WebDriverWait(driver, 10)
-            wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            time.sleep(2)
+        Args:
+            next_data: Parsed __NEXT_DATA__ dictionary
 
-            # Extract __NEXT_DATA__ JSON
-            next_data = self.extract_next_data_json(driver)
+        Returns:
+            List of file dictionaries
+        """
+        files = []
 
+        try:
             if not next_data:
                 return files
 
@@ -196,7 +451,6 @@ class FileExtractor:
             fileset_map = next_data.get('props', {}).get('pageProps', {}).get('filesetMap', {})
 
             # Determine dataset structure
-            sections_to_process = []
             if 'Files' in fileset_map:
                 # Single-experiment dataset
                 sections_to_process = [('Files', fileset_map['Files'])]
@@ -204,95 +458,23 @@ class FileExtractor:
                 # Multi-experiment dataset - process all experiment sections
                 sections_to_process = [(name, section) for name, section in fileset_map.items()]
 
+            microscope_found = 0
+            binned_found = 0
+
             # Process each section (either single 'Files' or multiple experiments)
             for section_name, files_section in sections_to_process:
-                # Extract input files
-                input_files = files_section.get('inputs', [])
-                for file_data in input_files:
-                    file_title = file_data.get('title', '')
-                    file_url = file_data.get('url', '')
-                    file_bytes = file_data.get('bytes', 0)
-                    file_md5 = file_data.get('md5sum', '')
-
-                    if not file_url:
-                        continue
-
-                    # Get filename from URL
-                    file_name = file_url.split('/')[-1].split('?')[0]
-
-                    # Extract file type from filename extension
-                    file_ext = file_name.split('.')[-1].upper()
-
-                    # Convert bytes to human-readable size (using decimal, matching website)
-                    if file_bytes >= 1000**3:
-                        human_size = f"{file_bytes / 1000**3:.2f} GB"
-                    elif file_bytes >= 1000**2:
-                        human_size = f"{file_bytes / 1000**2:.2f} MB"
-                    elif file_bytes >= 1000:
-                        human_size = f"{file_bytes / 1000:.2f} KB"
-                    else:
-                        human_size = f"{file_bytes} B"
-
-                    # Create file entry matching website table structure
-                    file_info = {
-                        "file_title": file_title,          # e.g., "Microscope image"
-                        "file_type": file_ext,              # e.g., "TIF", "BTF", "GZ"
-                        "filename": file_name,
-                        "size": human_size,
-                        "size_bytes": file_bytes,
-                        "md5sum": file_md5,
-                        "url": file_url
-                    }
-
-                    files.append(file_info)
-
-                    # Update statistics
-                    if "microscope" in file_title.lower():
-                        self.stats["microscope_images_found"] += 1
-
-                # Extract output files
-                output_files = files_section.get('outputs', [])
-                for file_data in output_files:
-                    file_title = file_data.get('title', '')
-                    file_url = file_data.get('url', '')
-                    file_bytes = file_data.get('bytes', 0)
-                    file_md5 = file_data.get('md5sum', '')
-
-                    if not file_url:
-                        continue
-
-                    # Get filename from URL
-                    file_name = file_url.split('/')[-1].split('?')[0]
-
-                    # Extract file type from filename extension
-                    file_ext = file_name.split('.')[-1].upper()
-
-                    # Convert bytes to human-readable size (using decimal, matching website)
-                    if file_bytes >= 1000**3:
-                        human_size = f"{file_bytes / 1000**3:.2f} GB"
-                    elif file_bytes >= 1000**2:
-                        human_size = f"{file_bytes / 1000**2:.2f} MB"
-                    elif file_bytes >= 1000:
-                        human_size = f"{file_bytes / 1000:.2f} KB"
-                    else:
-                        human_size = f"{file_bytes} B"
-
-                    # Create file entry matching website table structure
-                    file_info = {
-                        "file_title": file_title,          # e.g., "Binned outputs (all bin levels)"
-                        "file_type": file_ext,              # e.g., "GZ", "H5", "CSV"
-                        "filename": file_name,
-                        "size": human_size,
-                        "size_bytes": file_bytes,
-                        "md5sum": file_md5,
-                        "url": file_url
-                    }
-
-                    files.append(file_info)
-
-                    # Update statistics
-                    if "binned" in file_title.lower():
-                        self.stats["binned_outputs_found"] += 1
+                for file_list in (files_section.get('inputs', []),
+                                  files_section.get('outputs', [])):
+                    section_files, microscope_count, binned_count = \
+                        self._collect_files(file_list)
+                    files.extend(section_files)
+                    microscope_found += microscope_count
+                    binned_found += binned_count
+
+            # Merge statistics once instead of taking the lock per file
+            with self._stats_lock:
+                self.stats["microscope_images_found"] += microscope_found
+                self.stats["binned_outputs_found"] += binned_found
 
         except Exception as e:
             tqdm.write(f"  ✗ Error extracting files: {str(e)[:100]}", file=sys.stderr)
@@ -333,7 +515,7 @@ class FileExtractor:
         # Binned outputs
         if 'square' in filename_lower and filename_lower.endswith('.tar.gz'):
             # Extract bin level (e.g., "002um" -> "2μm")
-            match = re.search(r'(\d+)um', filename_lower)
+            match = _UM_RE.search(filename_lower)
             if match:
                 bin_size = int(match.group(1))
                 return f"Binned Output ({bin_size}μm)"
@@ -349,78 +531,134 @@ class FileExtractor:
         else:
             return "Other"
 
-    def extract_single_dataset(self, dataset, driver=None):
+    def fetch_next_data(self, url):
         """
-        Extract file information for a single dataset.
+        Fetch and parse __NEXT_DATA__ for a dataset page.
+
+        The dataset pages are server-side rendered, so a plain HTTP GET
+        normally returns HTML that already contains the __NEXT_DATA__
+        script. Only when that misses (e.g. a bot challenge page) do we
+        fall back to a real browser.
 
         Args:
-            dataset: Dictionary containing dataset information
-            driver: Optional Selenium WebDriver instance
+            url: Dataset page URL
 
         Returns:
-            Updated dataset dictionary with files information
+            Parsed __NEXT_DATA__ dictionary, or None if not found
         """
-        url = dataset.get("dataset_url", "")
-        enriched = dataset.copy()
-
-        # Initialize file fields
-        enriched["files"] = []
-        enriched["files_found_count"] = 0
-        enriched["file_extraction_status"] = "failed"
-
-        driver_created = False
-        retry_count = 0
-
-        while retry_count < self.max_retries:
-            try:
-                # Use provided driver or create a new one
-                if driver is None:
-                    driver = self.setup_driver()
-                    driver_created = True
+        next_data = None
 
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            next_data = self.extract_next_data_json(response.text)
+        except requests.RequestException:
+            next_data = None
+
+        if next_data is None:
+            with self._driver_lock:
+                driver = self._get_driver()
                 if not driver:
                     raise Exception("Could not initialize browser")
-
-                # Navigate to URL
                 driver.set_page_load_timeout(self.timeout)
                 driver.get(url)
+                # With page_load_strategy='none', get() returns as soon as
+                # navigation starts - wait only for the one element we need
+                WebDriverWait(driver, self.timeout).until(
+                    lambda d: d.execute_script(
+                        "return document.getElementById('__NEXT_DATA__') !== null"))
+                try:
+                    # Read the script contents directly - one WebDriver
+                    # round-trip instead of serializing the whole DOM
+                    txt = driver.execute_script(
+                        "var e = document.getElementById('__NEXT_DATA__');"
+                        " return e ? e.textContent : null")
+                    next_data = _json_loads(txt) if txt else None
+                except Exception:
+                    next_data = self.extract_next_data_json(driver.page_source)
+
+        return next_data
+
+    def _replay_files(self, dataset, files):
+        """Reuse a previously extracted file list for a dataset record.
+
+        Replays the per-file counters so the summary matches a fresh run,
+        then records the result exactly like a live extraction.
+        """
+        with self._stats_lock:
+            for file_info in files:
+                file_title = file_info.file_title.lower()
+                if "microscope" in file_title:
+                    self.stats["microscope_images_found"] += 1
+                if "binned" in file_title:
+                    self.stats["binned_outputs_found"] += 1
+
+        return self._record_extraction(dataset, files)
+
+    def _record_extraction(self, dataset, files):
+        """Build the enriched record for a dataset and update statistics."""
+        # At least microscope image + one binned output counts as success
+        status = 'success' if len(files) >= 2 else 'partial' if files else 'failed'
+
+        with self._stats_lock:
+            self.stats[self._STATUS_KEYS[status]] += 1
+            self.stats["total_files_extracted"] += len(files)
+
+        # One shallow merge on return instead of copying the record up front
+        return {**dataset,
+                'files': files,
+                'files_found_count': len(files),
+                'file_extraction_status': status}
+
+    def extract_single_dataset(self, dataset):
+        """
+        Extract file information for a single dataset.
 
-                # Extract file information
-                files = self.extract_file_info(driver)
+        Args:
+            dataset: Dictionary containing dataset information
 
-                enriched["files"] = files
-                enriched["files_found_count"] = len(files)
+        Returns:
+            Updated dataset dictionary with files information
+        """
+        url = dataset.get("dataset_url", "")
 
-                # Determine status
-                if len(files) >= 2:  # At least microscope image + one binned output
-                    enriched["file_extraction_status"] = "success"
-                    self.stats["successful"] += 1
-                elif len(files) > 0:
-                    enriched["file_extraction_status"] = "partial"
-                    self.stats["partial"] += 1
-                else:
-                    enriched["file_extraction_status"] = "failed"
-                    self.stats["failed"] += 1
+        resumed = self._resume_records.get(url)
+        if resumed is not None:
+            try:
+                files = [FileInfo(**entry) for entry in resumed.get('files', [])]
+            except TypeError:
+                files = None  # journal written by an older schema
+            if files is not None:
+                return self._replay_files(dataset, files)
 
-                self.stats["total_files_extracted"] += len(files)
+        cached_files = self._cache_get(url)
+        if cached_files is not None:
+            return self._replay_files(dataset, cached_files)
 
-                # Success
-                break
+        try:
+            next_data = self.fetch_next_data(url)
 
-            except Exception as e:
-                retry_count += 1
-                if retry_count >= self.max_retries:
-                    tqdm.write(f"  ✗ Failed to extract files from {url}: {str(e)[:100]}", file=sys.stderr)
-                    self.stats["failed"] += 1
-                else:
-                    time.sleep(2 ** retry_count)  # Exponential backoff
+            # Extract file information
+            files = self.extract_file_info(next_data)
 
-            finally:
-                # Only quit if we created the driver
-                if driver_created and driver:
-                    driver.quit()
+            # Only successful lookups are cached, so a transient miss
+            # is retried on the next run instead of being pinned
+            if files:
+                self._cache_put(url, files)
+
+            return self._record_extraction(dataset, files)
 
-        return enriched
+        except Exception as e:
+            # HTTP retries with exponential backoff already ran inside the
+            # session's Retry adapter; whatever reaches here is final
+            tqdm.write(f"  ✗ Failed to extract files from {url}: {str(e)[:100]}", file=sys.stderr)
+            with self._stats_lock:
+                self.stats["failed"] += 1
+
+            return {**dataset,
+                    'files': [],
+                    'files_found_count': 0,
+                    'file_extraction_status': 'failed'}
 
     def extract_all_datasets(self):
         """Extract file information for all datasets."""
@@ -428,33 +666,51 @@ class FileExtractor:
         print("EXTRACTING FILE INFORMATION", file=sys.stderr, flush=True)
         print("="*60, file=sys.stderr, flush=True)
 
-        enriched_datasets = []
         total = len(self.json_data)
+        enriched_datasets = [None] * total
 
-        with tqdm(total=total, desc="Setting up browser", unit="dataset", file=sys.stderr) as pbar:
-            driver = self.setup_driver()
-            if not driver:
-                pbar.write("✗ Failed to setup Chrome driver, cannot proceed with file extraction")
-                return []
+        # Append each finished dataset to the JSONL journal as it completes;
+        # a crash loses at most the datasets still in flight
+        journal = open(self.journal_path, 'a', encoding='utf-8')
 
+        with tqdm(total=total, desc="Extracting files", unit="dataset", file=sys.stderr) as pbar:
             try:
-                pbar.set_description("Extracting files")
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    futures = {
+                        executor.submit(self.extract_single_dataset, dataset): idx
+                        for idx, dataset in enumerate(self.json_data)
+                    }
 
-                for idx, dataset in enumerate(self.json_data, 1):
-                    dataset_name = dataset.get('dataset_name', 'Unknown')[:50]
-                    pbar.set_postfix_str(f"{dataset_name}...")
+                    for future in as_completed(futures):
+                        idx = futures[future]
+                        enriched = future.result()
+                        # Keep results in input order regardless of completion order
+                        enriched_datasets[idx] = enriched
 
-                    enriched = self.extract_single_dataset(dataset, driver)
-                    enriched_datasets.append(enriched)
+                        # Resumed records are already journaled
+                        url = enriched.get('dataset_url', '')
+                        if url not in self._resume_records:
+                            record = {**enriched,
+                                      'files': [f._asdict() for f in enriched.get('files', [])]}
+                            journal.write(json.dumps(record) + '\n')
+                            journal.flush()
 
-                    # Update progress bar
-                    status = "✓" if enriched.get("file_extraction_status") == "success" else "⚠" if enriched.get("file_extraction_status") == "partial" else "✗"
-                    pbar.set_description(f"Extracting files [{status}]")
-                    pbar.update(1)
+                        dataset_name = enriched.get('dataset_name', 'Unknown')[:50]
+                        pbar.set_postfix_str(f"{dataset_name}...")
+
+                        # Update progress bar
+                        status = "✓" if enriched.get("file_extraction_status") == "success" else "⚠" if enriched.get("file_extraction_status") == "partial" else "✗"
+                        pbar.set_description(f"Extracting files [{status}]")
+                        pbar.update(1)
 
             finally:
-                if driver:
-                    driver.quit()
+                journal.close()
+                if self.driver:
+                    self.driver.quit()
+                    self.driver = None
+                if self.cache is not None:
+                    self.cache.close()
+                    self.cache = None
 
         return enriched_datasets
 
@@ -469,45 +725,56 @@ class FileExtractor:
         print("SAVING ENRICHED DATA WITH FILE INFORMATION", file=sys.stderr)
         print("="*60, file=sys.stderr)
 
-        # Save JSON (with files array)
-        with open(self.json_path, 'w', encoding='utf-8') as f:
-            json.dump(enriched_datasets, f, indent=2, ensure_ascii=False)
+        # Save JSON (with files array) - FileInfo entries become dicts only
+        # here, at the final dump (orjson would render them as arrays)
+        serializable = [
+            {**dataset, 'files': [f._asdict() for f in dataset.get('files', [])]}
+            for dataset in enriched_datasets
+        ]
+        _write_json(self.json_path, serializable)
         print(f"✓ JSON updated: {self.json_path}", file=sys.stderr)
 
         # Convert to DataFrame for Excel
-        # Flatten the files array into columns
-        flattened_data = []
-        for dataset in enriched_datasets:
-            row = {k: v for k, v in dataset.items() if k != 'files'}
-
-            # Add file columns
-            files = dataset.get('files', [])
-            for idx, file_info in enumerate(files, 1):
-                row[f'file_{idx}_type'] = file_info.get('file_type', '')
-                row[f'file_{idx}_filename'] = file_info.get('filename', '')
-                row[f'file_{idx}_size'] = file_info.get('size', '')
-                row[f'file_{idx}_md5sum'] = file_info.get('md5sum', '')
-                row[f'file_{idx}_url'] = file_info.get('url', '')
-
-            flattened_data.append(row)
-
-        df = pd.DataFrame(flattened_data)
-
-        # Save to Excel
-        with pd.ExcelWriter(self.excel_path, engine='openpyxl') as writer:
+        # Flatten the files array into file_{i}_* columns with vectorized
+        # pandas operations instead of building per-row dicts
+        df = pd.DataFrame(enriched_datasets)
+        if 'files' in df.columns:
+            exploded = df.pop('files').explode().dropna()
+            if len(exploded):
+                # Output column name per raw field, in the historical order
+                field_names = {'file_type': 'type', 'filename': 'filename',
+                               'size': 'size', 'md5sum': 'md5sum', 'url': 'url'}
+
+                file_df = pd.DataFrame(exploded.tolist(), index=exploded.index)
+                file_df = file_df.reindex(columns=list(field_names)).fillna('')
+                file_df['file_no'] = file_df.groupby(level=0).cumcount() + 1
+
+                wide = file_df.set_index('file_no', append=True).unstack('file_no')
+                # All fields of file 1, then all fields of file 2, ...
+                wide = wide.reindex(columns=pd.MultiIndex.from_tuples([
+                    (field, num)
+                    for num in range(1, int(file_df['file_no'].max()) + 1)
+                    for field in field_names
+                ]))
+                wide.columns = [f'file_{num}_{field_names[field]}'
+                                for field, num in wide.columns]
+                df = df.join(wide)
+
+        # Save to Excel - constant_memory mode streams rows to disk instead
+        # of holding the whole workbook in memory
+        with pd.ExcelWriter(self.excel_path, engine='xlsxwriter',
+                            engine_kwargs={'options': {'constant_memory': True}}) as writer:
             df.to_excel(writer, index=False, sheet_name='Enriched Datasets')
 
             # Get the worksheet
             worksheet = writer.sheets['Enriched Datasets']
 
-            # Auto-adjust column widths
-            for idx, col in enumerate(df.columns, 1):
-                max_length = max(
-                    df[col].astype(str).apply(len).max(),
-                    len(col)
-                )
-                adjusted_width = min(max_length + 2, 100)
-                worksheet.column_dimensions[worksheet.cell(row=1, column=idx).column_letter].width = adjusted_width
+            # Auto-adjust column widths (vectorized, one pass over the frame)
+            content_widths = df.astype(str).apply(lambda s: s.str.len().max()).fillna(0)
+            header_widths = pd.Series([len(col) for col in df.columns], index=df.columns)
+            widths = content_widths.combine(header_widths, max).clip(upper=98).add(2).astype(int)
+            for idx, width in enumerate(widths):
+                worksheet.set_column(idx, idx, width)
 
         print(f"✓ Excel updated: {self.excel_path}", file=sys.stderr)
 
@@ -528,7 +795,7 @@ class FileExtractor:
         print("="*60, file=sys.stderr)
 
 
-def main():
+def main(argv=None):
     """Main function to run the file extractor."""
     parser = argparse.ArgumentParser(description='Extract file download information from 10X Genomics datasets')
     parser.add_argument('--json-path', type=str,
@@ -543,8 +810,18 @@ def main():
                        help='Max retries for failed page loads')
     parser.add_argument('--timeout', type=int, default=30,
                        help='Timeout for page loads in seconds')
-
-    args = parser.parse_args()
+    parser.add_argument('--workers', type=int, default=4,
+                       help='Number of concurrent extraction threads (default: 4)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Disable the per-URL file listing cache')
+    parser.add_argument('--refresh', action='store_true',
+                       help='Ignore cached entries but still record fresh ones')
+    parser.add_argument('--max-age', type=int, default=7 * 86400,
+                       help='Maximum age of cached entries in seconds (default: 7 days)')
+    parser.add_argument('--resume', action='store_true',
+                       help='Reuse results journaled by an interrupted run')
+
+    args = parser.parse_args(argv)
 
     # Build paths - either from direct paths or from name + base_output_dir
     if args.json_path and args.excel_path:
@@ -571,7 +848,12 @@ def main():
         sys.exit(2)
 
     # Initialize extractor
-    extractor = FileExtractor(json_path, excel_path, args.max_retries, args.timeout)
+    extractor = FileExtractor(json_path, excel_path, args.max_retries, args.timeout,
+                              workers=args.workers,
+                              use_cache=not args.no_cache,
+                              refresh_cache=args.refresh,
+                              cache_max_age=args.max_age,
+                              resume=args.resume)
 
     # Load input data
     if not extractor.load_input_data():
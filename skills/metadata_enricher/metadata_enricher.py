@@ -6,13 +6,20 @@ Enriches validated dataset information by extracting additional metadata
 from each dataset's detail page, including imaging parameters and sample information.
 """
 
+import asyncio
 import json
 import sys
 import os
 import argparse
 import re
+import sqlite3
+import zlib
+from collections import Counter
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from types import MappingProxyType
 from pathlib import Path
+import httpx
 import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -22,13 +29,161 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 import time
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json works everywhere
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON with orjson when available (much faster on large blobs)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json(path, obj):
+    """Write obj to path as indented UTF-8 JSON, via orjson when available."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+
+
+# Compiled once - this runs against every fetched page
+NEXT_DATA_RE = re.compile(
+    r'<script id="__NEXT_DATA__" type="application/json">(.+?)</script>',
+    re.DOTALL
+)
+
+# Bytes twin of NEXT_DATA_RE for HTTP responses - matching on the raw
+# body skips decoding megabytes of HTML just to find a JSON island
+NEXT_DATA_RE_B = re.compile(
+    rb'<script id="__NEXT_DATA__" type="application/json">(.+?)</script>',
+    re.DOTALL
+)
+
+
+# Markdown structure of dataset['body']: "**Section**" headers followed by
+# free text or "- key: value" bullets. One pass with these beats a
+# per-line state machine over every dataset.
+SECTION_RE = re.compile(
+    r'\*\*(?P<name>[^*]+)\*\*\s*\n(?P<body>.*?)(?=\n\*\*|\Z)',
+    re.DOTALL
+)
+KV_RE = re.compile(r'^\s*(?:- )?([^:\n]+):\s*(.+)$', re.MULTILINE)
+
+# Keyword alternations for the page-text fallbacks: one C-level scan over
+# the whole text instead of per-line substring checks, with a canonical
+# label per matched keyword
+IMG_TYPE_RE = re.compile(
+    r'\b(h&e|hematoxylin|immunofluorescence|if|ihc|immunohistochemistry)\b', re.IGNORECASE)
+_IMG_TYPE_CANON = {
+    'h&e': 'H&E', 'hematoxylin': 'H&E',
+    'if': 'IF', 'immunofluorescence': 'IF',
+    'ihc': 'IHC', 'immunohistochemistry': 'IHC'
+}
+
+DISEASE_RE = re.compile(r'\b(healthy|normal|cancer|tumor|carcinoma)\b', re.IGNORECASE)
+_DISEASE_CANON = {
+    'healthy': 'Healthy', 'normal': 'Healthy',
+    'cancer': 'Cancer', 'tumor': 'Cancer', 'carcinoma': 'Cancer'
+}
+
+PRESERVATION_RE = re.compile(r'\b(ffpe|formalin|fresh frozen|frozen)\b', re.IGNORECASE)
+_PRESERVATION_CANON = {
+    'ffpe': 'FFPE', 'formalin': 'FFPE',
+    'fresh frozen': 'Fresh Frozen', 'frozen': 'Fresh Frozen'
+}
+
+@dataclass(slots=True)
+class ImagingFields:
+    """Imaging metadata extracted from a dataset page."""
+    biomaterials: str = ""
+    sample_preparation: str = ""
+    image_type: str = ""
+    microscope: str = ""
+    objective_magnification: str = ""
+    numerical_aperture: str = ""
+    scopeled_light_source: str = ""
+    camera: str = ""
+    exposure: str = ""
+
+
+@dataclass(slots=True)
+class SampleFields:
+    """Sample metadata extracted from a dataset page."""
+    anatomical_entity: str = ""
+    preservation_method: str = ""
+    disease_state: str = ""
+    biomaterial_type: str = ""
+    donor_count: str = ""
+    date_published: str = ""
+
+
+# Map variations of field names to standard fields
+IMAGING_FIELD_MAPPINGS = {
+    "biomaterials": ["biomaterial", "biomaterials", "bio materials"],
+    "sample_preparation": ["sample preparation", "sample prep", "preparation"],
+    "image_type": ["image type", "imaging type", "staining", "stain"],
+    "microscope": ["microscope", "imaging system"],
+    "objective_magnification": ["magnification", "objective magnification", "objective mag"],
+    "numerical_aperture": ["numerical aperture", "na", "n.a."],
+    "scopeled_light_source": ["light source", "scopeled", "led source", "illumination"],
+    "camera": ["camera", "detector"],
+    "exposure": ["exposure", "exposure time", "exposure settings"]
+}
+
+SAMPLE_FIELD_MAPPINGS = {
+    "anatomical_entity": ["anatomical entity", "anatomical location", "tissue", "organ"],
+    "preservation_method": ["preservation", "preservation method", "fixation"],
+    "disease_state": ["disease", "disease state", "condition", "pathology"],
+    "biomaterial_type": ["biomaterial type", "material type", "sample type"],
+    "donor_count": ["donor", "donor count", "donors", "number of donors"],
+    "date_published": ["date published", "published", "publication date", "release date"]
+}
+
+# Flat (variation, field) pairs resolved once at import, longest variation
+# first so the most specific name wins - per-key matching is then a single
+# short scan instead of rebuilding the mapping dict on every call
+_IMAGING_LOOKUP = sorted(
+    ((variation, field)
+     for field, variations in IMAGING_FIELD_MAPPINGS.items()
+     for variation in variations),
+    key=lambda pair: -len(pair[0])
+)
+_SAMPLE_LOOKUP = sorted(
+    ((variation, field)
+     for field, variations in SAMPLE_FIELD_MAPPINGS.items()
+     for variation in variations),
+    key=lambda pair: -len(pair[0])
+)
+
 
 class MetadataEnricher:
     """Enriches dataset information with additional metadata from detail pages."""
 
+    # Resolved ChromeDriver path, shared across instances so the
+    # webdriver-manager version check runs at most once per process
+    _driver_path = None
+
+    # Every field the enrichment step adds to a dataset record
+    ENRICHED_FIELDS = (
+        "biomaterials", "sample_preparation", "image_type", "microscope",
+        "objective_magnification", "numerical_aperture", "scopeled_light_source",
+        "camera", "exposure", "anatomical_entity", "preservation_method",
+        "disease_state", "biomaterial_type", "donor_count", "date_published"
+    )
+
+    # Read-only defaults built once; records start as a single-pass merge
+    # of this template with the incoming dataset
+    NEW_FIELDS_TEMPLATE = MappingProxyType(dict.fromkeys(ENRICHED_FIELDS, ""))
+
     def __init__(self, json_path, excel_path, output_dir, name, max_retries=3, timeout=30, max_workers=3):
         """
         Initialize the enricher.
@@ -53,13 +208,52 @@ class MetadataEnricher:
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Statistics
+        # Statistics (the success/fail counters are also bumped from the
+        # fallback worker threads, hence the lock)
         self.stats = {
             "total_datasets": 0,
             "successful": 0,
             "failed": 0,
-            "field_completion": {}
+            "field_completion": Counter(dict.fromkeys(self.ENRICHED_FIELDS, 0))
         }
+        self._stats_lock = threading.Lock()
+
+        # Conditional-GET page cache: parsed __NEXT_DATA__ per URL plus the
+        # server ETag, so re-runs revalidate with cheap 304s instead of
+        # re-downloading every page body
+        self._cache = self._open_cache()
+
+    def _open_cache(self):
+        """Open (creating if needed) the sqlite page cache."""
+        conn = sqlite3.connect(self.output_dir / 'enrich_cache.sqlite')
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT PRIMARY KEY, etag TEXT, body BLOB)")
+        conn.commit()
+        return conn
+
+    def _cache_get(self, url):
+        """Return (etag, next_data) for url, or (None, None) on a miss."""
+        row = self._cache.execute(
+            "SELECT etag, body FROM pages WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return None, None
+        try:
+            return row[0], _json_loads(zlib.decompress(row[1]))
+        except (zlib.error, ValueError):
+            # Corrupt entry - treat as a miss and let the fetch overwrite it
+            return None, None
+
+    def _cache_put(self, url, etag, next_data):
+        """Store the server ETag and compressed __NEXT_DATA__ for url."""
+        if orjson is not None:
+            body = zlib.compress(orjson.dumps(next_data))
+        else:
+            body = zlib.compress(json.dumps(next_data).encode('utf-8'))
+        self._cache.execute(
+            "INSERT OR REPLACE INTO pages (url, etag, body) VALUES (?, ?, ?)",
+            (url, etag, body))
+        self._cache.commit()
 
     def load_input_data(self):
         """Load validated JSON and Excel data."""
@@ -67,8 +261,7 @@ class MetadataEnricher:
 
         try:
             # Load JSON
-            with open(self.json_path, 'r', encoding='utf-8') as f:
-                self.json_data = json.load(f)
+            self.json_data = _json_loads(self.json_path.read_bytes())
             print(f"✓ Loaded JSON: {len(self.json_data)} entries", file=sys.stderr, flush=True)
 
             # Load Excel (keep_default_na=False to preserve "N/A" as literal string)
@@ -92,39 +285,47 @@ class MetadataEnricher:
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--window-size=1920,1080')
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        # Return from get() as soon as navigation starts; the explicit wait
+        # on the __NEXT_DATA__ element decides when the page is ready
+        chrome_options.page_load_strategy = 'none'
+        # The enricher only reads the embedded __NEXT_DATA__ JSON, so skip
+        # downloading and decoding images entirely
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+        })
 
         try:
-            service = Service(ChromeDriverManager().install())
+            if MetadataEnricher._driver_path is None:
+                # CHROMEDRIVER_PATH pins a specific binary (useful in CI)
+                MetadataEnricher._driver_path = (os.environ.get('CHROMEDRIVER_PATH')
+                                                 or ChromeDriverManager().install())
+            service = Service(MetadataEnricher._driver_path)
             driver = webdriver.Chrome(service=service, options=chrome_options)
             return driver
         except Exception as e:
             tqdm.write(f"✗ Failed to setup Chrome driver: {e}", file=sys.stderr)
             return None
 
-    def extract_next_data_json(self, driver):
+    def extract_next_data_json(self, page_source):
         """
         Extract __NEXT_DATA__ JSON from the page source.
 
         10X Genomics uses Next.js which embeds data in a JSON script tag.
 
         Args:
-            driver: Selenium WebDriver instance
+            page_source: Page HTML as a string
 
         Returns:
             Dictionary with parsed JSON data, or None if not found
         """
         try:
-            # Get page source
-            page_source = driver.page_source
-
             # Find the __NEXT_DATA__ script tag
-            import re
-            pattern = r'<script id="__NEXT_DATA__" type="application/json">(.+?)</script>'
-            match = re.search(pattern, page_source, re.DOTALL)
+            match = NEXT_DATA_RE.search(page_source)
 
             if match:
                 json_str = match.group(1)
-                data = json.loads(json_str)
+                data = _json_loads(json_str)
                 return data
             else:
                 # Silently return None - not all pages will have this data
@@ -134,37 +335,19 @@ class MetadataEnricher:
             # Silently return None - extraction errors are expected for some pages
             return None
 
-    def extract_imaging_metadata(self, driver):
+    def _imaging_from_next_data(self, next_data):
         """
-        Extract imaging section metadata from __NEXT_DATA__ JSON.
+        Extract imaging section metadata from parsed __NEXT_DATA__ JSON.
 
         Args:
-            driver: Selenium WebDriver instance
+            next_data: Parsed __NEXT_DATA__ dictionary (or None)
 
         Returns:
-            Dictionary with imaging metadata
+            ImagingFields with any values found (others stay empty)
         """
-        imaging_data = {
-            "biomaterials": "",
-            "sample_preparation": "",
-            "image_type": "",
-            "microscope": "",
-            "objective_magnification": "",
-            "numerical_aperture": "",
-            "scopeled_light_source": "",
-            "camera": "",
-            "exposure": ""
-        }
+        imaging_data = ImagingFields()
 
         try:
-            # Wait for page content to load
-            wait = WebDriverWait(driver, 10)
-            wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            time.sleep(2)  # Additional time for dynamic content
-
-            # Extract the __NEXT_DATA__ JSON
-            next_data = self.extract_next_data_json(driver)
-
             if next_data:
                 # Navigate to the dataset information
                 dataset = next_data.get('props', {}).get('pageProps', {}).get('dataset', {})
@@ -173,45 +356,28 @@ class MetadataEnricher:
                 body_text = dataset.get('body', '')
 
                 if body_text:
-                    # Parse the body text for imaging parameters
-                    lines = body_text.split('\n')
-                    current_section = None
-
-                    for line in lines:
-                        line = line.strip()
-
-                        # Track which section we're in
-                        if line.startswith('**Biomaterials**'):
-                            current_section = 'biomaterials'
-                            continue
-                        elif line.startswith('**Sample preparation**'):
-                            current_section = 'sample_preparation'
-                            continue
-                        elif line.startswith('**Imaging**'):
-                            current_section = 'imaging'
-                            continue
-                        elif line.startswith('**'):
-                            current_section = None
-                            continue
-
-                        # Extract content based on section
-                        if current_section == 'biomaterials' and line:
-                            if not imaging_data["biomaterials"]:
-                                imaging_data["biomaterials"] = line
-
-                        elif current_section == 'sample_preparation' and line:
-                            if not imaging_data["sample_preparation"]:
-                                imaging_data["sample_preparation"] = line
-
-                        elif current_section == 'imaging' and ':' in line:
-                            # Parse key-value pairs in imaging section
-                            if line.startswith('- '):
-                                line = line[2:]  # Remove bullet point
-                            parts = line.split(':', 1)
-                            if len(parts) == 2:
-                                key = parts[0].strip().lower()
-                                value = parts[1].strip()
-                                self._map_imaging_field(key, value, imaging_data)
+                    # Walk the Markdown sections in one structured pass
+                    for section in SECTION_RE.finditer(body_text):
+                        section_name = section.group('name').strip().lower()
+                        section_body = section.group('body')
+
+                        if section_name == 'biomaterials':
+                            if not imaging_data.biomaterials:
+                                first_line = section_body.strip().split('\n', 1)[0].strip()
+                                if first_line:
+                                    imaging_data.biomaterials = first_line
+
+                        elif section_name == 'sample preparation':
+                            if not imaging_data.sample_preparation:
+                                first_line = section_body.strip().split('\n', 1)[0].strip()
+                                if first_line:
+                                    imaging_data.sample_preparation = first_line
+
+                        elif section_name == 'imaging':
+                            # Key-value bullets in the imaging section
+                            for key, value in KV_RE.findall(section_body):
+                                self._map_imaging_field(key.strip().lower(),
+                                                        value.strip(), imaging_data)
 
         except Exception as e:
             # Silently return partial data - extraction errors are expected
@@ -226,28 +392,15 @@ class MetadataEnricher:
         Args:
             key: Field name (lowercase)
             value: Field value
-            imaging_data: Dictionary to update
+            imaging_data: ImagingFields to update
         """
         if not value or value == 'N/A':
             return
 
-        # Map variations of field names to standard fields
-        field_mappings = {
-            "biomaterials": ["biomaterial", "biomaterials", "bio materials"],
-            "sample_preparation": ["sample preparation", "sample prep", "preparation"],
-            "image_type": ["image type", "imaging type", "staining", "stain"],
-            "microscope": ["microscope", "imaging system"],
-            "objective_magnification": ["magnification", "objective magnification", "objective mag"],
-            "numerical_aperture": ["numerical aperture", "na", "n.a."],
-            "scopeled_light_source": ["light source", "scopeled", "led source", "illumination"],
-            "camera": ["camera", "detector"],
-            "exposure": ["exposure", "exposure time", "exposure settings"]
-        }
-
-        for field, variations in field_mappings.items():
-            if any(variation in key for variation in variations):
-                if not imaging_data[field]:  # Only update if empty
-                    imaging_data[field] = value
+        for variation, field in _IMAGING_LOOKUP:
+            if variation in key:
+                if not getattr(imaging_data, field):  # Only update if empty
+                    setattr(imaging_data, field, value)
                 break
 
     def _extract_from_page_text(self, page_text, imaging_data):
@@ -256,47 +409,27 @@ class MetadataEnricher:
 
         Args:
             page_text: Full page text content
-            imaging_data: Dictionary to update
+            imaging_data: ImagingFields to update
         """
-        lines = page_text.split('\n')
-
-        # Look for H&E, IF, IHC, etc.
-        if not imaging_data["image_type"]:
-            for line in lines:
-                line_lower = line.lower()
-                if 'h&e' in line_lower or 'hematoxylin' in line_lower:
-                    imaging_data["image_type"] = "H&E"
-                    break
-                elif 'if' in line_lower or 'immunofluorescence' in line_lower:
-                    imaging_data["image_type"] = "IF"
-                    break
-                elif 'ihc' in line_lower or 'immunohistochemistry' in line_lower:
-                    imaging_data["image_type"] = "IHC"
-                    break
+        # Look for H&E, IF, IHC, etc. - one scan over the full text
+        if not imaging_data.image_type:
+            match = IMG_TYPE_RE.search(page_text)
+            if match:
+                imaging_data.image_type = _IMG_TYPE_CANON[match.group(1).lower()]
 
-    def extract_sample_info(self, driver):
+    def _sample_from_next_data(self, next_data):
         """
-        Extract sample information from __NEXT_DATA__ JSON.
+        Extract sample information from parsed __NEXT_DATA__ JSON.
 
         Args:
-            driver: Selenium WebDriver instance
+            next_data: Parsed __NEXT_DATA__ dictionary (or None)
 
         Returns:
-            Dictionary with sample information
+            SampleFields with any values found (others stay empty)
         """
-        sample_info = {
-            "anatomical_entity": "",
-            "preservation_method": "",
-            "disease_state": "",
-            "biomaterial_type": "",
-            "donor_count": "",
-            "date_published": ""
-        }
+        sample_info = SampleFields()
 
         try:
-            # Extract the __NEXT_DATA__ JSON
-            next_data = self.extract_next_data_json(driver)
-
             if next_data:
                 # Navigate to the dataset information
                 dataset = next_data.get('props', {}).get('pageProps', {}).get('dataset', {})
@@ -305,38 +438,33 @@ class MetadataEnricher:
                 # Anatomical Entity
                 anatomical_entities = dataset.get('anatomicalEntities', [])
                 if anatomical_entities:
-                    sample_info["anatomical_entity"] = ", ".join(anatomical_entities)
+                    sample_info.anatomical_entity = ", ".join(anatomical_entities)
 
                 # Preservation Method
                 preservation_methods = dataset.get('preservationMethods', [])
                 if preservation_methods:
-                    sample_info["preservation_method"] = ", ".join(preservation_methods)
+                    sample_info.preservation_method = ", ".join(preservation_methods)
 
                 # Disease State
                 disease_states = dataset.get('diseaseStates', [])
                 if disease_states:
-                    sample_info["disease_state"] = ", ".join(disease_states)
+                    sample_info.disease_state = ", ".join(disease_states)
 
                 # Biomaterial Type
                 biomaterial_types = dataset.get('biomaterialTypes', [])
                 if biomaterial_types:
-                    sample_info["biomaterial_type"] = ", ".join(biomaterial_types)
+                    sample_info.biomaterial_type = ", ".join(biomaterial_types)
 
                 # Donor Count
                 donor_count = dataset.get('donorCount', '')
                 if donor_count:
-                    sample_info["donor_count"] = str(donor_count)
+                    sample_info.donor_count = str(donor_count)
 
-                # Date Published
+                # Date Published - kept as the raw ISO timestamp here;
+                # save_enriched_data reformats the whole column in one pass
                 published_at = dataset.get('publishedAt', '')
                 if published_at:
-                    # Convert ISO date to readable format
-                    from datetime import datetime
-                    try:
-                        dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                        sample_info["date_published"] = dt.strftime("%Y-%m-%d")
-                    except:
-                        sample_info["date_published"] = published_at
+                    sample_info.date_published = published_at
 
         except Exception as e:
             # Silently return partial data - extraction errors are expected
@@ -351,24 +479,15 @@ class MetadataEnricher:
         Args:
             key: Field name (lowercase)
             value: Field value
-            sample_info: Dictionary to update
+            sample_info: SampleFields to update
         """
         if not value or value == 'N/A':
             return
 
-        field_mappings = {
-            "anatomical_entity": ["anatomical entity", "anatomical location", "tissue", "organ"],
-            "preservation_method": ["preservation", "preservation method", "fixation"],
-            "disease_state": ["disease", "disease state", "condition", "pathology"],
-            "biomaterial_type": ["biomaterial type", "material type", "sample type"],
-            "donor_count": ["donor", "donor count", "donors", "number of donors"],
-            "date_published": ["date published", "published", "publication date", "release date"]
-        }
-
-        for field, variations in field_mappings.items():
-            if any(variation in key for variation in variations):
-                if not sample_info[field]:  # Only update if empty
-                    sample_info[field] = value
+        for variation, field in _SAMPLE_LOOKUP:
+            if variation in key:
+                if not getattr(sample_info, field):  # Only update if empty
+                    setattr(sample_info, field, value)
                 break
 
     def _extract_sample_from_page_text(self, page_text, sample_info):
@@ -377,31 +496,19 @@ class MetadataEnricher:
 
         Args:
             page_text: Full page text
-            sample_info: Dictionary to update
+            sample_info: SampleFields to update
         """
-        lines = page_text.split('\n')
-
         # Disease state detection
-        if not sample_info["disease_state"]:
-            for line in lines:
-                line_lower = line.lower()
-                if 'healthy' in line_lower or 'normal' in line_lower:
-                    sample_info["disease_state"] = "Healthy"
-                    break
-                elif 'cancer' in line_lower or 'tumor' in line_lower or 'carcinoma' in line_lower:
-                    sample_info["disease_state"] = "Cancer"
-                    break
+        if not sample_info.disease_state:
+            match = DISEASE_RE.search(page_text)
+            if match:
+                sample_info.disease_state = _DISEASE_CANON[match.group(1).lower()]
 
         # Preservation method
-        if not sample_info["preservation_method"]:
-            for line in lines:
-                line_lower = line.lower()
-                if 'ffpe' in line_lower or 'formalin' in line_lower:
-                    sample_info["preservation_method"] = "FFPE"
-                    break
-                elif 'fresh frozen' in line_lower or 'frozen' in line_lower:
-                    sample_info["preservation_method"] = "Fresh Frozen"
-                    break
+        if not sample_info.preservation_method:
+            match = PRESERVATION_RE.search(page_text)
+            if match:
+                sample_info.preservation_method = _PRESERVATION_CANON[match.group(1).lower()]
 
     def enrich_single_dataset(self, dataset, driver=None):
         """
@@ -415,71 +522,120 @@ class MetadataEnricher:
             Enriched dataset dictionary
         """
         url = dataset.get("dataset_url", "")
-        enriched = dataset.copy()
-
-        # Initialize new fields
-        new_fields = {
-            "biomaterials": "",
-            "sample_preparation": "",
-            "image_type": "",
-            "microscope": "",
-            "objective_magnification": "",
-            "numerical_aperture": "",
-            "scopeled_light_source": "",
-            "camera": "",
-            "exposure": "",
-            "anatomical_entity": "",
-            "preservation_method": "",
-            "disease_state": "",
-            "biomaterial_type": "",
-            "donor_count": "",
-            "date_published": ""
-        }
-
-        enriched.update(new_fields)
+        enriched = {**self.NEW_FIELDS_TEMPLATE, **dataset}
 
         driver_created = False
         retry_count = 0
 
-        while retry_count < self.max_retries:
-            try:
-                # Use provided driver or create a new one
-                if driver is None:
-                    driver = self.setup_driver()
-                    driver_created = True
-
-                if not driver:
-                    raise Exception("Could not initialize browser")
+        try:
+            while retry_count < self.max_retries:
+                try:
+                    # Use provided driver or create a new one
+                    if driver is None:
+                        driver = self.setup_driver()
+                        driver_created = True
+
+                    if not driver:
+                        raise Exception("Could not initialize browser")
+
+                    # Navigate to URL
+                    driver.set_page_load_timeout(self.timeout)
+                    driver.get(url)
+
+                    # Wait for the one element we read, then fetch and parse
+                    # __NEXT_DATA__ once and feed it to both extractors - a
+                    # single page_source transfer and JSON parse per page
+                    WebDriverWait(driver, self.timeout, poll_frequency=0.1).until(
+                        EC.presence_of_element_located((By.ID, "__NEXT_DATA__")))
+                    next_data = self.extract_next_data_json(driver.page_source)
+
+                    enriched.update(asdict(self._imaging_from_next_data(next_data)))
+                    enriched.update(asdict(self._sample_from_next_data(next_data)))
+
+                    # Success
+                    with self._stats_lock:
+                        self.stats["successful"] += 1
+                    break
 
-                # Navigate to URL
-                driver.set_page_load_timeout(self.timeout)
-                driver.get(url)
+                except Exception as e:
+                    retry_count += 1
+                    if retry_count >= self.max_retries:
+                        tqdm.write(f"  ✗ Failed to enrich {url}: {str(e)[:100]}", file=sys.stderr)
+                        with self._stats_lock:
+                            self.stats["failed"] += 1
+                    else:
+                        time.sleep(2 ** retry_count)  # Exponential backoff
+
+        finally:
+            # Quit our own driver once, after all retries; never tear down
+            # a caller-owned driver
+            if driver_created and driver:
+                driver.quit()
 
-                # Extract imaging metadata
-                imaging_data = self.extract_imaging_metadata(driver)
-                enriched.update(imaging_data)
+        return enriched
 
-                # Extract sample information
-                sample_info = self.extract_sample_info(driver)
-                enriched.update(sample_info)
+    async def _fetch_next_data(self, url, client, sem):
+        """
+        Fetch one dataset page over HTTP and parse its __NEXT_DATA__.
 
-                # Success
-                self.stats["successful"] += 1
-                break
+        Args:
+            url: Dataset page URL
+            client: Shared httpx.AsyncClient
+            sem: Semaphore bounding concurrent requests
 
-            except Exception as e:
-                retry_count += 1
-                if retry_count >= self.max_retries:
-                    tqdm.write(f"  ✗ Failed to enrich {url}: {str(e)[:100]}", file=sys.stderr)
-                    self.stats["failed"] += 1
-                else:
-                    time.sleep(2 ** retry_count)  # Exponential backoff
+        Returns:
+            Parsed __NEXT_DATA__ dictionary, or None if unavailable
+        """
+        try:
+            etag, cached = self._cache_get(url)
+            headers = {'If-None-Match': etag} if etag else None
+            async with sem:
+                response = await client.get(url, timeout=self.timeout,
+                                            follow_redirects=True,
+                                            headers=headers)
+            if response.status_code == 304 and cached is not None:
+                return cached
+            response.raise_for_status()
+            # Match on the undecoded body; JSON parsing handles the UTF-8
+            match = NEXT_DATA_RE_B.search(response.content)
+            next_data = _json_loads(match.group(1)) if match else None
+            # A payload without the dataset dict enriches nothing; hand
+            # that page to the browser for a second chance
+            if next_data and not next_data.get('props', {}).get(
+                    'pageProps', {}).get('dataset'):
+                return None
+            if next_data and response.headers.get('ETag'):
+                self._cache_put(url, response.headers['ETag'], next_data)
+            return next_data
+        except Exception as e:
+            # Leave this URL to the Selenium fallback
+            return None
 
-            finally:
-                # Only quit if we created the driver
-                if driver_created and driver:
-                    driver.quit()
+    async def _gather_next_data(self):
+        """Fetch __NEXT_DATA__ for every dataset concurrently over HTTP."""
+        sem = asyncio.Semaphore(self.max_workers)
+        limits = httpx.Limits(max_connections=self.max_workers * 4)
+        headers = {
+            'User-Agent': ('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
+                           'AppleWebKit/537.36 (KHTML, like Gecko) '
+                           'Chrome/120.0.0.0 Safari/537.36')
+        }
 
+        # Connect-level retries live in the transport; the Selenium path
+        # keeps its own retry loop for the pages HTTP cannot resolve
+        transport = httpx.AsyncHTTPTransport(retries=self.max_retries)
+        async with httpx.AsyncClient(limits=limits, headers=headers,
+                                     transport=transport) as client:
+            return await asyncio.gather(*[
+                self._fetch_next_data(dataset.get("dataset_url", ""), client, sem)
+                for dataset in self.json_data
+            ])
+
+    def _enrich_from_next_data(self, dataset, next_data):
+        """Build an enriched record from already-fetched __NEXT_DATA__."""
+        enriched = {**self.NEW_FIELDS_TEMPLATE, **dataset}
+        enriched.update(asdict(self._imaging_from_next_data(next_data)))
+        enriched.update(asdict(self._sample_from_next_data(next_data)))
         return enriched
 
     def enrich_all_datasets(self):
@@ -488,47 +644,58 @@ class MetadataEnricher:
         print("ENRICHING DATASETS WITH ADDITIONAL METADATA", file=sys.stderr, flush=True)
         print("="*60, file=sys.stderr, flush=True)
 
-        enriched_datasets = []
         total = len(self.json_data)
+        enriched_datasets = [None] * total
 
-        # Create progress bar immediately so it's visible during driver setup
-        with tqdm(total=total, desc="Setting up browser", unit="dataset", file=sys.stderr) as pbar:
-            # Create a single driver instance to reuse
-            driver = self.setup_driver()
-            if not driver:
-                pbar.write("✗ Failed to setup Chrome driver, cannot proceed with enrichment")
-                return []
-
-            try:
-                # Update progress bar description to show we're now enriching
-                pbar.set_description("Enriching datasets")
-
-                for idx, dataset in enumerate(self.json_data, 1):
-                    dataset_name = dataset.get('dataset_name', 'Unknown')[:50]
-                    pbar.set_postfix_str(f"{dataset_name}...")
-
-                    enriched = self.enrich_single_dataset(dataset, driver)
-                    enriched_datasets.append(enriched)
-
-                    # Update field completion statistics
-                    for field in ["biomaterials", "sample_preparation", "image_type", "microscope",
-                                 "objective_magnification", "numerical_aperture", "scopeled_light_source",
-                                 "camera", "exposure", "anatomical_entity", "preservation_method",
-                                 "disease_state", "biomaterial_type", "donor_count", "date_published"]:
-                        if field not in self.stats["field_completion"]:
-                            self.stats["field_completion"][field] = 0
-                        if enriched.get(field, ""):
-                            self.stats["field_completion"][field] += 1
-
-                    # Update progress bar with success/fail status
-                    status = "✓" if idx <= self.stats["successful"] else "✗"
-                    pbar.set_description(f"Enriching datasets [{status}]")
-                    pbar.update(1)
+        with tqdm(total=total, desc="Fetching pages", unit="dataset", file=sys.stderr) as pbar:
+            # The pages are server-side rendered, so a concurrent batch of
+            # plain HTTP requests resolves nearly every dataset; browsers
+            # are only started for pages the HTTP fetch could not parse
+            next_datas = asyncio.run(self._gather_next_data())
+
+            pbar.set_description("Enriching datasets")
 
-            finally:
-                # Clean up the driver
-                if driver:
-                    driver.quit()
+            fallback_indices = []
+            for idx, (dataset, next_data) in enumerate(zip(self.json_data, next_datas)):
+                if next_data is not None:
+                    enriched_datasets[idx] = self._enrich_from_next_data(dataset, next_data)
+                    self.stats["successful"] += 1
+                    pbar.update(1)
+                else:
+                    fallback_indices.append(idx)
+
+            if fallback_indices:
+                # Browser pool: max_workers threads, one lazily-created
+                # driver per thread (Selenium calls are I/O-bound, so this
+                # scales close to the number of browsers)
+                pbar.set_description("Enriching datasets [browser fallback]")
+                tls = threading.local()
+                pool_drivers = []
+                pool_lock = threading.Lock()
+
+                def enrich_with_thread_driver(idx):
+                    if getattr(tls, 'driver', None) is None:
+                        tls.driver = self.setup_driver()
+                        if tls.driver:
+                            with pool_lock:
+                                pool_drivers.append(tls.driver)
+                    return idx, self.enrich_single_dataset(self.json_data[idx], tls.driver)
+
+                workers = min(self.max_workers, len(fallback_indices))
+                try:
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        for idx, enriched in executor.map(enrich_with_thread_driver,
+                                                          fallback_indices):
+                            enriched_datasets[idx] = enriched
+                            pbar.update(1)
+                finally:
+                    for pool_driver in pool_drivers:
+                        pool_driver.quit()
+
+        # Update field completion statistics
+        for enriched in enriched_datasets:
+            self.stats["field_completion"].update(
+                field for field in self.ENRICHED_FIELDS if enriched.get(field, ""))
 
         return enriched_datasets
 
@@ -543,10 +710,24 @@ class MetadataEnricher:
         print("SAVING ENRICHED DATA", file=sys.stderr)
         print("="*60, file=sys.stderr)
 
+        # Reformat the raw ISO publish timestamps in one vectorized pass
+        # before anything is written, so the JSON, Excel and stats sidecar
+        # all carry the YYYY-MM-DD form; unparseable or empty values come
+        # out as empty strings
+        if any(d.get('date_published') for d in enriched_datasets):
+            formatted = (
+                pd.to_datetime(
+                    pd.Series([d.get('date_published', '') for d in enriched_datasets]),
+                    utc=True, errors='coerce')
+                .dt.strftime('%Y-%m-%d')
+                .fillna('')
+            )
+            for dataset, date_published in zip(enriched_datasets, formatted):
+                dataset['date_published'] = date_published
+
         # Save JSON
         json_output_path = self.output_dir / f"Data-{self.name}-Enriched.json"
-        with open(json_output_path, 'w', encoding='utf-8') as f:
-            json.dump(enriched_datasets, f, indent=2, ensure_ascii=False)
+        _write_json(json_output_path, enriched_datasets)
         print(f"✓ JSON saved to: {json_output_path}", file=sys.stderr)
 
         # Save Excel
@@ -572,21 +753,59 @@ class MetadataEnricher:
         available_columns = [col for col in column_order if col in df.columns]
         df = df[available_columns]
 
-        # Save to Excel with formatting
-        with pd.ExcelWriter(excel_output_path, engine='openpyxl') as writer:
+        # Save a small schema sidecar so consumers (e.g. the MCP server's
+        # fields_only path) can answer field queries without parsing the
+        # full enriched dump
+        schema_output_path = self.output_dir / f"Data-{self.name}-Schema.json"
+        schema = {
+            "fields": available_columns,
+            "original_fields": [c for c in original_columns if c in available_columns],
+            "enriched_fields": [c for c in available_columns if c not in original_columns]
+        }
+        _write_json(schema_output_path, schema)
+        print(f"✓ Schema saved to: {schema_output_path}", file=sys.stderr)
+
+        # Pre-compute field completion/distribution statistics once at
+        # write time so query tools can read them back instead of
+        # re-aggregating the full dump on every request
+        stats_output_path = self.output_dir / f"Data-{self.name}-Enriched.stats.json"
+        total = len(enriched_datasets)
+        field_stats = {}
+        for dataset in enriched_datasets:
+            for field, value in dataset.items():
+                entry = field_stats.setdefault(field, {"filled": 0, "value_distribution": {}})
+                if value:
+                    entry["filled"] += 1
+                    distribution = entry["value_distribution"]
+                    distribution[value] = distribution.get(value, 0) + 1
+        for entry in field_stats.values():
+            entry["total"] = total
+            entry["completion_rate"] = round(entry["filled"] / total * 100, 1) if total else 0.0
+            entry["unique_values_count"] = len(entry["value_distribution"])
+        stats_sidecar = {
+            "total_datasets": total,
+            "fields": list(field_stats),
+            "field_stats": field_stats
+        }
+        _write_json(stats_output_path, stats_sidecar)
+        print(f"✓ Field stats saved to: {stats_output_path}", file=sys.stderr)
+
+        # Save to Excel with formatting - constant_memory mode streams rows
+        # to disk instead of building the whole workbook in memory
+        with pd.ExcelWriter(excel_output_path, engine='xlsxwriter',
+                            engine_kwargs={'options': {'constant_memory': True}}) as writer:
             df.to_excel(writer, index=False, sheet_name='Enriched Datasets')
 
             # Get the worksheet
             worksheet = writer.sheets['Enriched Datasets']
 
-            # Auto-adjust column widths
-            for idx, col in enumerate(df.columns, 1):
-                max_length = max(
-                    df[col].astype(str).apply(len).max(),
-                    len(col)
-                )
-                adjusted_width = min(max_length + 2, 100)
-                worksheet.column_dimensions[worksheet.cell(row=1, column=idx).column_letter].width = adjusted_width
+            # Auto-adjust column widths - one str conversion up front and a
+            # vectorized length pass per column instead of Python-level len
+            # on every cell
+            str_df = df.astype(str)
+            for idx, col in enumerate(df.columns):
+                max_length = max(int(str_df[col].str.len().max() or 0), len(col))
+                worksheet.set_column(idx, idx, min(max_length + 2, 100))
 
         print(f"✓ Excel saved to: {excel_output_path}", file=sys.stderr)
 
@@ -608,29 +827,27 @@ class MetadataEnricher:
         print("="*60, file=sys.stderr)
 
 
-def main():
-    """Main function to run the enricher."""
-    parser = argparse.ArgumentParser(description='Enrich 10X Genomics dataset metadata')
-    parser.add_argument('--name', type=str, required=True,
-                       help='Run identifier (e.g., "10XGenomics-VisiumHD-Human")')
-    parser.add_argument('--base-output-dir', type=str, default='../../output',
-                       help='Base output directory (default: ../../output)')
-    parser.add_argument('--max-retries', type=int, default=3,
-                       help='Max retries for failed page loads')
-    parser.add_argument('--timeout', type=int, default=30,
-                       help='Timeout for page loads in seconds')
-    parser.add_argument('--parallel', type=int, default=3,
-                       help='Number of parallel browser instances')
+def run_enrichment(name, base_output_dir='../../output', max_retries=3, timeout=30, parallel=3):
+    """
+    Run a complete enrichment job for a named scraping run.
 
-    args = parser.parse_args()
+    Args:
+        name: Run identifier (e.g., "10XGenomics-VisiumHD-Human")
+        base_output_dir: Base output directory
+        max_retries: Max retries for failed page loads
+        timeout: Timeout for page loads in seconds
+        parallel: Number of parallel browser instances
 
+    Returns:
+        Dictionary with enrichment statistics (including exit_code)
+    """
     # Build paths based on name and base output directory
     script_dir = Path(__file__).parent
-    base_dir = script_dir.parent.parent / args.base_output_dir
-    run_dir = base_dir / args.name
+    base_dir = script_dir.parent.parent / base_output_dir
+    run_dir = base_dir / name
 
-    json_path = run_dir / 'output' / f'Data-{args.name}.json'
-    excel_path = run_dir / 'output' / f'Data-{args.name}.xlsx'
+    json_path = run_dir / 'output' / f'Data-{name}.json'
+    excel_path = run_dir / 'output' / f'Data-{name}.xlsx'
     output_dir = run_dir / 'enriched'
 
     print("="*60, file=sys.stderr, flush=True)
@@ -638,11 +855,12 @@ def main():
     print("="*60, file=sys.stderr, flush=True)
 
     # Initialize enricher
-    enricher = MetadataEnricher(json_path, excel_path, output_dir, args.name, args.max_retries, args.timeout, args.parallel)
+    enricher = MetadataEnricher(json_path, excel_path, output_dir, name, max_retries, timeout, parallel)
 
     # Load input data
     if not enricher.load_input_data():
-        sys.exit(2)
+        enricher.stats['exit_code'] = 2
+        return enricher.stats
 
     # Enrich all datasets
     enriched_datasets = enricher.enrich_all_datasets()
@@ -656,10 +874,86 @@ def main():
     # Exit code
     if enricher.stats["failed"] > 0:
         print(f"\n⚠ Partial success: {enricher.stats['failed']} dataset(s) failed to enrich", file=sys.stderr)
-        sys.exit(1)
+        enricher.stats['exit_code'] = 1
     else:
         print(f"\n✓ All datasets enriched successfully!", file=sys.stderr)
-        sys.exit(0)
+        enricher.stats['exit_code'] = 0
+
+    return enricher.stats
+
+
+def main_loop():
+    """
+    Serve mode: process enrichment jobs from stdin as a long-lived worker.
+
+    Reads one JSON request per line ({"cmd": ..., "args": {...}}) and writes
+    one JSON response per line to stdout, so the MCP server can reuse this
+    process across tool calls instead of paying startup + imports each time.
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+            cmd = request.get('cmd')
+            args = request.get('args', {})
+
+            if cmd == 'enrich':
+                stats = run_enrichment(
+                    args['name'],
+                    args.get('base_output_dir', '../../output'),
+                    max_retries=args.get('max_retries', 3),
+                    timeout=args.get('timeout', 30),
+                    parallel=args.get('parallel', 3)
+                )
+                response = {'status': 'ok', 'result': stats}
+            elif cmd == 'ping':
+                # Health check used by the MCP server before dispatching jobs
+                response = {'status': 'ok', 'result': 'pong'}
+            else:
+                response = {'status': 'error', 'message': f'Unknown command: {cmd}'}
+
+        except Exception as e:
+            response = {'status': 'error', 'message': str(e)}
+
+        print(json.dumps(response), flush=True)
+
+
+def main(argv=None):
+    """Main function to run the enricher."""
+    parser = argparse.ArgumentParser(description='Enrich 10X Genomics dataset metadata')
+    parser.add_argument('--name', type=str,
+                       help='Run identifier (e.g., "10XGenomics-VisiumHD-Human")')
+    parser.add_argument('--base-output-dir', type=str, default='../../output',
+                       help='Base output directory (default: ../../output)')
+    parser.add_argument('--max-retries', type=int, default=3,
+                       help='Max retries for failed page loads')
+    parser.add_argument('--timeout', type=int, default=30,
+                       help='Timeout for page loads in seconds')
+    parser.add_argument('--parallel', type=int, default=3,
+                       help='Number of parallel browser instances')
+    parser.add_argument('--serve', action='store_true',
+                       help='Run as a persistent worker reading jobs from stdin')
+
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        main_loop()
+        return
+
+    if not args.name:
+        parser.error('--name is required (unless running with --serve)')
+
+    stats = run_enrichment(
+        args.name,
+        args.base_output_dir,
+        max_retries=args.max_retries,
+        timeout=args.timeout,
+        parallel=args.parallel
+    )
+
+    sys.exit(stats['exit_code'])
 
 
 if __name__ == "__main__":
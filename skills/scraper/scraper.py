@@ -5,11 +5,26 @@
 Scrapes the 10X Genomics datasets page to extract information about
 Visium HD Spatial Gene Expression datasets for human samples.
 """
+import functools
+import gzip
 import pathlib
 import json
+import queue
+import re
+import sqlite3
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, parse_qs, urlencode, urljoin, urlunparse
 import pandas as pd
+import requests
+from lxml import etree
+from lxml import html as lxml_html
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json works everywhere
+    orjson = None
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -19,15 +34,311 @@ from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
 
-def setup_driver():
-    """Setup Chrome driver with appropriate options."""
+# The datasets listing is an Algolia-backed search page; the client
+# credentials ship in the page/bundle source, so they can be scraped from
+# one plain GET and used to query the search API directly
+_ALGOLIA_APP_RE = re.compile(
+    r'["\'](?:algolia[_-]?)?app(?:lication)?[_-]?id["\']\s*[:=]\s*["\']([A-Z0-9]{8,12})["\']',
+    re.IGNORECASE)
+_ALGOLIA_KEY_RE = re.compile(
+    r'["\'](?:algolia[_-]?)?(?:search[_-]?)?api[_-]?key["\']\s*[:=]\s*["\']([a-f0-9]{16,64})["\']',
+    re.IGNORECASE)
+_ALGOLIA_INDEX_RE = re.compile(
+    r'["\']index[_-]?name["\']\s*[:=]\s*["\']([\w-]+)["\']', re.IGNORECASE)
+
+_BROWSER_UA = ('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
+               'AppleWebKit/537.36 (KHTML, like Gecko) '
+               'Chrome/120.0.0.0 Safari/537.36')
+
+# XPath selectors compiled once at import; each is called as a function,
+# so row extraction never re-parses the selector string
+_TR_XPATH = etree.XPath("//table//tbody/tr")
+_TDS_XPATH = etree.XPath("./td")
+_LINK_XPATH = etree.XPath(
+    ".//a[contains(@href, '/datasets/') and not(contains(@href, '/datasets?'))]")
+_ALL_LINKS_XPATH = etree.XPath(
+    "//a[contains(@href, '/datasets/') and not(contains(@href, '/datasets?'))]")
+
+
+def _discover_algolia_config(session, url):
+    """
+    Pull the Algolia credentials out of the listing page.
+
+    Args:
+        session: requests.Session used for the page fetch
+        url: The filtered datasets page URL
+
+    Returns:
+        Tuple of (app_id, api_key, index_name, page_html), or None if the
+        page does not expose a usable configuration
+    """
+    response = session.get(url, timeout=30)
+    response.raise_for_status()
+    html = response.text
+
+    app_match = _ALGOLIA_APP_RE.search(html)
+    key_match = _ALGOLIA_KEY_RE.search(html)
+    index_match = _ALGOLIA_INDEX_RE.search(html)
+
+    if not (app_match and key_match and index_match):
+        return None
+
+    return app_match.group(1), key_match.group(1), index_match.group(1), html
+
+
+def _facet_filters_from_url(url):
+    """
+    Translate refinementList query parameters into Algolia facetFilters.
+
+    Args:
+        url: The filtered datasets page URL
+
+    Returns:
+        List of facetFilter groups (OR within a group, AND across groups)
+    """
+    facet_filters = []
+    for param, values in parse_qs(urlparse(url).query).items():
+        match = re.match(r'refinementList\[([^\]]+)\]', param)
+        if match:
+            facet_filters.append([f"{match.group(1)}:{value}" for value in values])
+    return facet_filters
+
+
+def _dataset_from_hit(hit):
+    """
+    Convert one Algolia hit into the standard dataset_info dict.
+
+    Args:
+        hit: Hit dictionary from the Algolia response
+
+    Returns:
+        dataset_info dict, or None if the hit has no usable name/url
+    """
+    def first(*keys):
+        for key in keys:
+            value = hit.get(key)
+            if value:
+                if isinstance(value, list):
+                    return ', '.join(str(v) for v in value)
+                return str(value).strip()
+        return ''
+
+    dataset_name = ' '.join(first('name', 'title', 'datasetName').split())
+    slug = first('url', 'slug', 'path')
+    if not dataset_name or not slug:
+        return None
+
+    if slug.startswith('http'):
+        dataset_url = slug
+    else:
+        dataset_url = f"https://www.10xgenomics.com/datasets/{slug.lstrip('/')}"
+
+    return {
+        'dataset_name': dataset_name,
+        'dataset_url': dataset_url,
+        'product': first('product', 'products', 'productName'),
+        'species': first('species', 'organism'),
+        'sample_type': first('sampleType', 'sample_type', 'tissue'),
+        'cells_or_nuclei': first('cellsOrNuclei', 'cells_or_nuclei'),
+        'preservation': first('preservation', 'preservationMethod',
+                              'preservation_method')
+    }
+
+
+def scrape_datasets_api(url):
+    """
+    Scrape the dataset listing by querying the Algolia search API directly.
+
+    One plain GET discovers the search credentials embedded in the page,
+    then JSON POSTs iterate the pages - no browser, no rendering, no waits.
+
+    Args:
+        url: The filtered datasets page URL
+
+    Returns:
+        Tuple of (datasets list, raw HTML of the listing page)
+
+    Raises:
+        Exception: If the Algolia configuration cannot be discovered or the
+            API returns no usable hits (callers fall back to Selenium)
+    """
+    session = requests.Session()
+    session.headers['User-Agent'] = _BROWSER_UA
+
+    config = _discover_algolia_config(session, url)
+    if config is None:
+        raise Exception("Could not discover Algolia configuration from page")
+    app_id, api_key, index_name, raw_html = config
+    print(f"Using Algolia index '{index_name}' via app {app_id}", file=sys.stderr)
+
+    endpoint = f"https://{app_id.lower()}-dsn.algolia.net/1/indexes/*/queries"
+    headers = {
+        'X-Algolia-Application-Id': app_id,
+        'X-Algolia-API-Key': api_key,
+    }
+    facet_filters = _facet_filters_from_url(url)
+
+    # Keyed by URL: dedupes and preserves first-seen order in one structure
+    datasets_by_url = {}
+    page_num = 0
+    nb_pages = 1
+
+    while page_num < nb_pages:
+        params = {'query': '', 'hitsPerPage': 100, 'page': page_num}
+        if facet_filters:
+            params['facetFilters'] = json.dumps(facet_filters)
+        body = {'requests': [{'indexName': index_name,
+                              'params': urlencode(params)}]}
+
+        response = session.post(endpoint, json=body, headers=headers, timeout=30)
+        response.raise_for_status()
+        result = response.json()['results'][0]
+        nb_pages = result.get('nbPages', page_num + 1)
+
+        new_on_page = 0
+        for hit in result.get('hits', []):
+            dataset_info = _dataset_from_hit(hit)
+            if dataset_info is None or dataset_info['dataset_url'] in datasets_by_url:
+                continue
+            datasets_by_url[dataset_info['dataset_url']] = dataset_info
+            new_on_page += 1
+
+        print(f"Page {page_num}: {new_on_page} new datasets from API "
+              f"({page_num + 1}/{nb_pages} pages)", file=sys.stderr)
+        page_num += 1
+
+    if not datasets_by_url:
+        raise Exception("Algolia API returned no datasets")
+
+    return list(datasets_by_url.values()), raw_html
+
+
+# Working browser/driver paths discovered on a previous run, so later
+# invocations skip the binary probing loop and the webdriver-manager check
+_DRIVER_CACHE_PATH = pathlib.Path.home() / '.cache' / '10x_scraper' / 'driver.json'
+
+# Persistent per-URL dataset store for incremental re-runs; the catalog
+# changes slowly, so most rows on a later run are already known
+_DATASET_CACHE_PATH = pathlib.Path.home() / '.cache' / '10x_scraper' / 'datasets.sqlite'
+
+
+def _open_dataset_cache():
+    """Open (creating if needed) the sqlite dataset cache."""
+    _DATASET_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(_DATASET_CACHE_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS datasets ("
+        "url TEXT PRIMARY KEY, json TEXT, seen_at INTEGER)")
+    conn.commit()
+    return conn
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_driver_path():
+    """Resolve the chromedriver binary at most once per process.
+
+    ChromeDriverManager().install() re-validates the driver (network check
+    plus filesystem scan) on every call; pooled setups call setup_driver
+    several times, so memoize the slow idempotent resolution.
+    """
+    return ChromeDriverManager().install()
+
+
+def _load_driver_cache():
+    """Return the cached {'binary': ..., 'driver': ...} dict, or None."""
+    try:
+        return json.loads(_DRIVER_CACHE_PATH.read_text(encoding='utf-8'))
+    except Exception:
+        return None
+
+
+def _save_driver_cache(binary, driver_path):
+    """Remember a working browser binary and chromedriver path."""
+    try:
+        _DRIVER_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _DRIVER_CACHE_PATH.write_text(
+            json.dumps({'binary': binary, 'driver': driver_path}),
+            encoding='utf-8')
+    except Exception as e:
+        print(f"Could not write driver cache: {e}", file=sys.stderr)
+
+
+class RowCountStable:
+    """Expected condition: the results table stopped growing.
+
+    Returns the row count once two consecutive polls see the same non-zero
+    number of rows, so the wait ends as soon as rendering settles instead
+    of after a fixed sleep.
+    """
+
+    def __init__(self):
+        self.prev = -1
+
+    def __call__(self, driver):
+        count = len(driver.find_elements(By.CSS_SELECTOR, "table tbody tr"))
+        stable = (count == self.prev and count > 0)
+        self.prev = count
+        return count if stable else False
+
+
+def setup_driver(reuse_session=False, debug_port=None):
+    """Setup Chrome driver with appropriate options.
+
+    Args:
+        reuse_session: Attach to an already-running Chrome listening on
+            the debug port instead of launching a fresh browser
+        debug_port: Expose the DevTools port on the launched browser so a
+            later --reuse-session run can attach to it; leave unset for
+            pooled launches so each Chrome picks its own free port
+    """
     chrome_options = Options()
+    # Return from get() at DOMContentLoaded; the explicit wait on the
+    # results table covers actual data readiness (rows arrive via XHR)
+    chrome_options.page_load_strategy = 'eager'
     chrome_options.add_argument('--headless')  # Run in background
     chrome_options.add_argument('--no-sandbox')
     chrome_options.add_argument('--disable-dev-shm-usage')
     chrome_options.add_argument('--disable-gpu')
     chrome_options.add_argument('--window-size=1920,1080')
-    chrome_options.add_argument('--remote-debugging-port=9222')
+    if debug_port:
+        chrome_options.add_argument(f'--remote-debugging-port={debug_port}')
+    # The scraper only needs HTML + JS (the Algolia results arrive via
+    # XHR); images, stylesheets and fonts are pure download overhead
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.managed_default_content_settings.stylesheets': 2,
+        'profile.managed_default_content_settings.fonts': 2,
+        'profile.default_content_setting_values.notifications': 2,
+    })
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-background-networking')
+
+    cached = _load_driver_cache()
+
+    if reuse_session:
+        # Reattach to a Chrome started earlier with the same debug port;
+        # no new browser process, no startup cost
+        attach_options = Options()
+        attach_options.add_experimental_option('debuggerAddress', '127.0.0.1:9222')
+        driver_path = (cached or {}).get('driver') or _resolve_driver_path()
+        driver = webdriver.Chrome(service=Service(driver_path),
+                                  options=attach_options)
+        print("Attached to running Chrome on 127.0.0.1:9222", file=sys.stderr)
+        return driver
+
+    if cached:
+        # Fast path: reuse the binary/driver pair that worked last time
+        try:
+            if cached.get('binary'):
+                chrome_options.binary_location = cached['binary']
+            driver = webdriver.Chrome(service=Service(cached['driver']),
+                                      options=chrome_options)
+            print("Reusing cached Chrome configuration", file=sys.stderr)
+            return driver
+        except Exception as e:
+            print(f"Cached driver configuration failed ({e}); re-probing",
+                  file=sys.stderr)
 
     # Add binary location options to try
     chrome_binary_locations = [
@@ -46,6 +357,9 @@ def setup_driver():
     driver = None
     last_error = None
 
+    # Resolve the chromedriver once, not per candidate binary
+    driver_path = _resolve_driver_path()
+
     for binary_location in chrome_binary_locations:
         try:
             if binary_location:
@@ -54,11 +368,11 @@ def setup_driver():
             else:
                 print("Trying default Chrome binary location", file=sys.stderr)
 
-            # Use webdriver-manager to automatically handle driver installation
-            service = Service(ChromeDriverManager().install())
+            service = Service(driver_path)
             driver = webdriver.Chrome(service=service, options=chrome_options)
 
             print(f"Successfully initialized Chrome driver", file=sys.stderr)
+            _save_driver_cache(binary_location, driver_path)
             return driver
 
         except Exception as e:
@@ -82,220 +396,326 @@ def setup_driver():
     raise Exception("No Chrome/Chromium browser found. Please install Chrome or Chromium.")
 
 
-def scrape_datasets(url):
+def scrape_datasets(url, reuse_session=False, incremental=False):
     """
     Scrape dataset information from the 10X Genomics datasets page.
-    Automatically handles pagination to get all datasets.
+
+    Queries the Algolia search API directly (seconds, no browser); only
+    falls back to the Selenium pagination scraper if the API path fails.
 
     Args:
         url: The filtered datasets page URL
+        reuse_session: Attach the fallback browser to an already-running
+            Chrome instead of launching one
+        incremental: Merge with the persistent dataset cache and let the
+            fallback scraper stop paginating once a page is all known URLs
 
     Returns:
-        Tuple of (datasets list, raw HTML content of last page)
+        Tuple of (datasets list, raw HTML content)
     """
-    driver = setup_driver()
-    all_datasets = []
-    raw_html = ""
-    page_num = 0
-    seen_urls_global = set()  # Track URLs across all pages to avoid duplicates
-    consecutive_empty_pages = 0  # Track consecutive pages with no new data
-    max_consecutive_empty = 3  # Stop after 3 consecutive pages with no new data
+    cache = None
+    cached_rows = {}
+    if incremental:
+        cache = _open_dataset_cache()
+        cached_rows = {row_url: json.loads(row_json) for row_url, row_json
+                       in cache.execute("SELECT url, json FROM datasets")}
+        print(f"Incremental mode: {len(cached_rows)} datasets in cache", file=sys.stderr)
+
+    try:
+        datasets, raw_html = scrape_datasets_api(url)
+    except Exception as e:
+        print(f"API scrape failed ({e}); falling back to Selenium", file=sys.stderr)
+        datasets, raw_html = scrape_datasets_selenium(
+            url, reuse_session=reuse_session,
+            known_urls=set(cached_rows) or None)
+
+    if cache is not None:
+        # Rows the short-circuited walk never revisited come back from the
+        # cache; everything scraped this run is upserted for the next one
+        scraped_urls = {d['dataset_url'] for d in datasets}
+        restored = [row for row_url, row in cached_rows.items()
+                    if row_url not in scraped_urls]
+        if restored:
+            print(f"Restored {len(restored)} datasets from cache", file=sys.stderr)
+            datasets = datasets + restored
+
+        now = int(time.time())
+        cache.executemany(
+            "INSERT OR REPLACE INTO datasets (url, json, seen_at) VALUES (?, ?, ?)",
+            [(d['dataset_url'], json.dumps(d, ensure_ascii=False), now)
+             for d in datasets])
+        cache.commit()
+        cache.close()
+
+    return datasets, raw_html
+
+
+class SeleniumPool:
+    """Fixed pool of pre-initialized headless drivers for parallel pages."""
+
+    def __init__(self, size=4, reuse_session=False):
+        self.reuse_session = reuse_session
+        self.drivers = []
+        self._queue = queue.Queue()
+        for _ in range(size):
+            # Only a single-driver pool pins the DevTools port (so a later
+            # --reuse-session run can attach); concurrent drivers would
+            # otherwise contend for the same port and fail to launch
+            driver = setup_driver(reuse_session=reuse_session,
+                                  debug_port=9222 if size == 1 else None)
+            self.drivers.append(driver)
+            self._queue.put(driver)
+
+    def acquire(self):
+        return self._queue.get()
+
+    def release(self, driver):
+        self._queue.put(driver)
+
+    def quit(self):
+        # A reused session belongs to the external Chrome - leave it running
+        if self.reuse_session:
+            return
+        for driver in self.drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+def _page_url(parsed_url, base_query, page_num):
+    """Build the URL for one page from an already-parsed base URL.
+
+    Args:
+        parsed_url: urlparse result for the listing URL
+        base_query: parse_qs result for its query string
+        page_num: Zero-based page index (page 0 = base URL as-is)
+
+    Returns:
+        Fully-paginated page URL
+    """
+    if page_num == 0:
+        return urlunparse(parsed_url)
+    query_params = dict(base_query)
+    query_params['page'] = [str(page_num)]
+    return urlunparse(
+        parsed_url._replace(query=urlencode(query_params, doseq=True)))
 
-    # Parse the URL to handle pagination
-    from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 
+def _probe_page_count(driver):
+    """Read the total page count from the pagination UI, or 0 if unknown."""
     try:
-        while True:
-            # Construct URL for current page
-            if page_num == 0:
-                # First page - use URL as-is without adding page parameter
-                current_url = url
-                print(f"\nLoading page {page_num} (first page): {current_url}", file=sys.stderr)
-            else:
-                # Subsequent pages - add page parameter
-                parsed_url = urlparse(url)
-                query_params = parse_qs(parsed_url.query)
-                query_params['page'] = [str(page_num)]
-                new_query = urlencode(query_params, doseq=True)
-                current_url = urlunparse((
-                    parsed_url.scheme,
-                    parsed_url.netloc,
-                    parsed_url.path,
-                    parsed_url.params,
-                    new_query,
-                    parsed_url.fragment
-                ))
-                print(f"\nLoading page {page_num}: {current_url}", file=sys.stderr)
-
-            driver.get(current_url)
-
-            # Wait for the page to load - adjust selector based on actual page structure
-            print("Waiting for content to load...", file=sys.stderr)
-            wait = WebDriverWait(driver, 20)
-
-            # Try multiple possible selectors for the dataset table/list
-            selectors_to_try = [
-                "//div[contains(@class, 'dataset')]",
-                "//table//tr",
-                "//div[contains(@class, 'hit')]",
-                "//div[contains(@class, 'result')]",
-                "//article",
-                "//a[contains(@href, '/datasets/')]",
-            ]
-
-            dataset_elements = None
-            for selector in selectors_to_try:
-                try:
-                    wait.until(EC.presence_of_element_located((By.XPATH, selector)))
-                    dataset_elements = driver.find_elements(By.XPATH, selector)
-                    if dataset_elements:
-                        print(f"Found {len(dataset_elements)} elements using selector: {selector}", file=sys.stderr)
-                        break
-                except:
-                    continue
-
-            if not dataset_elements:
-                print(f"No dataset elements found on page {page_num}. Stopping pagination.", file=sys.stderr)
-                break
-
-            # Give extra time for dynamic content
-            time.sleep(3)
-
-            # Capture the raw HTML after page loads (keep the last page's HTML)
-            raw_html = driver.page_source
-
-            # Try to find dataset rows/cards
-            # Look specifically for the dataset result items in the Algolia search results
-            # Exclude links from header, navigation, and featured sections
-
-            # Try to find table rows in the results
-            tbody = driver.find_elements(By.XPATH, "//table//tbody")
-
-            datasets = []  # Datasets for this page
-            if tbody:
-                print("Found table body, extracting from table rows", file=sys.stderr)
-                table_rows = tbody[0].find_elements(By.XPATH, ".//tr")
-                print(f"Found {len(table_rows)} table rows", file=sys.stderr)
-
-                for row in table_rows:
-                    try:
-                        # Get all cells in the row
-                        cells = row.find_elements(By.XPATH, ".//td")
-
-                        if len(cells) < 2:
-                            continue
-
-                        # First cell usually contains the dataset name link
-                        first_cell = cells[0]
-                        link = first_cell.find_element(By.XPATH, ".//a[contains(@href, '/datasets/') and not(contains(@href, '/datasets?'))]")
-
-                        dataset_url = link.get_attribute('href')
-                        dataset_name = link.text.strip()
-                        dataset_name = ' '.join(dataset_name.split())
-
-                        if not dataset_name or dataset_url in seen_urls_global:
-                            continue
-
-                        seen_urls_global.add(dataset_url)
-
-                        # Initialize dataset info
-                        dataset_info = {
-                            'dataset_name': dataset_name,
-                            'dataset_url': dataset_url,
-                            'product': '',
-                            'species': '',
-                            'sample_type': '',
-                            'cells_or_nuclei': '',
-                            'preservation': ''
-                        }
-
-                        # Extract metadata from cells based on position
-                        # Table structure: [Name, Empty, Product, Species, Sample Type, Cells/Nuclei, Preservation]
-                        # Indices:          0      1      2        3        4            5              6
-
-                        if len(cells) >= 7:
-                            # Extract by position
-                            dataset_info['product'] = cells[2].text.strip()
-                            dataset_info['species'] = cells[3].text.strip()
-                            dataset_info['sample_type'] = cells[4].text.strip()
-                            dataset_info['cells_or_nuclei'] = cells[5].text.strip()
-                            dataset_info['preservation'] = cells[6].text.strip()
-                        elif len(cells) >= 5:
-                            # Fallback for tables with fewer columns - try pattern matching
-                            for i, cell in enumerate(cells[1:], 1):
-                                cell_text = cell.text.strip()
-                                cell_text_lower = cell_text.lower()
-
-                                if 'spatial' in cell_text_lower or 'expression' in cell_text_lower:
-                                    dataset_info['product'] = cell_text
-                                elif cell_text_lower in ['human', 'mouse', 'rat']:
-                                    dataset_info['species'] = cell_text
-                                elif 'ffpe' in cell_text_lower or 'fresh frozen' in cell_text_lower or 'fixed frozen' in cell_text_lower:
-                                    dataset_info['preservation'] = cell_text
-                                elif cell_text_lower in ['cells', 'nuclei', 'n/a']:
-                                    dataset_info['cells_or_nuclei'] = cell_text
-                                elif cell_text and not dataset_info['sample_type']:
-                                    dataset_info['sample_type'] = cell_text
-
-                        datasets.append(dataset_info)
-                        print(f"Extracted: {dataset_name}", file=sys.stderr)
-
-                    except Exception as e:
-                        # Row doesn't have the expected structure, skip it
-                        continue
-            else:
-                print("No table found, using fallback method", file=sys.stderr)
-                # Fallback to old method if no table found
-                dataset_links = driver.find_elements(By.XPATH, "//a[contains(@href, '/datasets/') and not(contains(@href, '/datasets?'))]")
-
-                for link in dataset_links:
-                    try:
-                        dataset_url = link.get_attribute('href')
-                        if not dataset_url or dataset_url in seen_urls_global:
-                            continue
-
-                        dataset_name = link.text.strip()
-                        dataset_name = ' '.join(dataset_name.split())
-
-                        if not dataset_name:
-                            continue
-
-                        seen_urls_global.add(dataset_url)
-
-                        datasets.append({
-                            'dataset_name': dataset_name,
-                            'dataset_url': dataset_url,
-                            'product': '',
-                            'species': '',
-                            'sample_type': '',
-                            'cells_or_nuclei': '',
-                            'preservation': ''
-                        })
-                        print(f"Extracted: {dataset_name}", file=sys.stderr)
-
-                    except Exception as e:
-                        continue
-
-            # Add datasets from this page to the overall collection
-            print(f"\nPage {page_num}: Extracted {len(datasets)} new unique datasets", file=sys.stderr)
-
-            if len(datasets) == 0:
-                # No new datasets found on this page (all duplicates or empty)
-                consecutive_empty_pages += 1
-                print(f"No new datasets on page {page_num}. Consecutive empty pages: {consecutive_empty_pages}/{max_consecutive_empty}", file=sys.stderr)
-
-                if consecutive_empty_pages >= max_consecutive_empty:
-                    print(f"Reached {max_consecutive_empty} consecutive pages with no new data. Stopping pagination.", file=sys.stderr)
-                    break
-            else:
-                # Found new data, reset the counter
-                consecutive_empty_pages = 0
+        return int(driver.execute_script(r"""
+            // Algolia's pagination widget labels the last page directly
+            const last = document.querySelector(
+                '.ais-Pagination-item--lastPage a, [aria-label="Last"]');
+            if (last) {
+                const n = parseInt(last.textContent, 10);
+                if (!isNaN(n)) return n;
+            }
+            // Otherwise take the highest page= parameter among the links
+            const nums = Array.from(document.querySelectorAll("a[href*='page=']"))
+                .map(a => parseInt(new URL(a.href).searchParams.get('page')))
+                .filter(n => !isNaN(n));
+            return nums.length ? Math.max(...nums) + 1 : 0;
+        """) or 0)
+    except Exception:
+        return 0
+
+
+def _extract_page(driver, current_url):
+    """
+    Load one listing page and extract its raw dataset rows.
+
+    Args:
+        driver: WebDriver to use for this page
+        current_url: Fully-paginated page URL
+
+    Returns:
+        Tuple of (list of dataset_info dicts - undeduplicated, page HTML)
+    """
+    driver.get(current_url)
+
+    wait = WebDriverWait(driver, 20)
+
+    # One CSS wait on the results table (native DOM query, returns as soon
+    # as anything matches); retry once on plain dataset links before
+    # concluding the page is empty
+    try:
+        wait.until(EC.presence_of_all_elements_located(
+            (By.CSS_SELECTOR, "table tbody tr")))
+    except Exception:
+        try:
+            wait.until(EC.presence_of_all_elements_located(
+                (By.CSS_SELECTOR, "a[href*='/datasets/']")))
+        except Exception:
+            return [], driver.page_source
+
+    # Wait only until the table stops growing (typically <500ms)
+    # instead of an unconditional sleep
+    try:
+        WebDriverWait(driver, 10, poll_frequency=0.25).until(RowCountStable())
+    except Exception:
+        # No table settled within the window; fall through to link scraping
+        pass
+
+    # Selenium only loads the page; everything below is one in-process
+    # lxml parse of the transferred HTML, walked with pre-compiled XPath
+    # callables - no WebDriver round-trips, no selector re-parsing
+    raw_html = driver.page_source
+    tree = lxml_html.fromstring(raw_html)
+
+    # Table structure: [Name, Empty, Product, Species, Sample Type, Cells/Nuclei, Preservation]
+    # Indices:          0      1      2        3        4            5              6
+    rows = []
+    for tr in _TR_XPATH(tree):
+        cells = _TDS_XPATH(tr)
+        links = _LINK_XPATH(cells[0]) if cells else []
+        if not links:
+            continue
+        link = links[0]
+
+        def cell(i):
+            return cells[i].text_content().strip() if len(cells) > i else ''
+
+        rows.append({
+            'dataset_name': ' '.join(link.text_content().split()),
+            'dataset_url': urljoin(current_url, link.get('href') or ''),
+            'product': cell(2),
+            'species': cell(3),
+            'sample_type': cell(4),
+            'cells_or_nuclei': cell(5),
+            'preservation': cell(6)
+        })
+    if rows:
+        return rows, raw_html
+
+    # Fallback to plain link scraping if no table rendered
+    print("No table found, using fallback method", file=sys.stderr)
+    for link in _ALL_LINKS_XPATH(tree):
+        dataset_name = ' '.join(link.text_content().split())
+        href = link.get('href') or ''
+        if not dataset_name or not href:
+            continue
+        rows.append({
+            'dataset_name': dataset_name,
+            'dataset_url': urljoin(current_url, href),
+            'product': '',
+            'species': '',
+            'sample_type': '',
+            'cells_or_nuclei': '',
+            'preservation': ''
+        })
+
+    return rows, raw_html
 
-            all_datasets.extend(datasets)
-            print(f"Total unique datasets so far: {len(all_datasets)}", file=sys.stderr)
 
-            # Move to next page
-            page_num += 1
+def scrape_datasets_selenium(url, reuse_session=False, pool_size=4, known_urls=None):
+    """
+    Scrape dataset information with a pool of headless browsers.
+
+    Fallback path: probes the first page for the total page count, then
+    fetches the remaining pages concurrently across the driver pool. If
+    the count cannot be determined, pages are walked serially until
+    several in a row add nothing new.
+
+    Args:
+        url: The filtered datasets page URL
+        reuse_session: Attach to an already-running Chrome on the debug
+            port (single session, so the pool shrinks to one driver)
+        pool_size: Number of concurrent browser instances
+        known_urls: URLs already held in the incremental cache; the serial
+            walk stops once a page consists entirely of them
+
+    Returns:
+        Tuple of (datasets list, raw HTML content of a scraped page)
+    """
+    pool = SeleniumPool(size=1 if reuse_session else pool_size,
+                        reuse_session=reuse_session)
+    raw_html = ""
+    # Keyed by URL across all pages: dedupes and preserves first-seen
+    # order in one structure instead of a seen-set plus a list
+    datasets_by_url = {}
+
+    def collect(rows, page_num):
+        """Dedupe one page's rows into the accumulator; returns the new count."""
+        new_count = 0
+        for dataset_info in rows:
+            dataset_name = dataset_info.get('dataset_name', '')
+            dataset_url = dataset_info.get('dataset_url', '')
+            if not dataset_name or not dataset_url or dataset_url in datasets_by_url:
+                continue
+            datasets_by_url[dataset_url] = dataset_info
+            new_count += 1
+        print(f"Page {page_num}: {new_count} new unique datasets "
+              f"({len(datasets_by_url)} total)", file=sys.stderr)
+        return new_count
+
+    # Parse the listing URL once; per-page URLs only swap the page parameter
+    parsed_url = urlparse(url)
+    base_query = parse_qs(parsed_url.query)
+
+    try:
+        # Probe the first page serially to learn the total page count
+        print(f"\nLoading page 0 (first page): {url}", file=sys.stderr)
+        driver = pool.acquire()
+        try:
+            rows, raw_html = _extract_page(driver, url)
+            nb_pages = _probe_page_count(driver)
+        finally:
+            pool.release(driver)
+        collect(rows, 0)
+
+        if nb_pages > 1:
+            # Known page count: remaining pages are independent, fetch them
+            # concurrently across the pool
+            print(f"Pagination reports {nb_pages} pages; fetching the rest "
+                  f"with {len(pool.drivers)} drivers", file=sys.stderr)
+
+            def fetch_page(page_num):
+                page_driver = pool.acquire()
+                try:
+                    return page_num, _extract_page(
+                        page_driver, _page_url(parsed_url, base_query, page_num))
+                finally:
+                    pool.release(page_driver)
+
+            # Only the probe page's HTML is kept for the raw dump; holding
+            # every page's ~500KB source would be pure memory churn
+            with ThreadPoolExecutor(max_workers=len(pool.drivers)) as executor:
+                for page_num, (page_rows, _page_html) in executor.map(
+                        fetch_page, range(1, nb_pages)):
+                    collect(page_rows, page_num)
+        else:
+            # Unknown page count: walk pages serially until several in a
+            # row add nothing new
+            consecutive_empty_pages = 0
+            max_consecutive_empty = 3
+            page_num = 1
+            driver = pool.acquire()
+            try:
+                while consecutive_empty_pages < max_consecutive_empty:
+                    current_url = _page_url(parsed_url, base_query, page_num)
+                    print(f"\nLoading page {page_num}: {current_url}", file=sys.stderr)
+                    page_rows, _page_html = _extract_page(driver, current_url)
+                    if (known_urls and page_rows and
+                            all(r.get('dataset_url') in known_urls for r in page_rows)):
+                        # Everything here is already cached; later pages
+                        # will be too, so stop re-walking them
+                        collect(page_rows, page_num)
+                        print(f"Page {page_num} is entirely cached URLs; "
+                              f"stopping incremental walk", file=sys.stderr)
+                        break
+                    if collect(page_rows, page_num) == 0:
+                        consecutive_empty_pages += 1
+                        print(f"No new datasets on page {page_num}. Consecutive "
+                              f"empty pages: {consecutive_empty_pages}/"
+                              f"{max_consecutive_empty}", file=sys.stderr)
+                    else:
+                        consecutive_empty_pages = 0
+                    page_num += 1
+            finally:
+                pool.release(driver)
 
     except Exception as e:
         print(f"Error during scraping: {e}", file=sys.stderr)
@@ -303,13 +723,13 @@ def scrape_datasets(url):
         traceback.print_exc()
 
     finally:
-        driver.quit()
+        pool.quit()
 
     print(f"\n{'='*60}", file=sys.stderr)
-    print(f"Pagination complete. Total datasets scraped: {len(all_datasets)}", file=sys.stderr)
+    print(f"Pagination complete. Total datasets scraped: {len(datasets_by_url)}", file=sys.stderr)
     print(f"{'='*60}\n", file=sys.stderr)
 
-    return all_datasets, raw_html
+    return list(datasets_by_url.values()), raw_html
 
 
 def ensure_directories(base_output_dir, name):
@@ -349,13 +769,16 @@ def save_url_to_file(url, filepath):
 
 def save_raw_html(html_content, filepath):
     """
-    Save the raw HTML page source to a file.
+    Save the raw HTML page source gzip-compressed.
+
+    These pages carry large inline JS blobs that compress 5-10x, so the
+    dump costs a fraction of the disk I/O of plain text.
 
     Args:
         html_content: The HTML content to save
-        filepath: The file path where to save the HTML
+        filepath: The .html.gz file path where to save the HTML
     """
-    with open(filepath, 'w', encoding='utf-8') as f:
+    with gzip.open(filepath, 'wt', encoding='utf-8', compresslevel=6) as f:
         f.write(html_content)
     print(f"Raw HTML saved to: {filepath}", file=sys.stderr)
 
@@ -368,8 +791,12 @@ def save_json_output(data, filepath):
         data: The data to save (list of dictionaries)
         filepath: The file path where to save the JSON
     """
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        data_bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        data_bytes = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    with open(filepath, 'wb') as f:
+        f.write(data_bytes)
     print(f"JSON output saved to: {filepath}", file=sys.stderr)
 
 
@@ -403,61 +830,60 @@ def save_excel_output(data, filepath):
     available_columns = [col for col in column_order if col in df.columns]
     df = df[available_columns]
 
-    # Save to Excel with some formatting
-    with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
+    # Stream to Excel row-by-row; constant_memory keeps peak RAM flat
+    # instead of buffering every cell before flush
+    with pd.ExcelWriter(filepath, engine='xlsxwriter',
+                        engine_kwargs={'options': {'constant_memory': True}}) as writer:
         df.to_excel(writer, index=False, sheet_name='Datasets')
 
         # Get the worksheet to apply formatting
         worksheet = writer.sheets['Datasets']
 
-        # Auto-adjust column widths based on content
-        for idx, col in enumerate(df.columns, 1):
-            max_length = max(
-                df[col].astype(str).apply(len).max(),
-                len(col)
-            )
-            # Add some padding and cap at a reasonable width
-            adjusted_width = min(max_length + 2, 100)
-            worksheet.column_dimensions[worksheet.cell(row=1, column=idx).column_letter].width = adjusted_width
+        # Auto-adjust column widths from one vectorized pass (C-backed
+        # str.len instead of a Python len call per cell), padded and
+        # capped at a reasonable width
+        str_df = df.astype(str)
+        max_lens = str_df.apply(lambda c: c.str.len().max())
+        header_lens = pd.Series([len(c) for c in df.columns], index=df.columns)
+        col_widths = max_lens.combine(header_lens, max).clip(upper=98).add(2).astype(int)
+        for idx, width in enumerate(col_widths):
+            worksheet.set_column(idx, idx, width)
 
     print(f"Excel output saved to: {filepath}", file=sys.stderr)
 
 
-def main():
-    """Main function to run the scraper."""
-    import os
-    import argparse
-
-    # Parse command-line arguments
-    parser = argparse.ArgumentParser(description='10X Genomics Dataset Scraper')
-    parser.add_argument('--url', type=str, required=True,
-                       help='Source URL to scrape')
-    parser.add_argument('--name', type=str, required=True,
-                       help='Human-readable run identifier (e.g., "10XGenomics-VisiumHD-Human")')
-    parser.add_argument('--base-output-dir', type=str, default='../../output',
-                       help='Base output directory (default: ../../output)')
+def run_scrape(url, name, base_output_dir='../../output', reuse_session=False,
+               incremental=False):
+    """
+    Run a complete scraping job and save all outputs.
 
-    args = parser.parse_args()
+    Args:
+        url: Source URL to scrape
+        name: Human-readable run identifier
+        base_output_dir: Base output directory
+        reuse_session: Attach the fallback browser to a running Chrome
+        incremental: Reuse the persistent dataset cache across runs
 
-    url = args.url
-    name = args.name
-    base_output_dir = args.base_output_dir
+    Returns:
+        Dictionary with datasets_count and output file paths
+    """
+    import os
 
     # Ensure directories exist
     input_dir, output_dir = ensure_directories(base_output_dir, name)
 
     # Define file paths with parameterized names
     url_filepath = os.path.join(input_dir, f'URL-{name}.txt')
-    raw_html_filepath = os.path.join(input_dir, f'RawData-{name}.html')
+    raw_html_filepath = os.path.join(input_dir, f'RawData-{name}.html.gz')
     output_filepath = os.path.join(output_dir, f'Data-{name}.json')
     excel_filepath = os.path.join(output_dir, f'Data-{name}.xlsx')
 
-    print('===> ', "input_dir:", input_dir)
-    print('===> ', "output_dir:", output_dir)
-    print('===> ', "url_filepath:", url_filepath)
-    print('===> ', "raw_html_filepath:", raw_html_filepath)
-    print('===> ', "output_filepath:", output_filepath)
-    print('===> ', "excel_filepath:", excel_filepath)
+    print('===> ', "input_dir:", input_dir, file=sys.stderr)
+    print('===> ', "output_dir:", output_dir, file=sys.stderr)
+    print('===> ', "url_filepath:", url_filepath, file=sys.stderr)
+    print('===> ', "raw_html_filepath:", raw_html_filepath, file=sys.stderr)
+    print('===> ', "output_filepath:", output_filepath, file=sys.stderr)
+    print('===> ', "excel_filepath:", excel_filepath, file=sys.stderr)
 
 
     print(f"Starting 10X Genomics Dataset Scraper: {name}", file=sys.stderr)
@@ -470,25 +896,115 @@ def main():
     save_url_to_file(url, url_filepath)
 
     # Scrape datasets and get raw HTML
-    datasets, raw_html = scrape_datasets(url)
-
-    # Save raw HTML to input file
-    save_raw_html(raw_html, raw_html_filepath)
-
-    # Save JSON output to file
-    save_json_output(datasets, output_filepath)
-
-    # Save Excel output to file
-    save_excel_output(datasets, excel_filepath)
-
-    # Also output to stdout for backward compatibility
-    print(json.dumps(datasets, indent=2))
+    datasets, raw_html = scrape_datasets(url, reuse_session=reuse_session,
+                                         incremental=incremental)
+
+    # Write HTML, JSON and Excel concurrently - the Excel save dominates
+    # and the others are pure I/O, so wall-clock is max() instead of sum()
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        save_futures = [
+            executor.submit(save_raw_html, raw_html, raw_html_filepath),
+            executor.submit(save_json_output, datasets, output_filepath),
+            executor.submit(save_excel_output, datasets, excel_filepath),
+        ]
+        for future in save_futures:
+            future.result()
+
+    # Save a tiny metadata sidecar so status checks can report the dataset
+    # count without parsing the full JSON output
+    meta_filepath = os.path.join(output_dir, f'Data-{name}.meta.json')
+    with open(meta_filepath, 'w', encoding='utf-8') as f:
+        json.dump({'count': len(datasets)}, f)
 
     print("=" * 60, file=sys.stderr)
     print(f"Scraping completed. Found {len(datasets)} datasets.", file=sys.stderr)
     print(f"JSON output saved to: {output_filepath}", file=sys.stderr)
     print(f"Excel output saved to: {excel_filepath}", file=sys.stderr)
 
+    return {
+        'datasets_count': len(datasets),
+        'json_path': output_filepath,
+        'excel_path': excel_filepath
+    }
+
+
+def main_loop():
+    """
+    Serve mode: process scraping jobs from stdin as a long-lived worker.
+
+    Reads one JSON request per line ({"cmd": ..., "args": {...}}) and writes
+    one JSON response per line to stdout. This lets the MCP server keep this
+    process (and its heavy imports) alive across tool calls instead of paying
+    a fresh interpreter startup per invocation.
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+            cmd = request.get('cmd')
+            args = request.get('args', {})
+
+            if cmd == 'scrape':
+                result = run_scrape(
+                    args['url'],
+                    args['name'],
+                    args.get('base_output_dir', '../../output')
+                )
+                response = {'status': 'ok', 'result': result}
+            elif cmd == 'ping':
+                # Health check used by the MCP server before dispatching jobs
+                response = {'status': 'ok', 'result': 'pong'}
+            else:
+                response = {'status': 'error', 'message': f'Unknown command: {cmd}'}
+
+        except Exception as e:
+            response = {'status': 'error', 'message': str(e)}
+
+        print(json.dumps(response), flush=True)
+
+
+def main(argv=None):
+    """Main function to run the scraper."""
+    import argparse
+
+    # Parse command-line arguments
+    parser = argparse.ArgumentParser(description='10X Genomics Dataset Scraper')
+    parser.add_argument('--url', type=str,
+                       help='Source URL to scrape')
+    parser.add_argument('--name', type=str,
+                       help='Human-readable run identifier (e.g., "10XGenomics-VisiumHD-Human")')
+    parser.add_argument('--base-output-dir', type=str, default='../../output',
+                       help='Base output directory (default: ../../output)')
+    parser.add_argument('--serve', action='store_true',
+                       help='Run as a persistent worker reading jobs from stdin')
+    parser.add_argument('--reuse-session', action='store_true',
+                       help='Attach the fallback browser to a Chrome already '
+                            'running with --remote-debugging-port=9222')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Merge results with the persistent dataset cache '
+                            'and skip re-walking pages of already-known URLs')
+
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        main_loop()
+        return
+
+    if not args.url or not args.name:
+        parser.error('--url and --name are required (unless running with --serve)')
+
+    datasets_info = run_scrape(args.url, args.name, args.base_output_dir,
+                               reuse_session=args.reuse_session,
+                               incremental=args.incremental)
+
+    # Also output to stdout for backward compatibility; the file already
+    # holds the serialized bytes, so pass them through without re-encoding
+    with open(datasets_info['json_path'], 'rb') as f:
+        sys.stdout.buffer.write(f.read())
+        sys.stdout.buffer.write(b'\n')
+
 
 if __name__ == "__main__":
     main()
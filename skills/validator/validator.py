@@ -7,30 +7,215 @@ Validates scraped dataset information through:
 2. URL content validation (scraped data vs actual website)
 """
 
+import functools
 import json
+import re
 import sys
 import os
 import argparse
+import queue
+import sqlite3
 from datetime import datetime
 from pathlib import Path
+import jinja2
 import pandas as pd
-from deepdiff import DeepDiff
+import requests_cache
+from lxml import html as lxml_html
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+try:
+    # Selenium >= 4.23; lets us size the urllib3 connection pool that the
+    # driver client uses to talk to chromedriver
+    from selenium.webdriver.remote.client_config import ClientConfig
+except ImportError:
+    ClientConfig = None
 from webdriver_manager.chrome import ChromeDriverManager
 import time
+
+# orjson parses and serializes JSON several times faster than the stdlib;
+# fall back to stdlib json when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 
+# Present a regular browser user agent; the dataset pages are served
+# through a CDN that is picky about non-browser clients
+_BROWSER_UA = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Keyword → (field, canonical value) for page-content detection. A single
+# compiled alternation finds all of them in one pass over the page text;
+# setdefault keeps the first occurrence per field, so earlier mentions win.
+KEYWORD_MAP = {
+    "human": ("species", "Human"),
+    "mouse": ("species", "Mouse"),
+    "ffpe": ("preservation", "FFPE"),
+    "fresh frozen": ("preservation", "Fresh Frozen"),
+    "fixed frozen": ("preservation", "Fixed Frozen"),
+    "pancreas": ("sample_type", "Pancreas"),
+    "breast": ("sample_type", "Breast"),
+    "lung": ("sample_type", "Lung"),
+    "kidney": ("sample_type", "Kidney"),
+    "liver": ("sample_type", "Liver"),
+    "brain": ("sample_type", "Brain"),
+    "colon": ("sample_type", "Colon"),
+    "lymph node": ("sample_type", "Lymph Node"),
+    "prostate": ("sample_type", "Prostate"),
+    "skin": ("sample_type", "Skin"),
+}
+_KEYWORD_RE = re.compile(r"\b(" + "|".join(re.escape(k) for k in KEYWORD_MAP) + r")\b")
+
+
+# HTML report template, compiled once at import. autoescape also protects
+# the report against markup smuggled in scraped names/URLs.
+_REPORT_TEMPLATE_SRC = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Validation Report - {{ timestamp }}</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        h1 { color: #333; border-bottom: 3px solid #007bff; padding-bottom: 10px; }
+        h2 { color: #555; margin-top: 30px; }
+        .summary { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 20px 0; }
+        .stat-card { background: #f8f9fa; padding: 15px; border-radius: 5px; border-left: 4px solid #007bff; }
+        .stat-card.success { border-left-color: #28a745; }
+        .stat-card.warning { border-left-color: #ffc107; }
+        .stat-card.error { border-left-color: #dc3545; }
+        .stat-value { font-size: 2em; font-weight: bold; margin: 10px 0; }
+        .stat-label { color: #666; font-size: 0.9em; }
+        table { width: 100%; border-collapse: collapse; margin-top: 20px; }
+        th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
+        th { background-color: #007bff; color: white; }
+        tr:hover { background-color: #f5f5f5; }
+        .status-verified { color: #28a745; font-weight: bold; }
+        .status-mismatched { color: #dc3545; font-weight: bold; }
+        .status-warning { color: #ffc107; font-weight: bold; }
+        .status-failed { color: #6c757d; font-weight: bold; }
+        .diff { background: #fff3cd; padding: 5px; border-radius: 3px; margin: 2px 0; font-size: 0.9em; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>10X Genomics Data Validation Report</h1>
+        <p><strong>Generated:</strong> {{ results['validation_timestamp'] }}</p>
+        <p><strong>Total Datasets:</strong> {{ results['total_datasets'] }}</p>
+
+        <h2>File Consistency Check</h2>
+        <div class="summary">
+            <div class="stat-card {{ 'success' if results['file_consistency'].get('passed') else 'error' }}">
+                <div class="stat-label">Status</div>
+                <div class="stat-value">{{ '✓ PASSED' if results['file_consistency'].get('passed') else '✗ FAILED' }}</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">JSON Entries</div>
+                <div class="stat-value">{{ results['file_consistency'].get('json_count', 0) }}</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">Excel Entries</div>
+                <div class="stat-value">{{ results['file_consistency'].get('excel_count', 0) }}</div>
+            </div>
+            <div class="stat-card {{ 'success' if not results['file_consistency'].get('mismatches') else 'error' }}">
+                <div class="stat-label">Mismatches</div>
+                <div class="stat-value">{{ results['file_consistency'].get('mismatches', []) | length }}</div>
+            </div>
+        </div>
+
+        <h2>URL Validation Summary</h2>
+        <div class="summary">
+            <div class="stat-card success">
+                <div class="stat-label">✓ Verified</div>
+                <div class="stat-value">{{ results['url_validation'].get('verified', 0) }}</div>
+            </div>
+            <div class="stat-card error">
+                <div class="stat-label">✗ Mismatched</div>
+                <div class="stat-value">{{ results['url_validation'].get('mismatched', 0) }}</div>
+            </div>
+            <div class="stat-card warning">
+                <div class="stat-label">⚠ Warnings</div>
+                <div class="stat-value">{{ results['url_validation'].get('warnings', 0) }}</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">✗ Failed URLs</div>
+                <div class="stat-value">{{ results['url_validation'].get('failed_urls', 0) }}</div>
+            </div>
+        </div>
+
+        <h2>Detailed URL Validation Results</h2>
+        <table>
+            <thead>
+                <tr>
+                    <th>#</th>
+                    <th>Dataset Name</th>
+                    <th>Status</th>
+                    <th>Differences</th>
+                </tr>
+            </thead>
+            <tbody>
+{% for result in results['url_validation'].get('results', []) %}
+                <tr>
+                    <td>{{ loop.index }}</td>
+                    <td><a href="{{ result['dataset_url'] }}" target="_blank">{{ result['dataset_name'][:60] }}</a></td>
+                    <td class="status-{{ result['status'] }}">{{ status_icons.get(result['status'], '?') }} {{ result['status'] | upper }}</td>
+                    <td>
+                    {%- if result['differences'] %}
+                    {%- for diff in result['differences'] %}
+                    {%- if diff is mapping %}
+                        <div class="diff"><strong>{{ diff.get('field', 'unknown') }}:</strong> "{{ diff.get('scraped_value', '') }}" → "{{ diff.get('actual_value', '') }}"</div>
+                    {%- else %}
+                        <div class="diff">{{ diff }}</div>
+                    {%- endif %}
+                    {%- endfor %}
+                    {%- else %}-{% endif %}</td>
+                </tr>
+{% endfor %}
+            </tbody>
+        </table>
+
+        <h2>Exit Code</h2>
+        <p><strong>Exit Code:</strong> <span style="font-size: 1.5em; color: {{ '#28a745' if results['exit_code'] == 0 else '#dc3545' }};">{{ results['exit_code'] }}</span></p>
+        <p>
+            <strong>0</strong>: All validations passed<br>
+            <strong>1</strong>: Validation failures detected<br>
+            <strong>2</strong>: Critical error
+        </p>
+    </div>
+</body>
+</html>
+"""
+_REPORT_TEMPLATE = jinja2.Environment(autoescape=True).from_string(_REPORT_TEMPLATE_SRC)
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_chromedriver():
+    """
+    Resolve the chromedriver binary path once per process.
+
+    ChromeDriverManager().install() checks versions on disk (and sometimes
+    the network) on every call; the pool creates several drivers per run,
+    so memoize the resolved path.
+    """
+    return ChromeDriverManager().install()
+
 
 class DataValidator:
     """Main validator class for 10X Genomics dataset validation."""
 
-    def __init__(self, json_path, excel_path, output_dir, max_retries=3, timeout=30):
+    # Cached URL results older than this are revalidated
+    _RESULT_CACHE_TTL = 7 * 86400
+
+    def __init__(self, json_path, excel_path, output_dir, max_retries=3, timeout=30,
+                 use_cache=True):
         """
         Initialize the validator.
 
@@ -40,38 +225,124 @@ class DataValidator:
             output_dir: Directory for validation reports
             max_retries: Maximum retries for failed URLs
             timeout: Timeout for page loads in seconds
+            use_cache: Reuse recent per-URL validation results from the
+                persistent cache (disable with --no-cache)
         """
         self.json_path = Path(json_path)
         self.excel_path = Path(excel_path)
         self.output_dir = Path(output_dir)
         self.max_retries = max_retries
         self.timeout = timeout
-        self.timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        self.use_cache = use_cache
+        # One clock read serves both the filename timestamp and the
+        # ISO timestamp recorded in the results
+        now = datetime.now()
+        self.timestamp = now.strftime("%Y-%m-%d_%H-%M-%S")
 
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # HTTP session with an on-disk cache. The dataset pages are
+        # server-side rendered, so a plain GET carries everything the
+        # validator needs; repeat runs within a day hit the cache instead
+        # of the network, and cache_control honours server revalidation.
+        self.http = requests_cache.CachedSession(
+            str(self.output_dir / 'url_cache.sqlite'),
+            expire_after=86400,
+            cache_control=True
+        )
+        self.http.headers['User-Agent'] = _BROWSER_UA
+
+        # Persistent per-URL result cache: verified URLs skip the fetch
+        # entirely on reruns until the TTL expires
+        self._results_cache = self._open_results_cache() if use_cache else None
+
         # Results storage
         self.results = {
-            "validation_timestamp": datetime.now().isoformat(),
+            "validation_timestamp": now.isoformat(),
             "total_datasets": 0,
             "file_consistency": {},
             "url_validation": {},
             "exit_code": 0
         }
 
+    def _open_results_cache(self):
+        """Open (creating if needed) the persistent per-URL result cache."""
+        conn = sqlite3.connect(str(self.output_dir / 'url_results.sqlite'))
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS results "
+            "(url TEXT PRIMARY KEY, json TEXT, seen_at INTEGER)"
+        )
+        conn.commit()
+        return conn
+
+    def _load_partial_results(self):
+        """
+        Load URL results journaled by interrupted runs.
+
+        Each validate_urls run streams results to a JSONL sidecar as they
+        complete; the sidecars are deleted once the final reports land, so
+        anything still on disk belongs to a run that crashed mid-way.
+
+        Returns:
+            Dict mapping dataset_url to its journaled result
+        """
+        partial = {}
+        for path in sorted(self.output_dir.glob("url_partial_*.jsonl")):
+            try:
+                with open(path, 'rb') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        result = (orjson.loads(line) if orjson is not None
+                                  else json.loads(line))
+                        partial[result.get("dataset_url", "")] = result
+            except (OSError, ValueError):
+                # A torn final line just means that URL gets revalidated
+                continue
+        return partial
+
+    def _cached_result(self, url):
+        """Return a fresh cached validation result for url, or None."""
+        row = self._results_cache.execute(
+            "SELECT json, seen_at FROM results WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None or time.time() - row[1] > self._RESULT_CACHE_TTL:
+            return None
+        try:
+            return orjson.loads(row[0]) if orjson is not None else json.loads(row[0])
+        except ValueError:
+            return None
+
     def load_data(self):
         """Load JSON and Excel data."""
         print("Loading data files...", file=sys.stderr, flush=True)
 
         try:
-            # Load JSON
-            with open(self.json_path, 'r', encoding='utf-8') as f:
-                self.json_data = json.load(f)
+            # Load JSON (orjson consumes the raw bytes directly)
+            with open(self.json_path, 'rb') as f:
+                raw = f.read()
+            self.json_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            # Normalize nulls to empty strings once so the comparison and
+            # URL-validation paths never have to re-check per cell
+            self.json_data = [
+                {k: ("" if v is None else v) for k, v in entry.items()}
+                for entry in self.json_data
+            ]
             print(f"✓ Loaded JSON: {len(self.json_data)} entries", file=sys.stderr, flush=True)
 
-            # Load Excel (keep_default_na=False to preserve "N/A" as literal string)
-            self.excel_data = pd.read_excel(self.excel_path, keep_default_na=False)
+            # Load Excel (keep_default_na=False to preserve "N/A" as literal
+            # string; dtype=str so the consistency comparison stays
+            # string-only with no type coercion). Prefer the Rust-backed
+            # calamine engine, which reads xlsx far faster than openpyxl.
+            try:
+                self.excel_data = pd.read_excel(
+                    self.excel_path, engine="calamine", dtype=str,
+                    keep_default_na=False)
+            except ImportError:
+                self.excel_data = pd.read_excel(
+                    self.excel_path, dtype=str, keep_default_na=False)
             print(f"✓ Loaded Excel: {len(self.excel_data)} rows", file=sys.stderr, flush=True)
 
             self.results["total_datasets"] = len(self.json_data)
@@ -108,28 +379,33 @@ class DataValidator:
             self.results["exit_code"] = 1
             return False
 
-        # Convert Excel to list of dicts for comparison
-        excel_list = self.excel_data.to_dict('records')
+        # Compare the two files as aligned string frames: NaN/None become
+        # empty strings on both sides and one vectorized ne() replaces the
+        # per-entry deep diff
+        json_frame = pd.DataFrame(self.json_data).fillna("").astype(str)
+        excel_frame = self.excel_data.fillna("").astype(str)
+        excel_frame = excel_frame.reindex(columns=json_frame.columns, fill_value="")
+        excel_frame.index = json_frame.index
 
-        # Compare each entry
-        mismatches_found = False
-        for idx, (json_entry, excel_entry) in enumerate(zip(self.json_data, excel_list)):
-            # Convert Excel NaN to empty string for comparison
-            excel_entry = {k: (v if pd.notna(v) else '') for k, v in excel_entry.items()}
-            json_entry = {k: (v if v is not None else '') for k, v in json_entry.items()}
+        diff_mask = json_frame.ne(excel_frame)
 
-            # Compare using deepdiff
-            diff = DeepDiff(json_entry, excel_entry, ignore_order=False)
-
-            if diff:
-                mismatches_found = True
-                consistency_result["passed"] = False
+        mismatches_found = bool(diff_mask.to_numpy().any())
+        if mismatches_found:
+            consistency_result["passed"] = False
+            diff_cells = diff_mask.stack()
+            reported_rows = set()
+            for row, column in diff_cells[diff_cells].index:
                 consistency_result["mismatches"].append({
-                    "row": idx + 1,
-                    "dataset_url": json_entry.get("dataset_url", "Unknown"),
-                    "differences": str(diff)
+                    "row": row + 1,
+                    "dataset_url": json_frame.at[row, "dataset_url"]
+                                   if "dataset_url" in json_frame.columns else "Unknown",
+                    "field": column,
+                    "json_value": json_frame.at[row, column],
+                    "excel_value": excel_frame.at[row, column]
                 })
-                print(f"✗ Row {idx + 1}: Mismatch found", file=sys.stderr)
+                if row not in reported_rows:
+                    reported_rows.add(row)
+                    print(f"✗ Row {row + 1}: Mismatch found", file=sys.stderr)
 
         if not mismatches_found:
             print("✓ All entries match between JSON and Excel", file=sys.stderr)
@@ -139,8 +415,15 @@ class DataValidator:
         self.results["file_consistency"] = consistency_result
         return not mismatches_found
 
-    def setup_driver(self):
-        """Setup Chrome driver for URL validation."""
+    def setup_driver(self, pool_maxsize=None):
+        """
+        Setup Chrome driver for URL validation.
+
+        Args:
+            pool_maxsize: Optional urllib3 connection-pool size for the
+                driver's chromedriver connection; set it above the number
+                of concurrent callers to avoid pool contention
+        """
         chrome_options = Options()
         chrome_options.add_argument('--headless')
         chrome_options.add_argument('--no-sandbox')
@@ -149,8 +432,19 @@ class DataValidator:
         chrome_options.add_argument('--window-size=1920,1080')
 
         try:
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+            service = Service(_resolve_chromedriver())
+            kwargs = {"service": service, "options": chrome_options}
+            if pool_maxsize and ClientConfig is not None:
+                kwargs["client_config"] = ClientConfig(
+                    remote_server_addr=None,
+                    init_args_for_pool_manager={"maxsize": pool_maxsize}
+                )
+            try:
+                driver = webdriver.Chrome(**kwargs)
+            except TypeError:
+                # Older Selenium: local drivers don't take client_config yet
+                kwargs.pop("client_config", None)
+                driver = webdriver.Chrome(**kwargs)
             return driver
         except Exception as e:
             tqdm.write(f"✗ Failed to setup Chrome driver: {e}", file=sys.stderr)
@@ -177,26 +471,35 @@ class DataValidator:
 
         driver_created = False
         try:
-            # Use provided driver or create a new one
-            if driver is None:
-                driver = self.setup_driver()
-                driver_created = True
-
-            if not driver:
-                result["status"] = "failed"
-                result["differences"].append("Could not initialize browser")
-                return result
-
-            # Navigate to URL
-            driver.set_page_load_timeout(self.timeout)
-            driver.get(url)
-
-            # Wait for page to load
-            wait = WebDriverWait(driver, 10)
-            wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-
-            # Extract actual data from page
-            actual_data = self.extract_page_data(driver)
+            # HTTP-first: the pages are server-side rendered, so a cached
+            # GET avoids the browser round-trip entirely for most URLs
+            actual_data = None
+            page_source = self.fetch_page_html(url)
+            if page_source:
+                actual_data = self.extract_page_data(page_source)
+
+            # Fall back to the browser only when the plain fetch failed or
+            # the markup carried nothing recognisable (JS-only content)
+            if not actual_data or not any(actual_data.values()):
+                if driver is None:
+                    driver = self.setup_driver()
+                    driver_created = True
+
+                if not driver:
+                    result["status"] = "failed"
+                    result["differences"].append("Could not initialize browser")
+                    return result
+
+                # Navigate to URL
+                driver.set_page_load_timeout(self.timeout)
+                driver.get(url)
+
+                # Wait for page to load
+                wait = WebDriverWait(driver, 10)
+                wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+
+                # Extract actual data from the rendered page
+                actual_data = self.extract_page_data(driver.page_source)
 
             # Compare scraped vs actual
             differences = self.compare_data(dataset, actual_data)
@@ -225,62 +528,51 @@ class DataValidator:
 
         return result
 
-    def extract_page_data(self, driver):
+    def fetch_page_html(self, url):
         """
-        Extract dataset information from the page.
+        Fetch a dataset page over plain HTTP through the cached session.
 
         Args:
-            driver: Selenium WebDriver instance
+            url: Page URL to fetch
+
+        Returns:
+            HTML string, or None if the request failed
+        """
+        try:
+            response = self.http.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            return response.text
+        except Exception:
+            return None
+
+    def extract_page_data(self, page_source):
+        """
+        Extract dataset information from page HTML.
+
+        Args:
+            page_source: HTML string of the page
 
         Returns:
             Dictionary with extracted data
         """
-        data = {
-            "dataset_name": "",
-            "product": "",
-            "species": "",
-            "sample_type": "",
-            "preservation": "",
-            "cells_or_nuclei": ""
-        }
+        # Keyword-detected fields (species, preservation, sample_type) are
+        # left absent until found so setdefault below can fill them in
+        data = {"dataset_name": ""}
 
         try:
+            doc = lxml_html.fromstring(page_source)
+
             # Try to extract title/name
-            try:
-                title = driver.find_element(By.TAG_NAME, "h1").text.strip()
-                data["dataset_name"] = title
-            except:
-                pass
+            h1 = doc.find(".//h1")
+            if h1 is not None:
+                data["dataset_name"] = h1.text_content().strip()
 
-            # Try to find metadata table or key-value pairs
-            try:
-                # Look for common patterns in 10X Genomics pages
-                page_text = driver.find_element(By.TAG_NAME, "body").text.lower()
-
-                # Species detection
-                if "human" in page_text:
-                    data["species"] = "Human"
-                elif "mouse" in page_text:
-                    data["species"] = "Mouse"
-
-                # Preservation detection
-                if "ffpe" in page_text:
-                    data["preservation"] = "FFPE"
-                elif "fresh frozen" in page_text:
-                    data["preservation"] = "Fresh Frozen"
-                elif "fixed frozen" in page_text:
-                    data["preservation"] = "Fixed Frozen"
-
-                # Sample type detection (look for tissue types)
-                tissues = ["pancreas", "breast", "lung", "kidney", "liver", "brain",
-                          "colon", "lymph node", "prostate", "skin"]
-                for tissue in tissues:
-                    if tissue in page_text:
-                        data["sample_type"] = tissue.title()
-                        break
-
-            except:
-                pass
+            # Detect species/preservation/tissue keywords in one scan of
+            # the page text instead of a substring search per keyword
+            page_text = doc.text_content().lower()
+            for match in _KEYWORD_RE.finditer(page_text):
+                field, value = KEYWORD_MAP[match.group(1)]
+                data.setdefault(field, value)
 
         except Exception as e:
             tqdm.write(f"Warning: Could not extract all fields: {e}", file=sys.stderr)
@@ -364,51 +656,134 @@ class DataValidator:
         total = len(self.json_data)
         print(f"Validating {total} URLs...", file=sys.stderr, flush=True)
 
-        # Create progress bar immediately so it's visible during driver setup
-        with tqdm(total=total, desc="Setting up browser", unit="url", file=sys.stderr) as pbar:
-            # Create a single driver instance to reuse
-            driver = self.setup_driver()
-            if not driver:
-                pbar.write("✗ Failed to setup Chrome driver, cannot proceed with URL validation")
-                self.results["url_validation"] = url_results
-                self.results["exit_code"] = 2
-                return
+        def _tally(result):
+            """Update the summary counts; return the status symbol."""
+            if result["status"] == "verified":
+                url_results["verified"] += 1
+                return "✓"
+            if result["status"] == "mismatched":
+                url_results["mismatched"] += 1
+                self.results["exit_code"] = 1
+                return "✗"
+            if result["status"] == "warning":
+                url_results["warnings"] += 1
+                return "⚠"
+            if result["status"] == "failed":
+                url_results["failed_urls"] += 1
+                self.results["exit_code"] = 1
+                return "✗"
+            return ""
 
-            try:
-                # Update progress bar description to show we're now validating
-                pbar.set_description("Validating URLs")
-
-                for idx, dataset in enumerate(self.json_data, 1):
-                    dataset_name = dataset.get('dataset_name', 'Unknown')[:50]
-                    pbar.set_postfix_str(f"{dataset_name}...")
-
-                    result = self.validate_single_url(dataset, driver)
-                    url_results["results"].append(result)
-
-                    # Update counts and progress bar description
-                    status_symbol = ""
-                    if result["status"] == "verified":
-                        url_results["verified"] += 1
-                        status_symbol = "✓"
-                    elif result["status"] == "mismatched":
-                        url_results["mismatched"] += 1
-                        status_symbol = "✗"
-                        self.results["exit_code"] = 1
-                    elif result["status"] == "warning":
-                        url_results["warnings"] += 1
-                        status_symbol = "⚠"
-                    elif result["status"] == "failed":
-                        url_results["failed_urls"] += 1
-                        status_symbol = "✗"
-                        self.results["exit_code"] = 1
-
-                    pbar.set_description(f"Validating URLs [{status_symbol}]")
+        # Create progress bar immediately so it's visible during driver setup
+        with tqdm(total=total, desc="Checking cache", unit="url", file=sys.stderr) as pbar:
+            # Serve recently verified URLs straight from the persistent
+            # cache, then results journaled by an interrupted run; only
+            # the remainder goes to the network
+            partial_results = self._load_partial_results()
+            ordered_results = [None] * total
+            pending = []
+            for idx, dataset in enumerate(self.json_data):
+                url = dataset.get("dataset_url", "")
+                cached = None
+                if self._results_cache is not None:
+                    cached = self._cached_result(url)
+                if cached is None:
+                    cached = partial_results.get(url)
+                if cached is not None:
+                    ordered_results[idx] = cached
+                    pbar.set_description(f"Validating URLs [{_tally(cached)}]")
                     pbar.update(1)
-
-            finally:
-                # Clean up the driver
-                if driver:
-                    driver.quit()
+                else:
+                    pending.append((idx, dataset))
+
+            if pending:
+                # Pre-warm a pool of drivers so validations run concurrently;
+                # each worker thread borrows a driver for one URL at a time
+                pbar.set_description("Setting up browsers")
+                pool_size = min(max_workers, len(pending)) or 1
+                driver_pool = queue.Queue()
+                # Resolve chromedriver once up front so the parallel
+                # launches below all hit the memoized path
+                _resolve_chromedriver()
+                with ThreadPoolExecutor(max_workers=pool_size) as launcher:
+                    launches = [
+                        launcher.submit(self.setup_driver, pool_maxsize=max_workers * 2)
+                        for _ in range(pool_size)
+                    ]
+                    for launch in launches:
+                        driver = launch.result()
+                        if driver:
+                            driver_pool.put(driver)
+
+                if driver_pool.empty():
+                    pbar.write("✗ Failed to setup Chrome driver, cannot proceed with URL validation")
+                    self.results["url_validation"] = url_results
+                    self.results["exit_code"] = 2
+                    return
+
+                def _run_with_pooled_driver(dataset):
+                    driver = driver_pool.get()
+                    try:
+                        return self.validate_single_url(dataset, driver)
+                    finally:
+                        driver_pool.put(driver)
+
+                # Journal each result as it completes so a crash partway
+                # through a long run loses nothing; generate_reports
+                # removes the sidecar once the final reports are written
+                journal_path = self.output_dir / f"url_partial_{self.timestamp}.jsonl"
+                journal = open(journal_path, 'ab')
+
+                fresh_rows = []
+                try:
+                    # Update progress bar description to show we're now validating
+                    pbar.set_description("Validating URLs")
+
+                    with ThreadPoolExecutor(max_workers=driver_pool.qsize()) as executor:
+                        # Map futures to their input order so the report stays
+                        # in dataset order despite out-of-order completion
+                        futures = {
+                            executor.submit(_run_with_pooled_driver, dataset): idx
+                            for idx, dataset in pending
+                        }
+
+                        for future in as_completed(futures):
+                            result = future.result()
+                            ordered_results[futures[future]] = result
+
+                            journal.write(
+                                (orjson.dumps(result) if orjson is not None
+                                 else json.dumps(result).encode()) + b"\n")
+                            journal.flush()
+
+                            # Only verified outcomes are worth remembering;
+                            # failures should be retried on the next run
+                            if (self._results_cache is not None
+                                    and result["status"] == "verified"):
+                                fresh_rows.append((
+                                    result["dataset_url"],
+                                    json.dumps(result),
+                                    int(time.time())
+                                ))
+
+                            pbar.set_postfix_str(f"{result.get('dataset_name', 'Unknown')[:50]}...")
+                            pbar.set_description(f"Validating URLs [{_tally(result)}]")
+                            pbar.update(1)
+
+                finally:
+                    journal.close()
+                    # Clean up the drivers
+                    while not driver_pool.empty():
+                        driver_pool.get().quit()
+
+                if fresh_rows:
+                    self._results_cache.executemany(
+                        "INSERT OR REPLACE INTO results (url, json, seen_at) "
+                        "VALUES (?, ?, ?)", fresh_rows
+                    )
+                    self._results_cache.commit()
+
+            url_results["results"] = ordered_results
 
         self.results["url_validation"] = url_results
 
@@ -426,176 +801,90 @@ class DataValidator:
 
         # JSON report
         json_report_path = self.output_dir / f"validation_report_{self.timestamp}.json"
-        with open(json_report_path, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(json_report_path, 'wb') as f:
+                f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_report_path, 'w', encoding='utf-8') as f:
+                json.dump(self.results, f, indent=2, ensure_ascii=False)
         print(f"✓ JSON report: {json_report_path}", file=sys.stderr)
 
-        # HTML report
+        # The streamed URL-result journals have served their purpose once
+        # the final report exists; drop them so the next run starts clean
+        for partial in self.output_dir.glob("url_partial_*.jsonl"):
+            try:
+                partial.unlink()
+            except OSError:
+                pass
+
+        # HTML report (streamed straight to disk)
         html_report_path = self.output_dir / f"validation_report_{self.timestamp}.html"
-        html_content = self.generate_html_report()
         with open(html_report_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            self._write_html_report(f)
         print(f"✓ HTML report: {html_report_path}", file=sys.stderr)
 
-    def generate_html_report(self):
-        """Generate HTML validation report."""
-        # Simple HTML template
-        html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Validation Report - {self.timestamp}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        h1 {{ color: #333; border-bottom: 3px solid #007bff; padding-bottom: 10px; }}
-        h2 {{ color: #555; margin-top: 30px; }}
-        .summary {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 20px 0; }}
-        .stat-card {{ background: #f8f9fa; padding: 15px; border-radius: 5px; border-left: 4px solid #007bff; }}
-        .stat-card.success {{ border-left-color: #28a745; }}
-        .stat-card.warning {{ border-left-color: #ffc107; }}
-        .stat-card.error {{ border-left-color: #dc3545; }}
-        .stat-value {{ font-size: 2em; font-weight: bold; margin: 10px 0; }}
-        .stat-label {{ color: #666; font-size: 0.9em; }}
-        table {{ width: 100%; border-collapse: collapse; margin-top: 20px; }}
-        th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
-        th {{ background-color: #007bff; color: white; }}
-        tr:hover {{ background-color: #f5f5f5; }}
-        .status-verified {{ color: #28a745; font-weight: bold; }}
-        .status-mismatched {{ color: #dc3545; font-weight: bold; }}
-        .status-warning {{ color: #ffc107; font-weight: bold; }}
-        .status-failed {{ color: #6c757d; font-weight: bold; }}
-        .diff {{ background: #fff3cd; padding: 5px; border-radius: 3px; margin: 2px 0; font-size: 0.9em; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>10X Genomics Data Validation Report</h1>
-        <p><strong>Generated:</strong> {self.results['validation_timestamp']}</p>
-        <p><strong>Total Datasets:</strong> {self.results['total_datasets']}</p>
-
-        <h2>File Consistency Check</h2>
-        <div class="summary">
-            <div class="stat-card {'success' if self.results['file_consistency'].get('passed') else 'error'}">
-                <div class="stat-label">Status</div>
-                <div class="stat-value">{'✓ PASSED' if self.results['file_consistency'].get('passed') else '✗ FAILED'}</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-label">JSON Entries</div>
-                <div class="stat-value">{self.results['file_consistency'].get('json_count', 0)}</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-label">Excel Entries</div>
-                <div class="stat-value">{self.results['file_consistency'].get('excel_count', 0)}</div>
-            </div>
-            <div class="stat-card {'success' if len(self.results['file_consistency'].get('mismatches', [])) == 0 else 'error'}">
-                <div class="stat-label">Mismatches</div>
-                <div class="stat-value">{len(self.results['file_consistency'].get('mismatches', []))}</div>
-            </div>
-        </div>
-
-        <h2>URL Validation Summary</h2>
-        <div class="summary">
-            <div class="stat-card success">
-                <div class="stat-label">✓ Verified</div>
-                <div class="stat-value">{self.results['url_validation'].get('verified', 0)}</div>
-            </div>
-            <div class="stat-card error">
-                <div class="stat-label">✗ Mismatched</div>
-                <div class="stat-value">{self.results['url_validation'].get('mismatched', 0)}</div>
-            </div>
-            <div class="stat-card warning">
-                <div class="stat-label">⚠ Warnings</div>
-                <div class="stat-value">{self.results['url_validation'].get('warnings', 0)}</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-label">✗ Failed URLs</div>
-                <div class="stat-value">{self.results['url_validation'].get('failed_urls', 0)}</div>
-            </div>
-        </div>
-
-        <h2>Detailed URL Validation Results</h2>
-        <table>
-            <thead>
-                <tr>
-                    <th>#</th>
-                    <th>Dataset Name</th>
-                    <th>Status</th>
-                    <th>Differences</th>
-                </tr>
-            </thead>
-            <tbody>
-"""
-
-        # Add URL validation results
-        for idx, result in enumerate(self.results['url_validation'].get('results', []), 1):
-            status_class = f"status-{result['status']}"
-            status_icon = {"verified": "✓", "mismatched": "✗", "warning": "⚠", "failed": "✗"}.get(result['status'], "?")
-            status_text = f"{status_icon} {result['status'].upper()}"
-
-            diffs_html = ""
-            if result['differences']:
-                for diff in result['differences']:
-                    if isinstance(diff, dict):
-                        field = diff.get('field', 'unknown')
-                        scraped = diff.get('scraped_value', '')
-                        actual = diff.get('actual_value', '')
-                        diffs_html += f'<div class="diff"><strong>{field}:</strong> "{scraped}" → "{actual}"</div>'
-                    else:
-                        diffs_html += f'<div class="diff">{diff}</div>'
-
-            html += f"""
-                <tr>
-                    <td>{idx}</td>
-                    <td><a href="{result['dataset_url']}" target="_blank">{result['dataset_name'][:60]}</a></td>
-                    <td class="{status_class}">{status_text}</td>
-                    <td>{diffs_html if diffs_html else '-'}</td>
-                </tr>
-"""
-
-        html += """
-            </tbody>
-        </table>
-
-        <h2>Exit Code</h2>
-        <p><strong>Exit Code:</strong> <span style="font-size: 1.5em; color: """ + ("#28a745" if self.results['exit_code'] == 0 else "#dc3545") + f""";">{self.results['exit_code']}</span></p>
-        <p>
-            <strong>0</strong>: All validations passed<br>
-            <strong>1</strong>: Validation failures detected<br>
-            <strong>2</strong>: Critical error
-        </p>
-    </div>
-</body>
-</html>
-"""
-        return html
-
-
-def main():
-    """Main function to run the validator."""
-    parser = argparse.ArgumentParser(description='Validate 10X Genomics scraped data')
-    parser.add_argument('--name', type=str, required=True,
-                       help='Run identifier (e.g., "10XGenomics-VisiumHD-Human")')
-    parser.add_argument('--base-output-dir', type=str, default='../../output',
-                       help='Base output directory (default: ../../output)')
-    parser.add_argument('--skip-file-check', action='store_true',
-                       help='Skip file consistency validation')
-    parser.add_argument('--skip-url-check', action='store_true',
-                       help='Skip URL content validation')
-    parser.add_argument('--max-retries', type=int, default=3,
-                       help='Max retries for failed URLs')
-    parser.add_argument('--timeout', type=int, default=30,
-                       help='Timeout for page loads in seconds')
-
-    args = parser.parse_args()
+        # Maintain a tiny index so downstream tools can find the latest
+        # report without scanning the directory. Written via temp file +
+        # rename so readers never observe a partial index.
+        report_count = sum(
+            1 for entry in os.scandir(self.output_dir)
+            if entry.name.startswith("validation_report_") and entry.name.endswith(".json")
+        )
+        index = {
+            "latest_json": json_report_path.name,
+            "latest_html": html_report_path.name,
+            "count": report_count,
+            "mtime": time.time()
+        }
+        index_path = self.output_dir / "index.json"
+        tmp_path = self.output_dir / "index.json.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, index_path)
+        # The rename bumps the directory mtime past the index's own write
+        # time; touch the index so freshness checks compare correctly
+        os.utime(index_path)
+
+    def _write_html_report(self, f):
+        """
+        Stream the HTML validation report to an open file.
 
+        Args:
+            f: Writable text file object
+        """
+        _REPORT_TEMPLATE.stream(
+            results=self.results,
+            timestamp=self.timestamp,
+            status_icons={"verified": "✓", "mismatched": "✗",
+                          "warning": "⚠", "failed": "✗"}
+        ).dump(f)
+
+
+def run_validation(name, base_output_dir='../../output', skip_file_check=False,
+                   skip_url_check=False, max_retries=3, timeout=30,
+                   use_cache=True):
+    """
+    Run a complete validation job for a named scraping run.
+
+    Args:
+        name: Run identifier (e.g., "10XGenomics-VisiumHD-Human")
+        base_output_dir: Base output directory
+        skip_file_check: Skip file consistency validation
+        skip_url_check: Skip URL content validation
+        max_retries: Max retries for failed URLs
+        timeout: Timeout for page loads in seconds
+        use_cache: Reuse recent per-URL validation results
+
+    Returns:
+        Dictionary with validation results (including exit_code)
+    """
     # Build paths based on name and base output directory
     script_dir = Path(__file__).parent
-    base_dir = script_dir.parent.parent / args.base_output_dir
-    run_dir = base_dir / args.name
-    
-    json_path = run_dir / 'output' / f'Data-{args.name}.json'
-    excel_path = run_dir / 'output' / f'Data-{args.name}.xlsx'
+    base_dir = script_dir.parent.parent / base_output_dir
+    run_dir = base_dir / name
+
+    json_path = run_dir / 'output' / f'Data-{name}.json'
+    excel_path = run_dir / 'output' / f'Data-{name}.xlsx'
     output_dir = run_dir / 'reports'
 
     print("="*60, file=sys.stderr, flush=True)
@@ -603,17 +892,18 @@ def main():
     print("="*60, file=sys.stderr, flush=True)
 
     # Initialize validator
-    validator = DataValidator(json_path, excel_path, output_dir, args.max_retries, args.timeout)
+    validator = DataValidator(json_path, excel_path, output_dir, max_retries, timeout,
+                              use_cache=use_cache)
 
     # Load data
     if not validator.load_data():
-        sys.exit(2)
+        return validator.results
 
     # Run validations
-    if not args.skip_file_check:
+    if not skip_file_check:
         validator.validate_file_consistency()
 
-    if not args.skip_url_check:
+    if not skip_url_check:
         validator.validate_urls()
 
     # Generate reports
@@ -632,7 +922,89 @@ def main():
     else:
         print("✗ Critical error occurred.", file=sys.stderr)
 
-    sys.exit(validator.results['exit_code'])
+    return validator.results
+
+
+def main_loop():
+    """
+    Serve mode: process validation jobs from stdin as a long-lived worker.
+
+    Reads one JSON request per line ({"cmd": ..., "args": {...}}) and writes
+    one JSON response per line to stdout, so the MCP server can reuse this
+    process across tool calls instead of paying startup + imports each time.
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+            cmd = request.get('cmd')
+            args = request.get('args', {})
+
+            if cmd == 'validate':
+                results = run_validation(
+                    args['name'],
+                    args.get('base_output_dir', '../../output'),
+                    skip_file_check=args.get('skip_file_check', False),
+                    skip_url_check=args.get('skip_url_check', False),
+                    max_retries=args.get('max_retries', 3),
+                    timeout=args.get('timeout', 30),
+                    use_cache=not args.get('no_cache', False)
+                )
+                response = {'status': 'ok', 'result': results}
+            elif cmd == 'ping':
+                # Health check used by the MCP server before dispatching jobs
+                response = {'status': 'ok', 'result': 'pong'}
+            else:
+                response = {'status': 'error', 'message': f'Unknown command: {cmd}'}
+
+        except Exception as e:
+            response = {'status': 'error', 'message': str(e)}
+
+        print(json.dumps(response), flush=True)
+
+
+def main(argv=None):
+    """Main function to run the validator."""
+    parser = argparse.ArgumentParser(description='Validate 10X Genomics scraped data')
+    parser.add_argument('--name', type=str,
+                       help='Run identifier (e.g., "10XGenomics-VisiumHD-Human")')
+    parser.add_argument('--base-output-dir', type=str, default='../../output',
+                       help='Base output directory (default: ../../output)')
+    parser.add_argument('--skip-file-check', action='store_true',
+                       help='Skip file consistency validation')
+    parser.add_argument('--skip-url-check', action='store_true',
+                       help='Skip URL content validation')
+    parser.add_argument('--max-retries', type=int, default=3,
+                       help='Max retries for failed URLs')
+    parser.add_argument('--timeout', type=int, default=30,
+                       help='Timeout for page loads in seconds')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Revalidate every URL, ignoring cached results')
+    parser.add_argument('--serve', action='store_true',
+                       help='Run as a persistent worker reading jobs from stdin')
+
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        main_loop()
+        return
+
+    if not args.name:
+        parser.error('--name is required (unless running with --serve)')
+
+    results = run_validation(
+        args.name,
+        args.base_output_dir,
+        skip_file_check=args.skip_file_check,
+        skip_url_check=args.skip_url_check,
+        max_retries=args.max_retries,
+        timeout=args.timeout,
+        use_cache=not args.no_cache
+    )
+
+    sys.exit(results['exit_code'])
 
 
 if __name__ == "__main__":